@@ -0,0 +1,106 @@
+"""Benchmark for AsyncStore under many concurrent coroutines.
+
+Measures coalesced add_sesh bursts against one awaited insert at a time,
+concurrent report/status reads with one and several reader threads, and the
+worst event loop stall seen by a ticker coroutine while start/stop cycles run
+through AsyncStore and, for comparison, through the blocking Store.
+
+    python benchmarks/bench_aio.py [-n COROUTINES] [-c CYCLES]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import synthetic_seshes
+
+from sesh.aio import AsyncStore
+from sesh.config import Config
+from sesh.store import Store
+
+CONFIG = Config(fsync=False)
+
+
+async def max_stall(work) -> float:
+    """Run ``work`` while measuring the longest delay of a 1 ms ticker."""
+    worst = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal worst
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            worst = max(worst, time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await work()
+    done = True
+    await task
+    return worst * 1000
+
+
+async def bench(root: Path, coroutines: int, cycles: int) -> None:
+    seshes = list(synthetic_seshes(coroutines))
+
+    async with AsyncStore(root / "sequential", CONFIG) as store:
+        start = time.perf_counter()
+        for sesh in seshes:
+            await store.add_sesh(sesh)
+        rate = coroutines / (time.perf_counter() - start)
+        print(f"add_sesh one at a time  {rate:>10,.0f} rows/s  {store.batches} txns")
+
+    async with AsyncStore(root / "burst", CONFIG) as store:
+        start = time.perf_counter()
+        await asyncio.gather(*(store.add_sesh(sesh) for sesh in seshes))
+        rate = coroutines / (time.perf_counter() - start)
+        print(f"add_sesh burst          {rate:>10,.0f} rows/s  {store.batches} txns")
+
+    for readers in (1, 4):
+        async with AsyncStore(root / "burst", CONFIG, readers=readers) as store:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    store.report("month") if i % 2 else store.status()
+                    for i in range(coroutines)
+                )
+            )
+            rate = coroutines / (time.perf_counter() - start)
+            print(f"reads, {readers} reader thread(s) {rate:>8,.0f} queries/s")
+
+    async with AsyncStore(root / "cycles", CONFIG) as store:
+
+        async def async_cycles() -> None:
+            for i in range(cycles):
+                await store.start_sesh(f"task {i}", [])
+                await store.end_sesh("", [])
+
+        print(f"loop stall, AsyncStore  {await max_stall(async_cycles):10.2f} ms")
+
+    blocking = Store(root / "blocking", CONFIG)
+
+    async def blocking_cycles() -> None:
+        for i in range(cycles):
+            blocking.start_sesh(f"task {i}", [])
+            blocking.end_sesh("", [])
+            await asyncio.sleep(0)
+
+    print(f"loop stall, Store       {await max_stall(blocking_cycles):10.2f} ms")
+    blocking.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--coroutines", type=int, default=2_000)
+    parser.add_argument("-c", "--cycles", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(bench(Path(tmp), args.coroutines, args.cycles))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Stress test for concurrent start/stop from many processes.
+
+Each worker process opens its own Store on a shared directory and races the
+others to start and stop Seshes, like editor plugins, shell hooks and cron
+jobs running at once. Reports operations per second, how often a start or
+stop lost the race (expected), errors (should be zero), lock contention, and
+whether every started Sesh was saved exactly once.
+
+    python benchmarks/bench_concurrency.py [-p PROCESSES] [-n ATTEMPTS]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sesh.config import CURRENT_STORAGES, Config
+from sesh.error import NoActiveSeshError, SeshInProgressError
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+
+def worker(root: Path, storage: str, attempts: int) -> Counter:
+    store = Store(root, Config(fsync=False, current_storage=storage))
+    counts = Counter()
+    for i in range(attempts):
+        try:
+            store.start_sesh(f"{os.getpid()} task {i}", [Tag("stress")])
+            counts["started"] += 1
+        except SeshInProgressError:
+            counts["start conflicts"] += 1
+        except Exception as e:
+            counts[f"error: {type(e).__name__}"] += 1
+        try:
+            store.end_sesh("", [])
+            counts["stopped"] += 1
+        except NoActiveSeshError:
+            counts["stop conflicts"] += 1
+        except Exception as e:
+            counts[f"error: {type(e).__name__}"] += 1
+    counts["lock contended"] = store.lock.contended
+    store.close()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-p", "--processes", type=int, default=8)
+    parser.add_argument("-n", "--attempts", type=int, default=200)
+    args = parser.parse_args()
+
+    for storage in CURRENT_STORAGES:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / ".sesh"
+            Store(root).close()
+
+            start = time.perf_counter()
+            with ProcessPoolExecutor(args.processes) as pool:
+                results = pool.map(
+                    worker,
+                    [root] * args.processes,
+                    [storage] * args.processes,
+                    [args.attempts] * args.processes,
+                )
+                counts = sum(results, Counter())
+            elapsed = time.perf_counter() - start
+
+            store = Store(root)
+            (saved, titles) = store.db_conn.execute(
+                "SELECT count(*), count(DISTINCT title) FROM sesh"
+            ).fetchone()
+            store.close()
+
+        operations = 2 * args.processes * args.attempts
+        errors = sum(v for k, v in counts.items() if k.startswith("error"))
+        consistent = saved == titles == counts["started"] == counts["stopped"]
+        print(
+            f"{storage:<8} {args.processes} processes  "
+            f"{operations / elapsed:>8,.0f} ops/s  {errors} errors  "
+            f"saved {saved:,} ({'consistent' if consistent else 'INCONSISTENT'})"
+        )
+        for key, value in sorted(counts.items()):
+            print(f"    {key:<16} {value:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark for reading and writing the current Sesh file.
+
+Compares the JSON and binary encodings on the paths that matter: the prompt
+status line (run on every shell prompt), CurrentManager.read (every command
+that checks the active Sesh), and atomic writes with and without fsync.
+
+    python benchmarks/bench_current.py [-n READS] [-w WRITES]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from whenever import Instant
+
+from sesh.config import Config
+from sesh.current import CurrentManager, CurrentSesh
+from sesh.parser.tag import Tag
+from sesh.prompt import prompt_line
+
+SESH = CurrentSesh(
+    "refactor the session storage layer",
+    [Tag("backend"), Tag("storage"), Tag("refactor")],
+    Instant.now(),
+)
+
+
+def per_call(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--reads", type=int, default=20_000)
+    parser.add_argument("-w", "--writes", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "current.json"
+        for fmt in ("json", "binary"):
+            manager = CurrentManager(path, Config(current_format=fmt, fsync=False))
+            manager.write(SESH)
+            size = path.stat().st_size
+            prompt = per_call(lambda: prompt_line(path), args.reads)
+            read = per_call(manager.read, args.reads)
+            print(
+                f"{fmt:<6} {size:>4} bytes  prompt_line {prompt:6.1f} us  "
+                f"read {read:6.1f} us"
+            )
+
+        for fsync in (False, True):
+            manager = CurrentManager(path, Config(fsync=fsync))
+            write = per_call(lambda m=manager: m.write(SESH), args.writes)
+            print(f"write fsync={str(fsync):<5} {write:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
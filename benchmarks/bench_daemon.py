@@ -0,0 +1,96 @@
+"""Benchmark for commands served by `sesh daemon`.
+
+Starts a daemon on a temporary store, then times the client round trip of
+status, a start/stop pair and a report from this process, and whole
+`python -m sesh status` processes with and without the daemon running.
+
+    python benchmarks/bench_daemon.py [-n ROUNDS] [-p PROCESSES]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sesh.client import run_via_daemon
+from sesh.paths import DAEMON_SOCKET, SESH_DIR
+
+
+def per_call_ms(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1000
+
+
+def process_ms(cwd: Path, args: list[str], count: int) -> float:
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "sesh", *args],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rounds", type=int, default=500)
+    parser.add_argument("-p", "--processes", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)
+        socket_path = os.fspath(cwd / SESH_DIR / DAEMON_SOCKET)
+        subprocess.run(
+            [sys.executable, "-m", "sesh", "start", "warm", "up"],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        local = process_ms(cwd, ["status"], args.processes)
+
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "sesh", "daemon"],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+
+            def call(*command: str) -> None:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    assert run_via_daemon(socket_path, list(command)) == 0
+
+            def start_stop() -> None:
+                call("stop")
+                call("start", "task")
+
+            for label, func in (
+                ("status", lambda: call("status")),
+                ("stop + start", start_stop),
+                ("report", lambda: call("report")),
+            ):
+                print(f"daemon {label:<14} {per_call_ms(func, args.rounds):8.2f} ms")
+
+            served = process_ms(cwd, ["status"], args.processes)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+        print(f"process status  local {local:8.1f} ms  via daemon {served:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark for `sesh export`.
+
+Populates a synthetic store, then streams it through each export writer to
+/dev/null and reports throughput. With --memory, the Python heap peak is
+traced as well (slower) to show memory use stays flat as the store grows.
+
+    python benchmarks/bench_export.py [-n ROWS] [--store DIR] [--memory]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from synthetic import open_store
+
+from sesh.exporter import WRITERS
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+
+def time_export(
+    store: Store, fmt: str, memory: bool, **filters
+) -> tuple[int, float, int | None]:
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        count = WRITERS[fmt](store.iter_seshes(**filters), f)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--store", type=Path, help="Reuse a store directory")
+    parser.add_argument("--memory", action="store_true", help="Trace heap peak")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = open_store(args.store or Path(tmp) / ".sesh", args.rows)
+
+        for label, fmt, filters in (
+            ("csv", "csv", {}),
+            ("jsonl", "jsonl", {}),
+            ("csv -t tag-1", "csv", {"tags": [Tag("tag-1")]}),
+        ):
+            count, elapsed, peak = time_export(store, fmt, args.memory, **filters)
+            print(
+                f"export {label:<14} {count:>10,} rows  {elapsed:7.2f} s  "
+                f"{count / elapsed:>10,.0f} rows/s"
+                + (f"  peak heap {peak / 1024:8.0f} KiB" if peak is not None else "")
+            )
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
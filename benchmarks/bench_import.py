@@ -0,0 +1,89 @@
+"""Benchmark for `sesh import`.
+
+Writes a synthetic CSV history, then streams it through SeshReader into
+Store.import_seshes and reports rows/sec. For comparison, a small number of
+Seshes is also saved one at a time through start_sesh/end_sesh.
+
+    python benchmarks/bench_import.py [-n ROWS] [--batch-size N]
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import synthetic_seshes
+
+from sesh.importer import SeshReader
+from sesh.parser.tag import Tag
+from sesh.store import IMPORT_BATCH_SIZE, Store
+
+
+def write_csv(path: Path, rows: int) -> None:
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["title", "details", "start_time", "end_time", "tags"])
+        for sesh in synthetic_seshes(rows):
+            writer.writerow(
+                [
+                    sesh.title,
+                    sesh.details,
+                    sesh.start_time,
+                    sesh.end_time,
+                    ",".join(sesh.tags),
+                ]
+            )
+
+
+def time_import(root: Path, path: Path, batch_size: int) -> tuple[int, float]:
+    store = Store(root)
+    store.connect()
+    start = time.perf_counter()
+    with path.open(encoding="utf-8") as f:
+        total = store.import_seshes(SeshReader("csv").read(f), batch_size)
+    elapsed = time.perf_counter() - start
+    store.close()
+    return total, elapsed
+
+
+def time_start_stop(root: Path, rows: int) -> float:
+    store = Store(root)
+    store.connect()
+    start = time.perf_counter()
+    for sesh in synthetic_seshes(rows):
+        store.start_sesh(sesh.title, [Tag(name) for name in sesh.tags])
+        store.end_sesh(sesh.details, [])
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    parser.add_argument("--baseline-rows", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "history.csv"
+        write_csv(path, args.rows)
+
+        total, elapsed = time_import(Path(tmp) / "bulk", path, args.batch_size)
+        print(
+            f"sesh import      {total:>10,} rows  {elapsed:8.2f} s  "
+            f"{total / elapsed:>10,.0f} rows/s"
+        )
+
+        elapsed = time_start_stop(Path(tmp) / "cycles", args.baseline_rows)
+        rate = args.baseline_rows / elapsed
+        print(
+            f"start/stop       {args.baseline_rows:>10,} rows  {elapsed:8.2f} s  "
+            f"{rate:>10,.0f} rows/s  (~{args.rows / rate / 3600:.1f} h for "
+            f"{args.rows:,})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark for parse_tags_bulk on a million tag tokens.
+
+Tokens are drawn from the synthetic tag vocabulary with random case and
+padding, about 1% of them invalid, and grouped into comma-separated lists as
+a script feeding tag lists from another tool would. The lists are parsed one
+tag at a time as TagOption used to (strip, lower, validate, construct a
+Tag), and in one parse_tags_bulk call.
+
+    python benchmarks/bench_parse_tags.py [-n TOKENS] [--per-list N]
+"""
+
+import argparse
+import random
+import time
+
+from synthetic import TAG_VOCABULARY
+
+from sesh.parser.tag import Tag, parse_tags_bulk
+
+
+def make_token(rng: random.Random) -> str:
+    name = rng.choice(TAG_VOCABULARY)
+    if rng.random() < 0.01:
+        name += "_"
+    if rng.random() < 0.5:
+        name = name.upper()
+    return " " * rng.randint(0, 1) + name
+
+
+def parse_one_by_one(items: list[str]) -> tuple[int, int]:
+    tags = set()
+    errors = 0
+    for item in items:
+        for name in item.lower().split(","):
+            name = name.strip()
+            if not name:
+                continue
+            if Tag.validate_tag_name(name):
+                tags.add(Tag(name))
+            else:
+                errors += 1
+    return len(tags), errors
+
+
+def parse_bulk(items: list[str]) -> tuple[int, int]:
+    (tags, errors) = parse_tags_bulk(items)
+    return len(tags), len(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--tokens", type=int, default=1_000_000)
+    parser.add_argument("--per-list", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    tokens = [make_token(rng) for _ in range(args.tokens)]
+    items = [
+        ",".join(tokens[i : i + args.per_list])
+        for i in range(0, len(tokens), args.per_list)
+    ]
+
+    for label, parse in (("one by one", parse_one_by_one), ("bulk", parse_bulk)):
+        start = time.perf_counter()
+        (unique, errors) = parse(items)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<10} {len(tokens):>10,} tokens  {elapsed * 1000:8.1f} ms  "
+            f"{len(tokens) / elapsed:>12,.0f} tokens/s  "
+            f"{unique} unique, {errors:,} invalid"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark matrix for the database connection profiles.
+
+For every profile in DB_PROFILES, times a bulk import and start/stop cycles
+on a fresh store (insert workloads), then a full-history report, a two-tag
+report that has to scan sesh_day, and a CSV export on a copy of one large
+store (aggregate workloads). Every read opens a new connection.
+
+    python benchmarks/bench_profile.py [-n ROWS] [-c CYCLES] [--store DIR]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import open_store, synthetic_seshes
+
+from sesh.config import DB_PROFILES, Config
+from sesh.exporter import write_csv
+from sesh.parser.tag import Tag
+from sesh.paths import DATA_SQLITE
+from sesh.store import Store
+
+
+def export_csv(store: Store) -> None:
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        write_csv(store.iter_seshes(), f)
+
+
+READS = {
+    "report --by month": lambda store: store.report("month"),
+    "report two tags": lambda store: store.report(
+        "day", tags=[Tag("tag-1"), Tag("tag-2")]
+    ),
+    "export csv": export_csv,
+}
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=200_000)
+    parser.add_argument("-c", "--cycles", type=int, default=500)
+    parser.add_argument("--store", type=Path, help="Reuse a store directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = open_store(args.store or Path(tmp) / "source", args.rows)
+        source.close()
+
+        for profile in DB_PROFILES:
+            config = Config(fsync=False, db_profile=profile)
+            results = []
+
+            store = Store(Path(tmp) / profile / "insert", config)
+            store.connect()
+            elapsed = timed(lambda s=store: s.import_seshes(synthetic_seshes(20_000)))
+            results.append(("import 20k", f"{20_000 / elapsed:>10,.0f} rows/s"))
+
+            def cycles(s: Store = store) -> None:
+                for i in range(args.cycles):
+                    s.start_sesh(f"task {i}", [Tag("backend")])
+                    s.end_sesh("", [])
+
+            elapsed = timed(cycles)
+            results.append(("start/stop", f"{args.cycles / elapsed:>10,.0f} cycles/s"))
+            store.close()
+
+            root = Path(tmp) / profile / "read"
+            root.mkdir(parents=True)
+            shutil.copy(source.db_path, root / DATA_SQLITE)
+            for label, read in READS.items():
+                store = Store(root, config)
+                store.connect()
+                elapsed = timed(lambda s=store, r=read: r(s))
+                results.append((label, f"{elapsed * 1000:10.1f} ms"))
+                store.close()
+
+            for label, value in results:
+                print(f"{profile:<8} {label:<18} {value}")
+
+
+if __name__ == "__main__":
+    main()
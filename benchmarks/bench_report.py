@@ -0,0 +1,58 @@
+"""Benchmark for `sesh report` on a large synthetic store.
+
+Times every grouping over the whole history and over a one year range, plus
+a two-tag report that has to bypass the daily rollups, and flags results
+slower than the one second target.
+
+    python benchmarks/bench_report.py [-n ROWS] [--store DIR]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import open_store
+from whenever import Instant
+
+from sesh.command.report import REPORT_GROUPS
+from sesh.parser.tag import Tag
+
+TARGET_SECONDS = 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--store", type=Path, help="Reuse a store directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = open_store(args.store or Path(tmp) / ".sesh", args.rows)
+
+        ranges = {
+            "all time": (None, None),
+            "one year": (Instant.from_utc(2021, 1, 1), Instant.from_utc(2022, 1, 1)),
+        }
+        cases = [
+            (group_by, label, since, until, [])
+            for group_by in REPORT_GROUPS
+            for label, (since, until) in ranges.items()
+        ]
+        # two tags cannot be answered from the rollups
+        cases.append(("day", "two tags", None, None, [Tag("tag-1"), Tag("tag-2")]))
+        for group_by, label, since, until, tags in cases:
+            start = time.perf_counter()
+            rows = store.report(group_by, since, until, tags)
+            elapsed = time.perf_counter() - start
+            flag = "" if elapsed < TARGET_SECONDS else "  (over target)"
+            print(
+                f"report --by {group_by:<6} {label:<9} {len(rows):>7,} groups  "
+                f"{elapsed * 1000:9.1f} ms{flag}"
+            )
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark for resolving short Sesh ids with Store.resolve_uid.
+
+Builds synthetic stores of growing size and resolves the six character short
+ids printed by `sesh stop`. resolve_uid is a range search on the UNIQUE uid
+index (its query plan is printed), so its time per lookup should stay nearly
+flat as the store grows tenfold, while a lookup on an unindexed expression
+(how the old substr(sesh_uid, -6) index was bypassed) grows with the store.
+
+    python benchmarks/bench_resolve.py [--sizes N,N,...] [-l LOOKUPS] [--store DIR]
+"""
+
+import argparse
+import contextlib
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import open_store
+
+from sesh.error import AmbiguousSeshError
+from sesh.store import SHORT_UID_LENGTH, Store
+
+SCAN_LOOKUPS = 5
+
+
+def scan_lookup(store: Store, short_uid: str) -> None:
+    store.db_conn.execute(
+        "SELECT sesh_uid FROM sesh WHERE substr(sesh_uid, 1, ?) = ? LIMIT 2",
+        (SHORT_UID_LENGTH, short_uid),
+    ).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("-l", "--lookups", type=int, default=10_000)
+    parser.add_argument("--store", type=Path, help="Reuse stores under a directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, rows in enumerate(int(size) for size in args.sizes.split(",")):
+            store = open_store((args.store or Path(tmp)) / f"uid-{rows}", rows)
+            uids = [
+                uid[:SHORT_UID_LENGTH]
+                for (uid,) in store.db_conn.execute(
+                    "SELECT sesh_uid FROM sesh ORDER BY random() LIMIT ?",
+                    (args.lookups,),
+                )
+            ]
+            if i == 0:
+                plan = store.db_conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT sesh_uid FROM sesh "
+                    "WHERE sesh_uid >= ? AND sesh_uid < ?",
+                    ("a", "b"),
+                ).fetchall()
+                print(f"resolve_uid plan: {plan[0][3]}")
+
+            start = time.perf_counter()
+            for uid in uids:
+                # short ids can collide in large stores, still a single search
+                with contextlib.suppress(AmbiguousSeshError):
+                    store.resolve_uid(uid)
+            per_lookup = (time.perf_counter() - start) / len(uids)
+
+            start = time.perf_counter()
+            for uid in uids[:SCAN_LOOKUPS]:
+                scan_lookup(store, uid)
+            scan_per_lookup = (time.perf_counter() - start) / SCAN_LOOKUPS
+
+            print(
+                f"{rows:>10,} rows  resolve_uid {per_lookup * 1e6:8.1f} us/lookup  "
+                f"full scan {scan_per_lookup * 1e6:10.1f} us/lookup"
+            )
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark for `sesh search` against a LIKE scan.
+
+Populates a synthetic store and runs the same word queries through the FTS5
+index (Store.search, ranked, top 20) and through a LIKE '%word%' scan over
+titles and details, which has to read every row.
+
+    python benchmarks/bench_search.py [-n ROWS] [--store DIR]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import open_store
+
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+QUERIES = [
+    ("common word", "auth", []),
+    ("rare word", "term4000", []),
+    ("two words", "auth migration", []),
+    ("prefix", "term12*", []),
+    ("word + tag", "auth", [Tag("tag-1")]),
+]
+
+
+def like_scan(store: Store, text: str) -> int:
+    clauses = []
+    params = []
+    for word in text.split():
+        clauses.append("(s.title LIKE ? OR s.details LIKE ?)")
+        params.extend([f"%{word.rstrip('*')}%"] * 2)
+    (count,) = store.db_conn.execute(
+        f"SELECT count(*) FROM sesh s WHERE {' AND '.join(clauses)}", params
+    ).fetchone()
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--store", type=Path, help="Reuse a store directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = open_store(args.store or Path(tmp) / ".sesh", args.rows)
+
+        for label, text, tags in QUERIES:
+            start = time.perf_counter()
+            results = store.search(text, tags=tags)
+            fts = time.perf_counter() - start
+
+            like = None
+            if not tags:
+                start = time.perf_counter()
+                like_scan(store, text)
+                like = time.perf_counter() - start
+
+            print(
+                f"{label:<12} {text!r:<16} fts {fts * 1000:8.1f} ms "
+                f"({len(results)} shown)"
+                + (f"  like scan {like * 1000:9.1f} ms" if like is not None else "")
+            )
+
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark for start/stop cycles with each current Sesh storage.
+
+Runs Store.start_sesh followed by Store.end_sesh in a loop and reports cycles
+per second for file storage (current.json next to a rollback-journal database)
+and database storage (active_sesh in a WAL database), with and without fsync
+of the current file.
+
+    python benchmarks/bench_start_stop.py [-n CYCLES]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sesh.config import Config
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+TAGS = [Tag("backend"), Tag("storage")]
+
+
+def cycles_per_second(store: Store, count: int) -> float:
+    # open and migrate outside the timed loop
+    store.connect()
+    start = time.perf_counter()
+    for i in range(count):
+        store.start_sesh(f"task {i}", TAGS)
+        store.end_sesh("", [])
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--cycles", type=int, default=1_000)
+    args = parser.parse_args()
+
+    for storage, fsync in (
+        ("file", True),
+        ("file", False),
+        ("database", True),
+    ):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = Store(
+                Path(tmp) / ".sesh", Config(fsync=fsync, current_storage=storage)
+            )
+            rate = cycles_per_second(store, args.cycles)
+            store.close()
+        label = f"{storage} fsync={fsync}" if storage == "file" else storage
+        print(f"{label:<18} {rate:>8,.0f} cycles/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Startup benchmarks for the sesh CLI.
+
+Compares the wall time of building a Store and rendering the status of an
+active Sesh when the database is opened eagerly (the previous behaviour) and
+lazily, then runs CLI commands in fresh interpreters to record the total
+`python -X importtime` cost and the end-to-end latency of each.
+
+    python benchmarks/bench_startup.py [-n ITERATIONS]
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sesh.command.status import handle_status
+from sesh.store import Store
+
+COMMANDS = {
+    "status --prompt": ["status", "--prompt"],
+    "status": ["status"],
+    "--help": ["--help"],
+}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def time_status(root: Path, iterations: int, eager: bool) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        store = Store(root)
+        if eager:
+            store.connect()  # open and migrate like every command used to
+        with contextlib.redirect_stdout(io.StringIO()):
+            handle_status(store)
+        timings.append(time.perf_counter() - start)
+        store.close()
+    return timings
+
+
+def run_sesh(cwd: Path, args: list[str], *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-m", "sesh", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def import_time(cwd: Path, args: list[str]) -> tuple[float, list[str]]:
+    """Return the summed top-level import time (seconds) and imported modules."""
+    stderr = run_sesh(cwd, args, "-X", "importtime").stderr
+    total = 0
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            if not match.group(2):  # nested imports are included in their parent
+                total += int(match.group(1))
+            modules.append(match.group(3))
+    return total / 1_000_000, modules
+
+
+def time_process(cwd: Path, args: list[str], iterations: int) -> list[float]:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        run_sesh(cwd, args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(
+        f"{label:<28} median {statistics.median(timings) * 1000:8.3f} ms  "
+        f"min {min(timings) * 1000:8.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / ".sesh"
+        store = Store(root)
+        store.start_sesh("benchmarking startup", [])
+        store.connect()  # create and migrate the database up front
+        store.close()
+
+        report("status (eager store)", time_status(root, args.iterations, True))
+        report("status (lazy store)", time_status(root, args.iterations, False))
+
+        for label, command in COMMANDS.items():
+            total, modules = import_time(root.parent, command)
+            heavy = [m for m in ("click", "whenever", "sqlite3") if m in modules]
+            print(
+                f"{'sesh ' + label + ' imports':<28} total  {total * 1000:8.3f} ms  "
+                f"({', '.join(heavy) or 'stdlib only'})"
+            )
+            report(
+                f"sesh {label}",
+                time_process(root.parent, command, max(args.iterations // 10, 1)),
+            )
+
+
+if __name__ == "__main__":
+    main()
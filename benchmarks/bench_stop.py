@@ -0,0 +1,116 @@
+"""Microbenchmark for the `sesh stop` write path.
+
+Runs start/stop cycles against the previous multi-commit implementation of
+Store.end_sesh and the current single-transaction one, counting the SQL
+statements and commits issued per stop. With the default rollback journal
+and synchronous=FULL every commit costs a journal and a database fsync, so
+the commit count is the number of durable sync points per stop.
+
+    python benchmarks/bench_stop.py [-n CYCLES] [-t TAGS]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from whenever import Instant
+
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+
+def legacy_end_sesh(store: Store, details: str, tags: list[Tag]) -> str:
+    """Store.end_sesh as it was before the single-transaction rewrite."""
+    current_sesh = store.current_manager.pop()
+    current_sesh.tags = list(set(tags).union(current_sesh.tags))
+
+    cur = store.db_conn.cursor()
+    tag_ids = []
+    if current_sesh.tags:
+        cur.executemany(
+            "INSERT OR IGNORE INTO tag (tag_name) VALUES (?)",
+            [(str(tag),) for tag in current_sesh.tags],
+        )
+        cur.execute(
+            "SELECT tag_id FROM tag WHERE tag_name IN ({})".format(
+                ",".join("?" * len(current_sesh.tags))
+            ),
+            [str(tag) for tag in current_sesh.tags],
+        )
+        tag_ids = [row[0] for row in cur.fetchall()]
+        store.db_conn.commit()
+
+    cur.execute(
+        "INSERT INTO sesh (title, details, start_time, end_time) VALUES (?, ?, ?, ?)",
+        (
+            current_sesh.title,
+            details,
+            # times are stored as Unix seconds since the INTEGER migration
+            current_sesh.start_time.round().timestamp(),
+            Instant.now().round().timestamp(),
+        ),
+    )
+    store.db_conn.commit()
+
+    cur.execute("SELECT last_insert_rowid()")
+    sesh_id = cur.fetchone()[0]
+
+    if tag_ids:
+        cur.executemany(
+            "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (?, ?)",
+            [(sesh_id, tag_id) for tag_id in tag_ids],
+        )
+        store.db_conn.commit()
+
+    cur.execute("SELECT sesh_uid FROM sesh WHERE sesh_id = ?", (sesh_id,))
+    return cur.fetchone()[0][:6]
+
+
+def run(root: Path, cycles: int, tag_count: int, legacy: bool) -> None:
+    store = Store(root)
+    tags = [Tag(f"tag{i}") for i in range(tag_count)]
+
+    statements = []
+
+    def trace(statement: str) -> None:
+        # trigger programs re-report the statement that fired them
+        if not statements or statements[-1] != statement:
+            statements.append(statement)
+
+    store.db_conn.set_trace_callback(trace)
+
+    elapsed = 0.0
+    for i in range(cycles):
+        store.start_sesh(f"cycle {i}", tags[: tag_count // 2])
+        start = time.perf_counter()
+        if legacy:
+            legacy_end_sesh(store, "", tags[tag_count // 2 :])
+        else:
+            store.end_sesh("", tags[tag_count // 2 :])
+        elapsed += time.perf_counter() - start
+
+    store.close()
+
+    commits = sum(1 for s in statements if s.strip().upper() == "COMMIT")
+    label = "legacy end_sesh" if legacy else "end_sesh"
+    print(
+        f"{label:<16} {len(statements) / cycles:5.1f} statements/stop  "
+        f"{commits / cycles:4.1f} commits/stop  "
+        f"{elapsed / cycles * 1000:7.3f} ms/stop"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--cycles", type=int, default=200)
+    parser.add_argument("-t", "--tags", type=int, default=4)
+    args = parser.parse_args()
+
+    for legacy in (True, False):
+        with tempfile.TemporaryDirectory() as tmp:
+            run(Path(tmp) / ".sesh", args.cycles, args.tags, legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Reproducible benchmark suite over stores of growing size.
+
+For every size, builds a store from the seeded generator in synthetic.py (or
+reuses one from --cache) and times opening it, applying the migrations to a
+new database, start/stop cycles, CLI commands through click's CliRunner, and
+reset_data on a copy. Each result is the median of --repeat runs.
+
+Results are written as JSON. Given a --baseline file from an earlier run, the
+suite lists every result more than --tolerance slower than its baseline, or
+failing where it passed before, and exits with status 1 if there is any.
+
+    python benchmarks/bench_suite.py [--sizes 10000,100000,1000000]
+        [-o FILE] [--baseline FILE] [--tolerance 0.2] [-r REPEAT] [--cache DIR]
+"""
+
+import argparse
+import json
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from click.testing import CliRunner
+from synthetic import open_store
+
+from sesh.cli import main as cli
+from sesh.config import DB_PROFILES, Config
+from sesh.error import SeshError
+from sesh.migration import apply_migrations
+from sesh.paths import DATA_SQLITE
+from sesh.store import Store
+
+SIZES = (10_000, 100_000, 1_000_000)
+START_STOP_CYCLES = 200
+
+# Read-only CLI commands timed on every store
+CLI_COMMANDS = {
+    "cli status": ["status"],
+    "cli report": ["report"],
+    "cli report --by day": ["report", "--by", "day"],
+    "cli report -t tag-1,tag-2": ["report", "-t", "tag-1,tag-2"],
+    "cli search": ["search", "fix", "bug"],
+    "cli export one year": [
+        "export",
+        "--since",
+        "2021-01-01",
+        "--until",
+        "2021-12-31",
+    ],
+}
+
+
+def median_seconds(func: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def invoke(store: Store, args: list[str]) -> None:
+    result = CliRunner().invoke(cli, args, obj=store)
+    if result.exit_code != 0:
+        raise RuntimeError(f"sesh {' '.join(args)} failed: {result.output}")
+
+
+def environment(config: Config) -> dict[str, str | None]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "db_profile": config.db_profile,
+    }
+
+
+def bench_migrate(config: Config, repeat: int) -> float:
+    """Time applying every migration to a new, empty database."""
+
+    def migrate() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_conn = sqlite3.connect(Path(tmp) / DATA_SQLITE)
+            apply_migrations(db_conn)
+            db_conn.close()
+
+    return median_seconds(migrate, repeat)
+
+
+def bench_size(
+    root: Path, rows: int, config: Config, repeat: int
+) -> dict[str, float | str]:
+    results = {}
+    store = open_store(root, rows, config)
+    (uid,) = store.db_conn.execute(
+        "SELECT sesh_uid FROM sesh ORDER BY sesh_id LIMIT 1"
+    ).fetchone()
+
+    for label, args in {**CLI_COMMANDS, "cli show": ["show", uid[:8]]}.items():
+        results[label] = median_seconds(lambda a=args: invoke(store, a), repeat)
+    store.close()
+
+    def open_close() -> None:
+        store = Store(root, config)
+        store.connect()
+        store.close()
+
+    results["open store"] = median_seconds(open_close, repeat)
+
+    # writes run on a copy, so that the store can be reused with --cache
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = Path(tmp)
+        shutil.copyfile(root / DATA_SQLITE, copy / DATA_SQLITE)
+        store = Store(copy, config)
+        store.connect()
+
+        def start_stop() -> None:
+            for i in range(START_STOP_CYCLES):
+                store.start_sesh(f"benchmark {i}", [])
+                store.end_sesh("", [])
+
+        seconds = median_seconds(start_stop, repeat)
+        results["start + stop cycle"] = seconds / START_STOP_CYCLES
+        results["cli start + stop"] = median_seconds(
+            lambda: (invoke(store, ["start", "task"]), invoke(store, ["stop"])),
+            repeat,
+        )
+        # destructive, so timed once
+        try:
+            results["reset_data"] = median_seconds(store.reset_data, 1)
+        except SeshError as e:
+            results["reset_data"] = str(e)
+        store.close()
+
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Describe every result slower than its baseline by more than ``tolerance``."""
+    previous = {(r["name"], r["rows"]): r.get("seconds") for r in baseline}
+    slower = []
+    for result in results:
+        before = previous.get((result["name"], result["rows"]))
+        if "error" in result:
+            if before:
+                slower.append(f"{result['name']} at {result['rows']:,} rows failed")
+        elif before and result["seconds"] > before * (1 + tolerance):
+            slower.append(
+                f"{result['name']} at {result['rows']:,} rows: "
+                f"{before * 1000:.2f} ms -> {result['seconds'] * 1000:.2f} ms "
+                f"({result['seconds'] / before - 1:+.0%})"
+            )
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=list(SIZES),
+        help="Comma-separated store sizes in rows",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare to a saved run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--cache", type=Path, help="Keep generated stores here")
+    parser.add_argument("--profile", choices=DB_PROFILES, default="default")
+    args = parser.parse_args()
+
+    config = Config(fsync=False, db_profile=args.profile)
+    results = [
+        {
+            "name": "migrate new",
+            "rows": 0,
+            "seconds": bench_migrate(config, args.repeat),
+        }
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.sizes:
+            root = (args.cache or Path(tmp)) / f"rows-{rows}"
+            for name, value in bench_size(root, rows, config, args.repeat).items():
+                # an operation that failed is recorded with its error instead
+                key = "error" if isinstance(value, str) else "seconds"
+                results.append({"name": name, "rows": rows, key: value})
+
+    for result in results:
+        if "error" in result:
+            outcome = f"  failed: {result['error']}"
+        else:
+            outcome = f"{result['seconds'] * 1000:>12.2f} ms"
+        print(f"{result['name']:<30} {result['rows']:>10,} rows {outcome}")
+
+    if args.output is not None:
+        report = {"environment": environment(config), "results": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        slower = compare(results, baseline, args.tolerance)
+        for line in slower:
+            print(f"slower: {line}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
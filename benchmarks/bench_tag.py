@@ -0,0 +1,87 @@
+"""Microbenchmarks for the Tag value type.
+
+Compares the interned, __slots__ Tag with regex validation against the
+previous implementation (per-instance __dict__, per-character validation, no
+equality) over a million tag references drawn from a 300 name vocabulary:
+construction, validation, set deduplication and memory held.
+
+    python benchmarks/bench_tag.py [-n REFERENCES]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from synthetic import TAG_VOCABULARY
+
+from sesh.error import InvalidTagError
+from sesh.parser.tag import Tag
+
+
+class LegacyTag:
+    """Tag as it was before it became an interned value type."""
+
+    def __init__(self, name: str, display_name: str | None = None):
+        if LegacyTag.validate_tag_name(name):
+            self.name = name
+        else:
+            raise InvalidTagError(name)
+
+        if display_name is None:
+            self.display_name = " ".join(name.split("-"))
+        else:
+            self.display_name = display_name
+
+    @staticmethod
+    def validate_tag_name(tag: str) -> bool:
+        return (
+            len(tag) >= 1
+            and all(c.isdigit() or c == "-" or ("a" <= c <= "z") for c in tag)
+            and tag[0] != "-"
+            and tag[-1] != "-"
+        )
+
+
+def timed(label: str, func, names: list[str]) -> None:
+    start = time.perf_counter()
+    result = func(names)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed * 1000:9.1f} ms  {result}")
+
+
+def held_memory(cls, names: list[str]) -> str:
+    tracemalloc.start()
+    tags = [cls(name) for name in names]
+    (current, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tags
+    return f"{current / 1024 / 1024:.1f} MiB held"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--references", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = rng.choices(TAG_VOCABULARY, k=args.references)
+    count = f"{len(names):,} references"
+
+    for label, cls in (("legacy", LegacyTag), ("interned", Tag)):
+        timed(
+            f"{label} validate",
+            lambda n, c=cls: f"{sum(map(c.validate_tag_name, n)):,} valid",
+            names,
+        )
+        timed(f"{label} construct", lambda n, c=cls: [c(x) for x in n] and count, names)
+        timed(
+            f"{label} dedupe with set()",
+            lambda n, c=cls: f"{len(set(c(x) for x in n)):,} unique",
+            names,
+        )
+        print(f"{label + ' memory':<34} {held_memory(cls, names):>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark for Sesh times stored as ISO-8601 text and as INTEGER Unix seconds.
+
+Builds two tables of the same synthetic Sesh times, one per representation,
+each with the (start_time, end_time) index of the sesh table, and compares the
+size of that index, the latency of week-long range scans through it, and the
+throughput of summing durations over every row.
+
+    python benchmarks/bench_timestamps.py [-n ROWS] [-q QUERIES]
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+
+from whenever import Instant
+
+START = Instant.from_utc(2020, 1, 1).timestamp()
+WEEK = 7 * 86400
+
+# Per representation: column type, how a Unix second is stored and bound, and
+# the duration of a row in seconds
+LAYOUTS = {
+    "text": (
+        "TEXT",
+        lambda t: Instant.from_timestamp(t).format_common_iso(),
+        "unixepoch(end_time) - unixepoch(start_time)",
+    ),
+    "integer": ("INTEGER", lambda t: t, "end_time - start_time"),
+}
+
+
+def synthetic_times(rows: int) -> list[tuple[int, int]]:
+    """Non-overlapping (start, end) Unix seconds, as in synthetic.py."""
+    rng = random.Random(0)
+    times = []
+    start = START
+    for _ in range(rows):
+        start += rng.randint(1, 240) * 60
+        end = start + rng.randint(5, 180) * 60
+        times.append((start, end))
+        start = end
+    return times
+
+
+def index_pages(db_conn: sqlite3.Connection, table: str) -> int:
+    """Pages taken by the time index of ``table``, measured by building it."""
+    (before,) = db_conn.execute("PRAGMA page_count").fetchone()
+    db_conn.execute(f"CREATE INDEX idx_{table} ON {table} (start_time, end_time)")
+    (after,) = db_conn.execute("PRAGMA page_count").fetchone()
+    return after - before
+
+
+def bench(rows: int, queries: int) -> None:
+    times = synthetic_times(rows)
+    last = times[-1][1]
+    rng = random.Random(1)
+    ranges = [rng.randint(START, last - WEEK) for _ in range(queries)]
+
+    db_conn = sqlite3.connect(":memory:")
+    (page_size,) = db_conn.execute("PRAGMA page_size").fetchone()
+    for name, (column, encode, duration) in LAYOUTS.items():
+        db_conn.execute(
+            f"CREATE TABLE {name} (id INTEGER PRIMARY KEY, "
+            f"start_time {column} NOT NULL, end_time {column} NOT NULL)"
+        )
+        with db_conn:
+            db_conn.executemany(
+                f"INSERT INTO {name} (start_time, end_time) VALUES (?, ?)",
+                ((encode(s), encode(e)) for (s, e) in times),
+            )
+        size = index_pages(db_conn, name) * page_size / 2**20
+
+        params = [(encode(t), encode(t + WEEK)) for t in ranges]
+        sql = f"SELECT count(*) FROM {name} WHERE start_time >= ? AND start_time < ?"
+        start = time.perf_counter()
+        for p in params:
+            db_conn.execute(sql, p).fetchone()
+        scan = (time.perf_counter() - start) / queries * 1e6
+
+        start = time.perf_counter()
+        (total,) = db_conn.execute(f"SELECT sum({duration}) FROM {name}").fetchone()
+        rate = rows / (time.perf_counter() - start)
+
+        print(
+            f"{name:<8} index {size:7.1f} MiB  week scan {scan:8.1f} us  "
+            f"sum(duration) {rate:>12,.0f} rows/s  ({total // 3600:,} h)"
+        )
+    db_conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("-q", "--queries", type=int, default=2_000)
+    args = parser.parse_args()
+    bench(args.rows, args.queries)
+
+
+if __name__ == "__main__":
+    main()
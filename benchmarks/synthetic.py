@@ -0,0 +1,72 @@
+"""Synthetic Sesh data shared by the benchmarks."""
+
+import random
+from collections.abc import Iterator
+from itertools import accumulate
+from pathlib import Path
+
+from whenever import Instant, minutes
+
+from sesh.config import Config
+from sesh.importer import ImportedSesh
+from sesh.store import Store
+
+# Tags ranked by popularity: tag-0 is the most used, as with Zipf's law
+TAG_VOCABULARY = [f"tag-{i}" for i in range(300)]
+TAG_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(TAG_VOCABULARY) + 1)))
+START = Instant.from_utc(2020, 1, 1)
+
+# Words for titles and details, drawn with Zipf-like frequencies so that a few
+# words are common and most are rare, as in real notes
+COMMON_WORDS_TEXT = (
+    "the and to of for with on in a is "
+    "fix bug review test deploy refactor api auth migration docs release "
+    "meeting planning database cache login search report build ci flaky "
+    "performance memory config cleanup upgrade dependency feature design"
+)
+WORDS = [*COMMON_WORDS_TEXT.split(), *(f"term{i}" for i in range(5000))]
+WORD_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(WORDS) + 1)))
+
+
+def synthetic_text(rng: random.Random, low: int, high: int) -> str:
+    """Return between ``low`` and ``high`` words from WORDS."""
+    count = rng.randint(low, high)
+    return " ".join(rng.choices(WORDS, cum_weights=WORD_WEIGHTS, k=count))
+
+
+def synthetic_tags(rng: random.Random, count: int) -> list[str]:
+    """Return ``count`` distinct tags drawn by popularity from TAG_VOCABULARY."""
+    tags = set()
+    while len(tags) < count:
+        tags.update(rng.choices(TAG_VOCABULARY, cum_weights=TAG_WEIGHTS, k=1))
+    return sorted(tags)
+
+
+def synthetic_seshes(count: int, seed: int = 0) -> Iterator[ImportedSesh]:
+    """Yield ``count`` non-overlapping Seshes with 0-4 tags each.
+
+    Seshes follow each other with gaps of up to four hours, so 100k of them
+    span about 40 years. The same ``seed`` always yields the same Seshes.
+    """
+    rng = random.Random(seed)
+    start = START
+    for i in range(count):
+        start = start + minutes(rng.randint(1, 240))
+        end = start + minutes(rng.randint(5, 180))
+        yield ImportedSesh(
+            title=f"{synthetic_text(rng, 1, 5)} {i}",
+            details=synthetic_text(rng, 0, 30),
+            start_time=start.format_common_iso(),
+            end_time=end.format_common_iso(),
+            tags=synthetic_tags(rng, rng.randint(0, 4)),
+        )
+        start = end
+
+
+def open_store(root: Path, rows: int, config: Config | None = None) -> Store:
+    """Open the store at ``root``, topping it up to ``rows`` synthetic Seshes."""
+    store = Store(root, config)
+    existing = store.next_sesh_id() - 1
+    if existing < rows:
+        store.import_seshes(synthetic_seshes(rows - existing, seed=existing))
+    return store
@@ -0,0 +1,4 @@
+import time
+
+# When the package was imported, the start of the "startup" phase in traces
+STARTED = time.perf_counter()
@@ -1,4 +1,69 @@
-from sesh.cli import main
+import sys
+
+
+def main() -> None:
+    """Entry point for the ``sesh`` script.
+
+    The prompt status line is answered before click and the rest of Sesh are
+    imported, since shell prompts run it on every render. Other commands are
+    sent to a running ``sesh daemon`` when there is one, and otherwise go
+    through the click group, which loads only the chosen subcommand.
+    """
+    if sys.argv[1:] == ["status", "--prompt"]:
+        import os
+
+        from sesh.error import SessionStorageError
+        from sesh.paths import (
+            CONFIG_TOML,
+            CURRENT_SESSION_JSON,
+            DATA_SQLITE,
+            DATABASE_STORAGE,
+            ENV_CURRENT_STORAGE,
+            SESH_DIR,
+        )
+        from sesh.prompt import prompt_line
+
+        root = os.path.join(os.getcwd(), SESH_DIR)
+        # parsing config.toml would cost more than the prompt itself, so with
+        # a config file and no override the active_sesh table is checked too;
+        # it is empty in file storage
+        storage = os.environ.get(ENV_CURRENT_STORAGE, "").lower()
+        in_database = storage == DATABASE_STORAGE or (
+            not storage and os.path.exists(os.path.join(root, CONFIG_TOML))
+        )
+        try:
+            line = prompt_line(
+                os.path.join(root, CURRENT_SESSION_JSON),
+                os.path.join(root, DATA_SQLITE) if in_database else None,
+            )
+        except SessionStorageError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            sys.exit(1)
+        if line:
+            sys.stdout.write(line + "\n")
+        return
+
+    import os
+
+    from sesh.paths import DAEMON_SOCKET, ENV_TRACE, SESH_DIR
+
+    # hand the command to a running sesh daemon, a single stat when there is
+    # none; traced commands run here, where the trace can see the work
+    socket_path = os.path.join(os.getcwd(), SESH_DIR, DAEMON_SOCKET)
+    traced = os.environ.get(ENV_TRACE, "") not in ("", "0") or any(
+        arg.startswith("--profile") for arg in sys.argv[1:]
+    )
+    if not traced and os.path.exists(socket_path):
+        from sesh.client import run_via_daemon
+
+        code = run_via_daemon(socket_path, sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
+
+    from sesh.cli import main as cli
+
+    cli()
+
 
 if __name__ == "__main__":
     main()
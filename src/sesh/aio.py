@@ -0,0 +1,175 @@
+"""Asyncio facade over Store for embedding Sesh in async services.
+
+Store is blocking: sqlite3 calls and current Sesh file I/O would stall the
+event loop. AsyncStore runs every write on one dedicated writer thread, which
+owns the only writing Store and so keeps writes in order, and reads on a pool
+of reader threads, each with its own connection. Methods keep the semantics
+and the sesh.error exceptions of their Store counterparts.
+"""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from whenever import Instant
+
+from sesh.config import Config
+from sesh.current import CurrentSesh
+from sesh.importer import ImportedSesh
+from sesh.parser.tag import Tag
+from sesh.store import SEARCH_LIMIT, Store
+
+# Reader threads, each holding its own database connection
+READER_THREADS = 4
+
+
+class AsyncStore:
+    """Awaitable start/stop/status and queries on the store at ``root``.
+
+    Use as ``async with AsyncStore(root) as store:`` or call close() when done.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        config: Config | None = None,
+        readers: int = READER_THREADS,
+    ) -> None:
+        self.root = root
+        self.config = config if config is not None else Config.load(root)
+        self.readers = readers
+
+        # the writer Store connects lazily, so its connection is created on
+        # (and only ever used from) the writer thread
+        self.writer_store = Store(root, self.config)
+        self.writer = ThreadPoolExecutor(1, thread_name_prefix="sesh-writer")
+        self.reader_pool = ThreadPoolExecutor(readers, thread_name_prefix="sesh-reader")
+        self.local = threading.local()
+
+        # Seshes waiting for the next coalesced insert, see add_sesh
+        self.pending: list[tuple[ImportedSesh, asyncio.Future]] = []
+        self.flush_task: asyncio.Task | None = None
+        self.batches = 0
+
+    async def __aenter__(self) -> "AsyncStore":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def write(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(writer_store, ...)`` on the writer thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.writer, functools.partial(func, self.writer_store, *args, **kwargs)
+        )
+
+    async def read(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run ``func(store, ...)`` on a reader thread with its own Store."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.reader_pool,
+            functools.partial(self.run_reader, func, *args, **kwargs),
+        )
+
+    def run_reader(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        store = getattr(self.local, "store", None)
+        if store is None:
+            store = self.local.store = Store(self.root, self.config)
+        return func(store, *args, **kwargs)
+
+    async def start_sesh(self, title: str, tags: list[Tag]) -> None:
+        await self.write(Store.start_sesh, title, tags)
+
+    async def end_sesh(self, details: str, tags: list[Tag]) -> str:
+        return await self.write(Store.end_sesh, details, tags)
+
+    async def status(self) -> CurrentSesh | None:
+        # with database storage, reading the active Sesh may first move a
+        # leftover current Sesh file into the table, which is a write
+        return await self.write(lambda store: store.current_manager.read())
+
+    async def get_sesh(self, prefix: str) -> tuple[str, str, str, str, str, str]:
+        return await self.read(Store.get_sesh, prefix)
+
+    async def search(
+        self,
+        text: str,
+        since: Instant | None = None,
+        until: Instant | None = None,
+        tags: list[Tag] | None = None,
+        limit: int = SEARCH_LIMIT,
+    ) -> list[tuple[str, str, str, str, str, str]]:
+        return await self.read(Store.search, text, since, until, tags, limit)
+
+    async def report(
+        self,
+        group_by: str,
+        since: Instant | None = None,
+        until: Instant | None = None,
+        tags: list[Tag] | None = None,
+    ) -> list[tuple[str, int, int]]:
+        return await self.read(Store.report, group_by, since, until, tags)
+
+    async def add_sesh(self, sesh: ImportedSesh) -> None:
+        """Save a completed Sesh, coalescing concurrent calls into one insert.
+
+        Seshes added while an insert runs on the writer thread are saved
+        together by the next one, so a burst of N calls costs a few
+        transactions instead of N. Records must be valid as produced by
+        SeshReader; an error fails every call of the batch it was in.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((sesh, future))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush())
+        await future
+
+    async def flush(self) -> None:
+        try:
+            while self.pending:
+                (batch, self.pending) = (self.pending, [])
+                try:
+                    await self.write(Store.import_seshes, [s for s, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+                self.batches += 1
+        finally:
+            self.flush_task = None
+
+    async def close(self) -> None:
+        """Wait for pending writes, then close every connection."""
+        if self.flush_task is not None:
+            await self.flush_task
+        await self.write(Store.close)
+        self.writer.shutdown()
+
+        # connections can only be closed by their own thread, so give each
+        # reader thread one close call and hold them until all got theirs
+        barrier = threading.Barrier(self.readers)
+
+        def close_reader() -> None:
+            store = getattr(self.local, "store", None)
+            if store is not None:
+                store.close()
+                self.local.store = None
+            barrier.wait()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.reader_pool, close_reader)
+                for _ in range(self.readers)
+            )
+        )
+        self.reader_pool.shutdown()
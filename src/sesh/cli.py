@@ -1,25 +1,75 @@
+import importlib
+import os
+import time
 from pathlib import Path
 
 import click
 
-from sesh.command.reset import handle_reset
-from sesh.command.start import StartArg, handle_start
-from sesh.command.status import handle_status
-from sesh.command.stop import handle_stop
-from sesh.error import (
-    DatabaseError,
-    MigrationError,
-    SeshInProgressError,
-    SessionStorageError,
-)
-from sesh.parser.basic import BasicSeshQuery
-from sesh.parser.tag import Tag, TagOption
-from sesh.store import Store
+from sesh.paths import ENV_TRACE, SESH_DIR
+
 
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked.
 
-@click.group()
+    Subcommands are registered as ``"name": "module:attribute"`` so that running
+    one command never pays for importing the others (or their dependencies).
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        # command name -> perf_counter() before and after its import, for traces
+        self.load_times: dict[str, tuple[float, float]] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+        start = time.perf_counter()
+        command = getattr(importlib.import_module(module_name), attr)
+        self.load_times[cmd_name] = (start, time.perf_counter())
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand {cmd_name} is not a click command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "start": "sesh.command.start:start",
+        "stop": "sesh.command.stop:stop",
+        "status": "sesh.command.status:status",
+        "reset": "sesh.command.reset:reset",
+        "edit": "sesh.command.edit:edit",
+        "import": "sesh.command.bulk_import:import_",
+        "export": "sesh.command.export:export",
+        "report": "sesh.command.report:report",
+        "show": "sesh.command.show:show",
+        "search": "sesh.command.search:search",
+        "rebuild-rollups": "sesh.command.rebuild_rollups:rebuild_rollups",
+        "gc": "sesh.command.gc:gc",
+        "daemon": "sesh.command.daemon:daemon",
+    },
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print timings of each phase and SQL statement to stderr.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False),
+    help="Write the timings to this file instead: .json for Chrome trace "
+    "events, .prof for a cProfile dump.",
+)
 @click.pass_context
-def main(ctx):
+def main(ctx, profile, profile_output):
     """Sesh - A simple session tracking CLI application.
 
     Track your work sessions with titles, tags, and timing. Start a session,
@@ -32,179 +82,55 @@ def main(ctx):
         sesh status
         sesh stop "completed the feature"
     """
-    try:
-        ctx.obj = Store(Path.cwd() / ".sesh")
-    except (DatabaseError, MigrationError) as e:
-        click.echo(f"Error: Failed to initialize store ({e})", err=True)
-        raise click.Abort() from e
-    except Exception as e:
-        click.echo(
-            f"Error: An unexpected error occurred during initialization ({e})", err=True
-        )
-        raise click.Abort() from e
-
-
-@main.command()
-@click.option(
-    "-t",
-    "--tag",
-    "tags",
-    type=TagOption(),
-    help="Additional tags to assign (comma-separated)",
-    default=[],
-)
-@click.argument("arg", nargs=-1, type=StartArg())
-@click.pass_obj
-def start(store: Store, tags: list[Tag], arg: tuple[str | Tag]):
-    """Start a new work session.
-
-    Begin tracking a new session with a descriptive title. Words in the title
-    can include inline tags by prefixing them with '+' (e.g., +python, +bug-fix).
-    These tagged words will be extracted as tags while remaining part of the title.
+    # sesh daemon runs commands against its own, already open Store
+    if ctx.obj is not None:
+        return
 
-    ARG: The session title with optional inline tags
+    # the options win over SESH_TRACE, tracing modules load only when enabled
+    output = profile_output or ("-" if profile else os.environ.get(ENV_TRACE, ""))
+    tracer = start_trace(ctx, output) if output else None
 
-    \b
-    Examples:
-        sesh start working on documentation
-        sesh start fix +bug in authentication system
-        sesh start +python +web-dev building new API
-        sesh start -t urgent,review code review session
-
-    Tags help organize and categorize your sessions for better tracking.
-    Use lowercase letters, numbers, and hyphens only in tag names.
-    """
-    # check that arg is non-empty
-    if not arg:
-        click.echo("Error: No argument provided for start command.", err=True)
-        raise click.Abort()
+    # deferred so that --help and completion do not load the storage layer
+    from sesh.error import ConfigError, DatabaseError, MigrationError
+    from sesh.store import Store
 
     try:
-        handle_start(store, tags, arg)
-        click.echo("Sesh started successfully.")
-    except SeshInProgressError as e:
-        click.echo(f"Error: {e}", err=True)
+        started = time.perf_counter()
+        ctx.obj = Store(Path.cwd() / SESH_DIR)
+        if tracer is not None:
+            tracer.add("open store", "phase", started, time.perf_counter())
+    except (DatabaseError, MigrationError) as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
         raise click.Abort() from e
-    except DatabaseError as e:
-        click.echo(f"Error: Database error while starting Sesh ({e})", err=True)
+    except ConfigError as e:
+        click.echo(f"Error: Invalid configuration ({e})", err=True)
         raise click.Abort() from e
     except Exception as e:
         click.echo(
-            f"Error: An unexpected error occurred while starting the Sesh ({e})",
-            err=True,
+            f"Error: An unexpected error occurred during initialization ({e})", err=True
         )
         raise click.Abort() from e
 
 
-@main.command()
-@click.option(
-    "-t",
-    "--tag",
-    "tags",
-    type=TagOption(),
-    help="Additional tags to add when stopping (comma-separated)",
-    default=[],
-)
-@click.argument("details", default="")
-@click.pass_obj
-def stop(store: Store, tags: list[Tag], details: str):
-    """Stop the current work session.
-
-    End the currently active session and save it to your session history.
-    Optionally provide completion details and additional tags to better
-    categorize and document what was accomplished.
-
-    DETAILS: Optional description of what was completed or achieved
-
-    \b
-    Examples:
-        sesh stop
-        sesh stop "completed user authentication feature"
-        sesh stop -t completed,tested "finished API endpoints"
-        sesh stop "need to continue tomorrow" -t incomplete
-
-    Additional tags specified with -t will be merged with any existing
-    tags from when the session was started.
-    """
-    handle_stop(store, tags, details)
-
-
-@main.command()
-@click.pass_obj
-def status(store: Store):
-    """Display information about the current work session.
-
-    Shows details about the currently active session including title,
-    assigned tags, start time, and elapsed duration. If no session is
-    active, displays a helpful message.
+def start_trace(ctx: click.Context, output: str):
+    """Trace the invoked command to ``output`` until the context closes."""
+    import sesh
+    from sesh import trace
 
-    \b
-    Examples:
-        sesh status
+    tracer = trace.start(output)
+    if tracer is None:
+        return None
 
-    \b
-    Output includes:
-        - Session title
-        - Assigned tags
-        - Start time (formatted for your timezone)
-        - Elapsed time (human-readable format)
-
-    Use this command to quickly check your current session progress
-    or verify that a session is running as expected.
-    """
-    handle_status(store)
-
-
-@main.command()
-@click.option(
-    "--yes",
-    "-y",
-    is_flag=True,
-    help="Skip confirmation prompt",
-    prompt="Are you sure you want to reset all data?",
-)
-@click.pass_obj
-def reset(store: Store, yes: bool):
-    """Reset all session data and clear current session.
-
-    WARNING: This is a destructive operation that will permanently delete
-    ALL session history and stop any currently active session.
-
-    \b
-    This command will:
-        - Stop the current session (if active) without saving
-        - Delete all completed session records
-        - Clear all tag data
-        - Reset the database to empty state
-
-    \b
-    Examples:
-        sesh reset          # Prompts for confirmation
-        sesh reset -y       # Skip confirmation prompt
-
-    Use this when you want to start fresh or clear out test data.
-    There is no way to recover deleted data after reset.
-    """
-    if not yes:
-        click.echo("Reset cancelled.")
-        return
-
-    try:
-        handle_reset(store)
-        click.echo("Reset completed successfully.")
-    except SessionStorageError as e:
-        click.echo(f"Error: Failed to clear current session ({e})", err=True)
-        raise click.Abort() from e
-    except DatabaseError as e:
-        click.echo(f"Error: Database error during reset ({e})", err=True)
-        raise click.Abort() from e
-    except Exception as e:
-        click.echo(f"Error: An unexpected error occurred during reset ({e})", err=True)
-        raise click.Abort() from e
+    tracer.add("startup", "phase", sesh.STARTED, tracer.origin)
+    for name, (start, end) in ctx.command.load_times.items():
+        tracer.add(f"import sesh.command.{name}", "phase", start, end)
 
+    def finish() -> None:
+        tracer.add(
+            f"sesh {ctx.invoked_subcommand}", "phase", started, time.perf_counter()
+        )
+        trace.stop()
 
-@main.command()
-@click.argument("query", type=BasicSeshQuery())
-@click.pass_obj
-def edit(store: Store, query: BasicSeshQuery):
-    pass
+    started = time.perf_counter()
+    ctx.call_on_close(finish)
+    return tracer
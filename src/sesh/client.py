@@ -0,0 +1,58 @@
+"""Client side of ``sesh daemon``.
+
+Like sesh.prompt, this module only depends on the standard library, so
+``sesh.__main__`` can hand a command to a running daemon before click and the
+storage layer are imported. Requests and responses are single JSON lines.
+"""
+
+import json
+import socket
+import sys
+
+# Commands the daemon answers. The others prompt on the terminal, stream large
+# output or read files relative to the caller, and always run locally.
+DAEMON_COMMANDS = frozenset({"start", "stop", "status", "report", "show", "search"})
+
+# Seconds to wait for a response before giving up on the daemon
+CLIENT_TIMEOUT = 30.0
+
+
+def run_via_daemon(socket_path: str, args: list[str]) -> int | None:
+    """Run ``args`` in the daemon, print its output and return the exit code.
+
+    Returns None, without side effects, when the command is not served by the
+    daemon or no daemon is listening, so the caller can run it locally.
+    """
+    if not args or args[0] not in DAEMON_COMMANDS:
+        return None
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except (AttributeError, OSError):
+        # no Unix sockets on this platform
+        return None
+
+    with sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            # stale socket file, the daemon is gone
+            return None
+
+        # the command may have run once the request is sent, so from here on
+        # failures are reported instead of falling back to a local run
+        try:
+            sock.settimeout(CLIENT_TIMEOUT)
+            request = {"args": args, "color": sys.stdout.isatty()}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+            response = json.loads(b"".join(chunks))
+            (code, out, err) = (response["code"], response["out"], response["err"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            sys.stderr.write(f"Error: No response from sesh daemon ({e})\n")
+            return 1
+
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    return code
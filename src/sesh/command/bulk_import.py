@@ -0,0 +1,92 @@
+import time
+from typing import TextIO
+
+import click
+
+from sesh.error import DatabaseError, MigrationError
+from sesh.importer import FORMATS, IMPORT_ERROR_PREVIEW, SeshReader
+from sesh.store import IMPORT_BATCH_SIZE, Store
+
+
+def handle_import(store: Store, file: TextIO, fmt: str | None, batch_size: int) -> None:
+    fmt = fmt or SeshReader.detect_format(file.name)
+    if fmt is None:
+        click.echo(
+            f"Error: Cannot detect the format of {file.name}, use --format", err=True
+        )
+        raise click.Abort()
+
+    reader = SeshReader(fmt)
+    started = time.perf_counter()
+
+    def report_progress(total: int) -> None:
+        rate = total / max(time.perf_counter() - started, 1e-9)
+        click.echo(f"Imported {total:,} Seshes ({rate:,.0f} rows/s)", err=True)
+
+    try:
+        total = store.import_seshes(reader.read(file), batch_size, report_progress)
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error during import ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Error: An unexpected error occurred during import ({e})", err=True)
+        raise click.Abort() from e
+
+    elapsed = time.perf_counter() - started
+    click.echo(
+        f"Imported {total:,} Seshes in {elapsed:.2f}s "
+        f"({total / max(elapsed, 1e-9):,.0f} rows/s)"
+    )
+
+    if reader.skipped:
+        click.echo(f"Skipped {reader.skipped:,} invalid records:", err=True)
+        for number, reason in reader.errors[:IMPORT_ERROR_PREVIEW]:
+            click.echo(f"  record {number}: {reason}", err=True)
+        if reader.skipped > IMPORT_ERROR_PREVIEW:
+            click.echo(
+                f"  ... and {reader.skipped - IMPORT_ERROR_PREVIEW:,} more", err=True
+            )
+
+
+@click.command("import")
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    help="Input format (detected from the file extension by default)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=IMPORT_BATCH_SIZE,
+    show_default=True,
+    help="Number of Seshes saved per transaction",
+)
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+@click.pass_obj
+def import_(store: Store, fmt: str | None, batch_size: int, file: TextIO):
+    """Import completed sessions from another time tracker.
+
+    Records are streamed from FILE and saved in large batches, so files with
+    millions of sessions can be imported quickly. Invalid records are skipped
+    and reported at the end.
+
+    FILE: CSV, JSONL or timewarrior export file ('-' reads stdin)
+
+    \b
+    Formats:
+        csv          header with title, start_time, end_time[, details, tags]
+        jsonl        one object per line with the same keys
+        timewarrior  output of 'timew export'
+
+    \b
+    Examples:
+        sesh import history.csv
+        sesh import --format jsonl sessions.log
+        timew export | sesh import -f timewarrior -
+    """
+    handle_import(store, file, fmt, batch_size)
@@ -0,0 +1,56 @@
+import asyncio
+
+import click
+
+from sesh.daemon import Daemon, is_listening
+from sesh.error import DatabaseError, MigrationError
+from sesh.paths import DAEMON_SOCKET
+from sesh.store import Store
+
+
+def handle_daemon(store: Store) -> None:
+    socket_path = store.db_path.parent / DAEMON_SOCKET
+    if socket_path.exists():
+        if is_listening(socket_path):
+            click.echo("Error: A sesh daemon is already running", err=True)
+            raise click.Abort()
+        # left behind by a daemon that was killed
+        socket_path.unlink()
+
+    try:
+        # migrate and warm up once, not on the first request
+        store.connect()
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while starting daemon ({e})", err=True)
+        raise click.Abort() from e
+
+    daemon = Daemon(store, socket_path)
+    click.echo(f"Listening on {socket_path}", err=True)
+    try:
+        asyncio.run(daemon.serve())
+    except OSError as e:
+        click.echo(f"Error: Failed to listen on {socket_path} ({e})", err=True)
+        raise click.Abort() from e
+    click.echo(f"Stopped after {daemon.served:,} requests", err=True)
+
+
+@click.command()
+@click.pass_obj
+def daemon(store: Store):
+    """Serve sesh commands from one long-running process.
+
+    Listens on .sesh/daemon.sock until interrupted. While it runs, start,
+    stop, status, report, show and search are handed to it automatically,
+    skipping interpreter, click and database start-up. The daemon uses the
+    settings of its own environment. Other commands run locally as usual.
+
+    \b
+    Examples:
+        sesh daemon &
+        sesh status
+        kill %1
+    """
+    handle_daemon(store)
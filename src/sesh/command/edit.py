@@ -0,0 +1,110 @@
+import click
+
+from sesh.command.search import format_result
+from sesh.error import DatabaseError, MigrationError
+from sesh.parser.basic import BasicSeshQuery, SeshQuery
+from sesh.parser.tag import Tag, TagOption
+from sesh.store import Store
+
+
+def handle_edit(
+    store: Store,
+    query: SeshQuery,
+    title: str | None,
+    details: str | None,
+    add_tags: list[Tag],
+    remove_tags: list[Tag],
+    yes: bool,
+) -> None:
+    try:
+        matches = store.find_seshes(query)
+        if not matches:
+            click.echo("No Seshes found")
+            return
+
+        changes = title is not None or details is not None or add_tags or remove_tags
+        if not changes or (len(matches) > 1 and not yes):
+            for sesh_uid, title_, _, start, end, tags in matches:
+                click.echo(format_result(sesh_uid, title_, start, end, tags, "")[0])
+        if not changes:
+            return
+        if len(matches) > 1 and not yes:
+            click.confirm(f"Edit these {len(matches)} Seshes?", abort=True)
+
+        # edit exactly the listed Seshes, the query may match others by now
+        count = store.edit_seshes_by_uid(
+            [sesh_uid for (sesh_uid, *_) in matches],
+            title,
+            details,
+            add_tags,
+            remove_tags,
+        )
+    except click.Abort:
+        raise
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while editing Seshes ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while editing Seshes ({e})", err=True
+        )
+        raise click.Abort() from e
+
+    click.echo(f"Edited {count} Sesh{'es' if count != 1 else ''}")
+
+
+@click.command()
+@click.argument("query", type=BasicSeshQuery())
+@click.option("--title", help="New title")
+@click.option("--details", help="New details")
+@click.option(
+    "-t",
+    "--tag",
+    "add_tags",
+    type=TagOption(),
+    help="Tags to add (comma-separated)",
+    default=[],
+)
+@click.option(
+    "--untag",
+    "remove_tags",
+    type=TagOption(),
+    help="Tags to remove (comma-separated)",
+    default=[],
+)
+@click.option("--yes", "-y", is_flag=True, help="Edit several Seshes without asking")
+@click.pass_obj
+def edit(
+    store: Store,
+    query: SeshQuery,
+    title: str | None,
+    details: str | None,
+    add_tags: list[Tag],
+    remove_tags: list[Tag],
+    yes: bool,
+):
+    """Change the title, details or tags of saved sessions.
+
+    QUERY selects the sessions; without changes they are only listed. Terms
+    are separated by spaces and all must match. Put -- before a query that
+    starts with -tag.
+
+    \b
+    Query terms:
+        +tag          has the tag
+        -tag          does not have the tag
+        since:DATE    started on or after DATE
+        until:DATE    started up to DATE (a date includes the whole day)
+        uid:PREFIX    id starts with PREFIX
+        word          title or details contain the word (word* for a prefix)
+
+    \b
+    Examples:
+        sesh edit uid:9a3bfe --title "fix login redirect"
+        sesh edit "+bug since:2025-06-01" -t backend
+        sesh edit -- "-review deploy until:2025-06-30" --untag wip -y
+    """
+    handle_edit(store, query, title, details, add_tags, remove_tags, yes)
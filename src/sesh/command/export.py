@@ -0,0 +1,153 @@
+from typing import TextIO
+
+import click
+from whenever import Instant
+
+from sesh.error import DatabaseError, MigrationError
+from sesh.exporter import FORMATS, WRITERS
+from sesh.parser.tag import Tag, TagOption
+from sesh.parser.timerange import TimeOption
+from sesh.projects import merge_seshes, open_stores, project_stores
+from sesh.store import Store
+
+
+def handle_export(
+    store: Store,
+    output: TextIO,
+    fmt: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+) -> None:
+    try:
+        count = WRITERS[fmt](store.iter_seshes(since, until, tags), output)
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error during export ({e})", err=True)
+        raise click.Abort() from e
+    except OSError as e:
+        click.echo(f"Error: Failed to write export ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Error: An unexpected error occurred during export ({e})", err=True)
+        raise click.Abort() from e
+
+    click.echo(f"Exported {count:,} Seshes", err=True)
+
+
+def handle_export_all(
+    store: Store,
+    output: TextIO,
+    fmt: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    rescan: bool,
+) -> None:
+    opened = []
+    try:
+        roots = project_stores(store.db_path.parent, rescan)
+        for root, project, error in open_stores(roots):
+            if error is not None:
+                click.echo(f"Warning: Skipped {root} ({error})", err=True)
+            else:
+                opened.append(project)
+        seshes = merge_seshes(
+            [project.iter_seshes(since, until, tags) for project in opened]
+        )
+        count = WRITERS[fmt](seshes, output)
+    except DatabaseError as e:
+        click.echo(f"Error: Database error during export ({e})", err=True)
+        raise click.Abort() from e
+    except OSError as e:
+        click.echo(f"Error: Failed to write export ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Error: An unexpected error occurred during export ({e})", err=True)
+        raise click.Abort() from e
+    finally:
+        for project in opened:
+            project.close()
+
+    click.echo(
+        f"Exported {count:,} Seshes from {len(opened)} of {len(roots)} Sesh stores",
+        err=True,
+    )
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(FORMATS),
+    default="csv",
+    show_default=True,
+    help="Output format",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w", encoding="utf-8", lazy=True),
+    default="-",
+    help="Output file (defaults to stdout)",
+)
+@click.option(
+    "--since", type=TimeOption(), help="Only sessions started on or after this date"
+)
+@click.option(
+    "--until", type=TimeOption(end=True), help="Only sessions started up to this date"
+)
+@click.option(
+    "-t",
+    "--tag",
+    "tags",
+    type=TagOption(),
+    help="Only sessions with all of these tags (comma-separated)",
+    default=[],
+)
+@click.option(
+    "--all",
+    "all_projects",
+    is_flag=True,
+    help="Export the sessions of every project under SESH_ROOTS",
+)
+@click.option(
+    "--rescan",
+    is_flag=True,
+    help="With --all, search for projects again instead of using the cache",
+)
+@click.pass_obj
+def export(
+    store: Store,
+    fmt: str,
+    output: TextIO,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    all_projects: bool,
+    rescan: bool,
+):
+    """Export completed sessions as CSV or JSON lines.
+
+    Sessions are streamed from the database in start time order, so exports
+    of very large histories use constant memory. CSV exports can be imported
+    again with 'sesh import'.
+
+    With --all, the sessions of every project found below the directories in
+    SESH_ROOTS (your home directory by default) are streamed together in
+    start time order.
+
+    \b
+    Examples:
+        sesh export > sessions.csv
+        sesh export -f jsonl -o sessions.jsonl
+        sesh export --since 2025-01-01 --until 2025-03-31 -t backend
+        sesh export --all -f jsonl -o everything.jsonl
+    """
+    if all_projects:
+        handle_export_all(store, output, fmt, since, until, tags, rescan)
+    else:
+        handle_export(store, output, fmt, since, until, tags)
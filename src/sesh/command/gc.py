@@ -0,0 +1,35 @@
+import click
+
+from sesh.error import DatabaseError, MigrationError
+from sesh.store import Store
+
+
+def handle_gc(store: Store) -> None:
+    try:
+        (links, tags) = store.collect_garbage()
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while collecting garbage ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while collecting garbage ({e})",
+            err=True,
+        )
+        raise click.Abort() from e
+
+    click.echo(f"Removed {links:,} orphaned tag links and {tags:,} unused tags")
+
+
+@click.command()
+@click.pass_obj
+def gc(store: Store):
+    """Remove orphaned tag links and unused tags.
+
+    Stores written by older versions of Sesh may hold links between sessions
+    and tags that no longer exist. This deletes them, and every tag that no
+    session uses, in bulk. Built-in tags are kept.
+    """
+    handle_gc(store)
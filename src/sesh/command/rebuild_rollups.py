@@ -0,0 +1,35 @@
+import click
+
+from sesh.error import DatabaseError, MigrationError
+from sesh.store import Store
+
+
+def handle_rebuild_rollups(store: Store) -> None:
+    try:
+        count = store.rebuild_rollups()
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while rebuilding rollups ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while rebuilding rollups ({e})",
+            err=True,
+        )
+        raise click.Abort() from e
+
+    click.echo(f"Rebuilt {count:,} daily rollups")
+
+
+@click.command("rebuild-rollups")
+@click.pass_obj
+def rebuild_rollups(store: Store):
+    """Recompute the daily rollups used by reports.
+
+    Rollups are kept up to date automatically. Use this to repair them if
+    reports disagree with the saved sessions, e.g. after editing the
+    database by hand.
+    """
+    handle_rebuild_rollups(store)
@@ -0,0 +1,160 @@
+import click
+from whenever import Instant, TimeDelta
+
+from sesh.command.status import format_elapsed_time
+from sesh.error import DatabaseError, MigrationError
+from sesh.parser.tag import Tag, TagOption
+from sesh.parser.timerange import TimeOption
+from sesh.projects import map_stores, merge_reports, project_stores, store_report
+from sesh.store import REPORT_PERIODS, Store
+
+REPORT_GROUPS = ("tag", *REPORT_PERIODS)
+
+
+def format_report(group_by: str, rows: list[tuple[str, int, int]]) -> list[str]:
+    width = max([len(group_by), *(len(str(key)) for key, _, _ in rows)])
+    lines = [f"{group_by.capitalize():<{width}}  {'Sessions':>8}  Duration"]
+    for key, count, seconds in rows:
+        duration = format_elapsed_time(TimeDelta(seconds=round(seconds)))
+        lines.append(f"{key:<{width}}  {count:>8}  {duration}")
+
+    # a Sesh with several tags counts towards each of them, so only time
+    # groups add up to a meaningful total
+    if group_by != "tag" and rows:
+        count = sum(row[1] for row in rows)
+        duration = format_elapsed_time(
+            TimeDelta(seconds=round(sum(row[2] for row in rows)))
+        )
+        lines.append(f"{'Total':<{width}}  {count:>8}  {duration}")
+    return lines
+
+
+def handle_report(
+    store: Store,
+    group_by: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+) -> None:
+    try:
+        rows = store.report(group_by, since, until, tags)
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while building report ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while building report ({e})",
+            err=True,
+        )
+        raise click.Abort() from e
+
+    print_report(group_by, rows)
+
+
+def handle_report_all(
+    store: Store,
+    group_by: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    rescan: bool,
+) -> None:
+    try:
+        roots = project_stores(store.db_path.parent, rescan)
+        reports = []
+        for root, rows, error in map_stores(
+            store_report, roots, group_by, since, until, tags
+        ):
+            if error is not None:
+                click.echo(f"Warning: Skipped {root} ({error})", err=True)
+            else:
+                reports.append(rows)
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while building report ({e})",
+            err=True,
+        )
+        raise click.Abort() from e
+
+    click.echo(f"Read {len(reports)} of {len(roots)} Sesh stores", err=True)
+    print_report(group_by, merge_reports(group_by, reports))
+
+
+def print_report(group_by: str, rows: list[tuple[str, int, int]]) -> None:
+    if not rows:
+        click.echo("No Seshes found")
+        return
+    for line in format_report(group_by, rows):
+        click.echo(line)
+
+
+@click.command()
+@click.option(
+    "-g",
+    "--by",
+    "group_by",
+    type=click.Choice(REPORT_GROUPS),
+    default="tag",
+    show_default=True,
+    help="How to group sessions",
+)
+@click.option(
+    "--since", type=TimeOption(), help="Only sessions started on or after this date"
+)
+@click.option(
+    "--until", type=TimeOption(end=True), help="Only sessions started up to this date"
+)
+@click.option(
+    "-t",
+    "--tag",
+    "tags",
+    type=TagOption(),
+    help="Only sessions with all of these tags (comma-separated)",
+    default=[],
+)
+@click.option(
+    "--all",
+    "all_projects",
+    is_flag=True,
+    help="Add up the sessions of every project under SESH_ROOTS",
+)
+@click.option(
+    "--rescan",
+    is_flag=True,
+    help="With --all, search for projects again instead of using the cache",
+)
+@click.pass_obj
+def report(
+    store: Store,
+    group_by: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    all_projects: bool,
+    rescan: bool,
+):
+    """Summarize time spent per tag, day, week or month.
+
+    Totals are read from daily rollups kept by the database, so reports stay
+    fast on large histories. Time is split across the UTC days a session
+    covers, while each session is counted in the period it started in.
+
+    With --all, the stores of every project found below the directories in
+    SESH_ROOTS (your home directory by default) are read in parallel and
+    their totals added up. The projects found are cached for a day.
+
+    \b
+    Examples:
+        sesh report
+        sesh report --by day --since 2025-06-01
+        sesh report --by week -t backend
+        sesh report --by month --since 2025-01-01 --until 2025-12-31
+        sesh report --all --by week
+    """
+    if all_projects:
+        handle_report_all(store, group_by, since, until, tags, rescan)
+    else:
+        handle_report(store, group_by, since, until, tags)
@@ -1,9 +1,73 @@
+import click
+
+from sesh.error import (
+    DatabaseError,
+    LockTimeoutError,
+    MigrationError,
+    SessionStorageError,
+)
 from sesh.store import Store
 
 
 def handle_reset(store: Store) -> None:
-    # clear current sesh - will raise SessionStorageError if it fails
-    store.current_manager.pop()
+    # no start or stop may run in between
+    with store.lock:
+        # clear current sesh - will raise SessionStorageError if it fails
+        store.current_manager.clear()
+
+        # delete data rows - will raise DatabaseError if it fails
+        store.reset_data()
+
+
+@click.command()
+@click.option(
+    "--yes",
+    "-y",
+    is_flag=True,
+    help="Skip confirmation prompt",
+    prompt="Are you sure you want to reset all data?",
+)
+@click.pass_obj
+def reset(store: Store, yes: bool):
+    """Reset all session data and clear current session.
+
+    WARNING: This is a destructive operation that will permanently delete
+    ALL session history and stop any currently active session.
+
+    \b
+    This command will:
+        - Stop the current session (if active) without saving
+        - Delete all completed session records
+        - Clear all tag data
+        - Reset the database to empty state
+
+    \b
+    Examples:
+        sesh reset          # Prompts for confirmation
+        sesh reset -y       # Skip confirmation prompt
+
+    Use this when you want to start fresh or clear out test data.
+    There is no way to recover deleted data after reset.
+    """
+    if not yes:
+        click.echo("Reset cancelled.")
+        return
 
-    # delete data rows - will raise DatabaseError if it fails
-    store.reset_data()
+    try:
+        handle_reset(store)
+        click.echo("Reset completed successfully.")
+    except LockTimeoutError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+    except SessionStorageError as e:
+        click.echo(f"Error: Failed to clear current session ({e})", err=True)
+        raise click.Abort() from e
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error during reset ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Error: An unexpected error occurred during reset ({e})", err=True)
+        raise click.Abort() from e
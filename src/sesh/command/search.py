@@ -0,0 +1,101 @@
+import click
+from whenever import Instant
+
+from sesh.command.status import format_elapsed_time
+from sesh.error import DatabaseError, MigrationError
+from sesh.parser.tag import Tag, TagOption
+from sesh.parser.timerange import TimeOption
+from sesh.store import SEARCH_LIMIT, SHORT_UID_LENGTH, Store
+
+# Matched words are highlighted in bold, click strips the codes when not a tty
+HIGHLIGHT = ("\x1b[1m", "\x1b[22m")
+
+
+def format_result(
+    sesh_uid: str, title: str, start: str, end: str, tags: str, snippet: str
+) -> list[str]:
+    start_time = Instant.parse_common_iso(start)
+    duration = format_elapsed_time(Instant.parse_common_iso(end) - start_time)
+    started = start_time.to_system_tz().py_datetime().strftime("%Y-%m-%d %H:%M")
+    line = f"{sesh_uid[:SHORT_UID_LENGTH]}  {started}  {duration:>10}  {title}"
+    if tags:
+        line += f"  [{tags.replace(',', ', ')}]"
+    return [line, f"    {snippet}"]
+
+
+def handle_search(
+    store: Store,
+    text: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    limit: int,
+) -> None:
+    try:
+        results = store.search(text, since, until, tags, limit, HIGHLIGHT)
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error during search ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(f"Error: An unexpected error occurred during search ({e})", err=True)
+        raise click.Abort() from e
+
+    if not results:
+        click.echo("No Seshes found")
+        return
+    for result in results:
+        for line in format_result(*result):
+            click.echo(line)
+
+
+@click.command()
+@click.argument("text", nargs=-1, required=True)
+@click.option(
+    "--since", type=TimeOption(), help="Only sessions started on or after this date"
+)
+@click.option(
+    "--until", type=TimeOption(end=True), help="Only sessions started up to this date"
+)
+@click.option(
+    "-t",
+    "--tag",
+    "tags",
+    type=TagOption(),
+    help="Only sessions with all of these tags (comma-separated)",
+    default=[],
+)
+@click.option(
+    "-n",
+    "--limit",
+    type=click.IntRange(min=1),
+    default=SEARCH_LIMIT,
+    show_default=True,
+    help="Maximum number of sessions to show",
+)
+@click.pass_obj
+def search(
+    store: Store,
+    text: tuple[str, ...],
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+    limit: int,
+):
+    """Find past sessions by words in their title or details.
+
+    Sessions containing every word are listed best match first, with a
+    snippet of the matching text. Words also match other forms of the same
+    word, and a trailing * matches any word starting with it.
+
+    TEXT: Words to search for
+
+    \b
+    Examples:
+        sesh search auth migration
+        sesh search deploy* --since 2025-01-01
+        sesh search flaky test -t ci -n 5
+    """
+    handle_search(store, " ".join(text), since, until, tags, limit)
@@ -0,0 +1,58 @@
+import click
+from whenever import Instant
+
+from sesh.command.status import format_elapsed_time, format_start_time
+from sesh.error import (
+    AmbiguousSeshError,
+    DatabaseError,
+    MigrationError,
+    SeshNotFoundError,
+)
+from sesh.store import Store
+
+
+def handle_show(store: Store, uid: str) -> None:
+    try:
+        (sesh_uid, title, details, start, end, tags) = store.get_sesh(uid)
+    except (SeshNotFoundError, AmbiguousSeshError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while reading Sesh ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while reading Sesh ({e})", err=True
+        )
+        raise click.Abort() from e
+
+    start_time = Instant.parse_common_iso(start)
+    end_time = Instant.parse_common_iso(end)
+    click.echo(f"Sesh: {title}")
+    click.echo(f"Id: {sesh_uid}")
+    click.echo(f"Tags: {tags.replace(',', ', ')}")
+    click.echo(f"Start time: {format_start_time(start_time)}")
+    click.echo(f"End time: {format_start_time(end_time)}")
+    click.echo(f"Duration: {format_elapsed_time(end_time - start_time)}")
+    if details:
+        click.echo(f"Details: {details}")
+
+
+@click.command()
+@click.argument("uid")
+@click.pass_obj
+def show(store: Store, uid: str):
+    """Show a saved session.
+
+    UID: Session id, or any unique prefix of it such as the short id
+    printed by 'sesh stop'
+
+    \b
+    Examples:
+        sesh show 3fa2c1
+        sesh show 3fa2c1e9b04d
+    """
+    handle_show(store, uid)
@@ -1,7 +1,12 @@
 import click
 
-from sesh.error import DatabaseError, SeshInProgressError, SessionStorageError
-from sesh.parser.tag import Tag
+from sesh.error import (
+    DatabaseError,
+    LockTimeoutError,
+    SeshInProgressError,
+    SessionStorageError,
+)
+from sesh.parser.tag import Tag, TagOption, parse_tags_bulk
 from sesh.store import Store
 
 
@@ -13,26 +18,31 @@ class StartArg(click.ParamType):
             return value
 
         if value.startswith("+"):
-            if Tag.validate_tag_name(value[1:]):
-                return Tag(value[1:])
-            # Use UsageError for cleaner error messages
-            raise click.UsageError(f"Invalid inline tag ({value[1:]})")
+            # inline tags are taken as written, "+Python" is not a tag
+            (tags, errors) = parse_tags_bulk(
+                [value[1:]], separator=None, normalize=False
+            )
+            if errors:
+                # Use UsageError for cleaner error messages
+                raise click.UsageError(f"Invalid inline tag ({value[1:]})")
+            return tags[0]
 
         return value
 
 
 def handle_start(store: Store, tags: list[Tag], arg: tuple[str | Tag]) -> None:
     try:
-        # combine tags
-        tags += [t for t in arg if isinstance(t, Tag)]
+        # combine tags into a new list, click shares the option default
+        # between invocations, e.g. all requests served by sesh daemon
+        tags = [*tags, *(t for t in arg if isinstance(t, Tag))]
 
         # make title
         title = " ".join(map(str, arg))
 
         # delegate work to store
         store.start_sesh(title, tags)
-    except SeshInProgressError:
-        # Re-raise this specific error to be handled by CLI
+    except (SeshInProgressError, LockTimeoutError):
+        # Re-raise these specific errors to be handled by CLI
         raise
     except (DatabaseError, SessionStorageError):
         # Re-raise these errors to be handled by CLI
@@ -40,3 +50,55 @@ def handle_start(store: Store, tags: list[Tag], arg: tuple[str | Tag]) -> None:
     except Exception as e:
         # Convert any unexpected errors to DatabaseError for consistency
         raise DatabaseError(f"Failed to start session: {e}") from e
+
+
+@click.command()
+@click.option(
+    "-t",
+    "--tag",
+    "tags",
+    type=TagOption(),
+    help="Additional tags to assign (comma-separated)",
+    default=[],
+)
+@click.argument("arg", nargs=-1, type=StartArg())
+@click.pass_obj
+def start(store: Store, tags: list[Tag], arg: tuple[str | Tag]):
+    """Start a new work session.
+
+    Begin tracking a new session with a descriptive title. Words in the title
+    can include inline tags by prefixing them with '+' (e.g., +python, +bug-fix).
+    These tagged words will be extracted as tags while remaining part of the title.
+
+    ARG: The session title with optional inline tags
+
+    \b
+    Examples:
+        sesh start working on documentation
+        sesh start fix +bug in authentication system
+        sesh start +python +web-dev building new API
+        sesh start -t urgent,review code review session
+
+    Tags help organize and categorize your sessions for better tracking.
+    Use lowercase letters, numbers, and hyphens only in tag names.
+    """
+    # check that arg is non-empty
+    if not arg:
+        click.echo("Error: No argument provided for start command.", err=True)
+        raise click.Abort()
+
+    try:
+        handle_start(store, tags, arg)
+        click.echo("Sesh started successfully.")
+    except (SeshInProgressError, LockTimeoutError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+    except DatabaseError as e:
+        click.echo(f"Error: Database error while starting Sesh ({e})", err=True)
+        raise click.Abort() from e
+    except Exception as e:
+        click.echo(
+            f"Error: An unexpected error occurred while starting the Sesh ({e})",
+            err=True,
+        )
+        raise click.Abort() from e
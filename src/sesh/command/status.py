@@ -2,6 +2,8 @@ import click
 from whenever import Instant, TimeDelta
 
 from sesh.error import SessionStorageError
+from sesh.paths import DATABASE_STORAGE
+from sesh.prompt import prompt_line
 from sesh.store import Store
 
 
@@ -41,3 +43,53 @@ def handle_status(store: Store) -> None:
             f"Error: An unexpected error occurred while reading status ({e})", err=True
         )
         raise click.Abort() from e
+
+
+def handle_prompt_status(store: Store) -> None:
+    try:
+        line = prompt_line(
+            store.current_path,
+            store.db_path if store.config.current_storage == DATABASE_STORAGE else None,
+        )
+        if line:
+            click.echo(line)
+    except SessionStorageError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+
+
+@click.command()
+@click.option(
+    "--prompt",
+    is_flag=True,
+    help="Print a single compact line suitable for shell prompts",
+)
+@click.pass_obj
+def status(store: Store, prompt: bool):
+    """Display information about the current work session.
+
+    Shows details about the currently active session including title,
+    assigned tags, start time, and elapsed duration. If no session is
+    active, displays a helpful message.
+
+    \b
+    Examples:
+        sesh status
+        sesh status --prompt
+
+    \b
+    Output includes:
+        - Session title
+        - Assigned tags
+        - Start time (formatted for your timezone)
+        - Elapsed time (human-readable format)
+
+    Use this command to quickly check your current session progress
+    or verify that a session is running as expected. With --prompt, only
+    the title and elapsed time are printed, and nothing when no session
+    is active.
+    """
+    if prompt:
+        handle_prompt_status(store)
+    else:
+        handle_status(store)
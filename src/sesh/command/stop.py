@@ -1,7 +1,12 @@
 import click
 
-from sesh.error import DatabaseError, NoActiveSeshError
-from sesh.parser.tag import Tag
+from sesh.error import (
+    DatabaseError,
+    LockTimeoutError,
+    MigrationError,
+    NoActiveSeshError,
+)
+from sesh.parser.tag import Tag, TagOption
 from sesh.store import Store
 
 
@@ -13,6 +18,12 @@ def handle_stop(store: Store, tags: list[Tag], details: str) -> None:
     except NoActiveSeshError:
         click.echo("Error: No active Sesh to stop", err=True)
         raise click.Abort() from None
+    except LockTimeoutError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort() from e
+    except MigrationError as e:
+        click.echo(f"Error: Failed to initialize store ({e})", err=True)
+        raise click.Abort() from e
     except DatabaseError as e:
         click.echo(f"Error: Database error while stopping Sesh ({e})", err=True)
         raise click.Abort() from e
@@ -22,3 +33,36 @@ def handle_stop(store: Store, tags: list[Tag], details: str) -> None:
             err=True,
         )
         raise click.Abort() from e
+
+
+@click.command()
+@click.option(
+    "-t",
+    "--tag",
+    "tags",
+    type=TagOption(),
+    help="Additional tags to add when stopping (comma-separated)",
+    default=[],
+)
+@click.argument("details", default="")
+@click.pass_obj
+def stop(store: Store, tags: list[Tag], details: str):
+    """Stop the current work session.
+
+    End the currently active session and save it to your session history.
+    Optionally provide completion details and additional tags to better
+    categorize and document what was accomplished.
+
+    DETAILS: Optional description of what was completed or achieved
+
+    \b
+    Examples:
+        sesh stop
+        sesh stop "completed user authentication feature"
+        sesh stop -t completed,tested "finished API endpoints"
+        sesh stop "need to continue tomorrow" -t incomplete
+
+    Additional tags specified with -t will be merged with any existing
+    tags from when the session was started.
+    """
+    handle_stop(store, tags, details)
@@ -0,0 +1,216 @@
+"""Runtime settings.
+
+Settings are read from ``config.toml`` in the Sesh directory and from
+``SESH_*`` environment variables, which take precedence so they can be set
+per shell or per project with tools like direnv.
+"""
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sesh.error import ConfigError
+from sesh.paths import (
+    CONFIG_TOML,
+    DATABASE_STORAGE,
+    ENV_CURRENT_STORAGE,
+    FILE_STORAGE,
+)
+
+# Encodings of the current Sesh file. Both are always readable, the setting
+# only picks what is written.
+CURRENT_FORMATS = ("json", "binary")
+DEFAULT_CURRENT_FORMAT = "json"
+DEFAULT_FSYNC = True
+
+CURRENT_STORAGES = (FILE_STORAGE, DATABASE_STORAGE)
+DEFAULT_CURRENT_STORAGE = FILE_STORAGE
+
+# SQLite connection profiles, applied as PRAGMAs when the database is opened.
+# "default" keeps SQLite's defaults; "tuned" uses WAL, a 64 MiB page cache and
+# memory-mapped reads, which favours reports and exports on large stores.
+DB_PROFILES: dict[str, dict[str, int | str]] = {
+    "default": {},
+    "tuned": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65_536,
+        "mmap_size": 1 << 30,
+        "temp_store": "MEMORY",
+    },
+}
+DEFAULT_DB_PROFILE = "default"
+
+# Prepared statements kept per connection (sqlite3.connect cached_statements)
+PROFILE_CACHED_STATEMENTS = {"default": 128, "tuned": 512}
+
+# PRAGMAs that can be overridden in the [database] table of config.toml, with
+# their allowed keywords, or int for numeric values
+DB_PRAGMAS: dict[str, tuple[str, ...] | type[int]] = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "cache_size": int,
+    "mmap_size": int,
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+}
+
+ENV_CURRENT_FORMAT = "SESH_CURRENT_FORMAT"
+ENV_FSYNC = "SESH_FSYNC"
+ENV_DB_PROFILE = "SESH_DB_PROFILE"
+
+# config.toml keys and the environment variables they stand for
+FILE_SETTINGS = {
+    "current_format": ENV_CURRENT_FORMAT,
+    "fsync": ENV_FSYNC,
+    "current_storage": ENV_CURRENT_STORAGE,
+}
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    # encoding used when writing the current Sesh file
+    current_format: str = DEFAULT_CURRENT_FORMAT
+    # flush the current Sesh file and its directory to disk on every write
+    fsync: bool = DEFAULT_FSYNC
+    # keep the active Sesh in current.json or in the database
+    current_storage: str = DEFAULT_CURRENT_STORAGE
+    # named set of connection PRAGMAs, see DB_PROFILES
+    db_profile: str = DEFAULT_DB_PROFILE
+    # PRAGMAs and statement cache size overriding the profile
+    db_pragmas: tuple[tuple[str, int | str], ...] = ()
+    cached_statements: int | None = None
+
+    @classmethod
+    def load(cls, root: Path, environ: Mapping[str, str] = os.environ) -> "Config":
+        """Read ``root/config.toml``, then apply environment overrides."""
+        path = root / CONFIG_TOML
+        if not path.exists():
+            return cls.from_env(environ)
+
+        settings = read_config_file(path)
+        database = settings.pop("database", {})
+        if not isinstance(database, dict):
+            raise ConfigError(f"{CONFIG_TOML}: [database] must be a table")
+
+        values = {}
+        for key, value in settings.items():
+            if key not in FILE_SETTINGS:
+                raise ConfigError(f"{CONFIG_TOML}: unknown setting {key!r}")
+            values[FILE_SETTINGS[key]] = format_setting(key, value)
+        if "profile" in database:
+            values[ENV_DB_PROFILE] = format_setting("profile", database.pop("profile"))
+
+        cached_statements = database.pop("cached_statements", None)
+        if cached_statements is not None and (
+            type(cached_statements) is not int or cached_statements < 0
+        ):
+            raise ConfigError(
+                f"{CONFIG_TOML}: cached_statements must be a non-negative integer"
+            )
+
+        config = cls.from_env({**values, **environ})
+        return cls(
+            current_format=config.current_format,
+            fsync=config.fsync,
+            current_storage=config.current_storage,
+            db_profile=config.db_profile,
+            db_pragmas=parse_pragmas(database),
+            cached_statements=cached_statements,
+        )
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "Config":
+        current_format = environ.get(ENV_CURRENT_FORMAT, DEFAULT_CURRENT_FORMAT).lower()
+        if current_format not in CURRENT_FORMATS:
+            raise ConfigError(
+                f"{ENV_CURRENT_FORMAT} must be one of {', '.join(CURRENT_FORMATS)}"
+            )
+        current_storage = environ.get(
+            ENV_CURRENT_STORAGE, DEFAULT_CURRENT_STORAGE
+        ).lower()
+        if current_storage not in CURRENT_STORAGES:
+            raise ConfigError(
+                f"{ENV_CURRENT_STORAGE} must be one of {', '.join(CURRENT_STORAGES)}"
+            )
+        db_profile = environ.get(ENV_DB_PROFILE, DEFAULT_DB_PROFILE).lower()
+        if db_profile not in DB_PROFILES:
+            raise ConfigError(
+                f"{ENV_DB_PROFILE} must be one of {', '.join(DB_PROFILES)}"
+            )
+        return cls(
+            current_format=current_format,
+            fsync=parse_bool(ENV_FSYNC, environ.get(ENV_FSYNC), DEFAULT_FSYNC),
+            current_storage=current_storage,
+            db_profile=db_profile,
+        )
+
+    def connection_pragmas(self) -> dict[str, int | str]:
+        """PRAGMAs to run on a new connection, in order."""
+        pragmas = {**DB_PROFILES[self.db_profile], **dict(self.db_pragmas)}
+        # the active Sesh is written on every start and stop, which WAL turns
+        # into appends that need no fsync until checkpoint
+        if self.current_storage == DATABASE_STORAGE:
+            pragmas.setdefault("journal_mode", "WAL")
+            pragmas.setdefault("synchronous", "NORMAL")
+        return pragmas
+
+    def statement_cache_size(self) -> int:
+        if self.cached_statements is not None:
+            return self.cached_statements
+        return PROFILE_CACHED_STATEMENTS[self.db_profile]
+
+
+def read_config_file(path: Path) -> dict[str, Any]:
+    # only loaded when a config file exists
+    import tomllib
+
+    try:
+        with path.open("rb") as f:
+            return tomllib.load(f)
+    except OSError as e:
+        raise ConfigError(f"Failed to read {path}: {e}") from e
+    except tomllib.TOMLDecodeError as e:
+        raise ConfigError(f"Invalid {path.name}: {e}") from e
+
+
+def format_setting(key: str, value: Any) -> str:
+    """Turn a config file value into its environment variable form."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, str):
+        return value
+    raise ConfigError(f"{CONFIG_TOML}: {key} must be a string or a boolean")
+
+
+def parse_pragmas(table: Mapping[str, Any]) -> tuple[tuple[str, int | str], ...]:
+    pragmas = []
+    for name, value in table.items():
+        if name not in DB_PRAGMAS:
+            raise ConfigError(f"{CONFIG_TOML}: unknown database setting {name!r}")
+        allowed = DB_PRAGMAS[name]
+        if allowed is int:
+            if type(value) is not int:
+                raise ConfigError(f"{CONFIG_TOML}: {name} must be an integer")
+        elif not isinstance(value, str) or value.upper() not in allowed:
+            raise ConfigError(
+                f"{CONFIG_TOML}: {name} must be one of {', '.join(allowed)}"
+            )
+        else:
+            value = value.upper()
+        pragmas.append((name, value))
+    return tuple(pragmas)
+
+
+def parse_bool(name: str, value: str | None, default: bool) -> bool:
+    if value is None or value == "":
+        return default
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise ConfigError(f"{name} must be a boolean (1/0, true/false, yes/no, on/off)")
@@ -1,10 +1,17 @@
+import contextlib
 import json
+import os
+import sqlite3
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
 from whenever import Instant
 
-from sesh.error import InvalidSeshDataError, SessionStorageError
+from sesh import trace
+from sesh.config import Config
+from sesh.current_binary import is_binary, pack_current, unpack_current
+from sesh.error import InvalidSeshDataError, SeshInProgressError, SessionStorageError
 from sesh.parser.tag import Tag
 
 
@@ -16,22 +23,54 @@ class CurrentSesh:
 
 
 class CurrentManager:
-    def __init__(self, current_path: Path) -> None:
+    """Reads and writes the current Sesh file.
+
+    Writes go to a temporary file that atomically replaces the current one, so
+    a crash leaves either the old or the new file, never a truncated one. The
+    file is JSON or, with ``current_format = "binary"``, the compact encoding
+    of sesh.current_binary; both are read regardless of the setting.
+    """
+
+    def __init__(self, current_path: Path, config: Config | None = None) -> None:
         self.current_path = current_path
+        self.config = config if config is not None else Config.from_env()
+
+    def start(self, sesh: CurrentSesh) -> None:
+        """Make ``sesh`` the current Sesh, or raise SeshInProgressError."""
+        if self.read() is not None:
+            raise SeshInProgressError()
+        self.write(sesh)
+
+    def begin_stop(self) -> None | CurrentSesh:
+        """Return the Sesh being stopped, removed by finish_stop once saved."""
+        return self.read()
+
+    def finish_stop(self) -> None:
+        self.clear()
 
     def pop(self) -> None | CurrentSesh:
         current_session = self.read()
         if current_session is not None:
-            try:
-                self.current_path.unlink()
-            except OSError as e:
-                raise SessionStorageError(f"Failed to remove session file: {e}") from e
+            self.clear()
         return current_session
 
+    def clear(self) -> None:
+        """Remove the current Sesh file without reading it."""
+        try:
+            with trace.span("remove current"):
+                self.current_path.unlink(missing_ok=True)
+        except OSError as e:
+            raise SessionStorageError(f"Failed to remove session file: {e}") from e
+
     def read(self) -> None | CurrentSesh:
         try:
-            with self.current_path.open("r") as f:
-                data = json.load(f)
+            with trace.span("read current"), self.current_path.open("rb") as f:
+                raw = f.read()
+
+            if is_binary(raw):
+                return CurrentManager.decode_binary(raw)
+
+            data = json.loads(raw)
 
             # Ensure the root object is a dict
             if not isinstance(data, dict):
@@ -56,13 +95,44 @@ class CurrentManager:
 
     def write(self, sesh: CurrentSesh) -> None:
         try:
-            with self.current_path.open("w") as f:
-                json.dump(sesh, f, default=CurrentManager.encode_session)
-        except OSError as e:
-            raise SessionStorageError(f"Failed to write session file: {e}") from e
+            if self.config.current_format == "binary":
+                data = CurrentManager.encode_binary(sesh)
+            else:
+                data = json.dumps(CurrentManager.encode_session(sesh)).encode()
         except (TypeError, ValueError) as e:
             raise SessionStorageError(f"Failed to serialize session data: {e}") from e
 
+        try:
+            with trace.span("write current"):
+                self.replace_atomically(data)
+        except OSError as e:
+            raise SessionStorageError(f"Failed to write session file: {e}") from e
+
+    def replace_atomically(self, data: bytes) -> None:
+        """Write ``data`` to a temporary file and rename it over the current one."""
+        tmp_path = self.current_path.with_name(
+            f".{self.current_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            with tmp_path.open("wb") as f:
+                f.write(data)
+                if self.config.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.current_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+
+        # persist the rename itself, directories cannot be opened on Windows
+        if self.config.fsync and hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.current_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
     @staticmethod
     def encode_session(obj: CurrentSesh) -> dict:
         return {
@@ -86,3 +156,165 @@ class CurrentManager:
             tags=[Tag(name) for name in data["tags"]],
             start_time=Instant.parse_common_iso(data["start_time"]),
         )
+
+    @staticmethod
+    def encode_binary(obj: CurrentSesh) -> bytes:
+        return pack_current(
+            obj.title,
+            [str(t) for t in obj.tags],
+            obj.start_time.round().timestamp_nanos(),
+        )
+
+    @staticmethod
+    def decode_binary(data: bytes) -> CurrentSesh:
+        (title, tag_names, start_ns) = unpack_current(data)
+        return CurrentSesh(
+            title=title,
+            tags=[Tag(name) for name in tag_names],
+            start_time=Instant.from_timestamp_nanos(start_ns),
+        )
+
+
+class DbCurrentManager:
+    """Keeps the current Sesh in the ``active_sesh`` table.
+
+    Used with ``current_storage = "database"``. Starting is one INSERT that the
+    table's single-row key turns into the in-progress check, and stopping
+    deletes the row in the same transaction that saves the Sesh, so a crash
+    never loses or duplicates a session. A current.json left from file storage
+    is moved into the table on first use.
+    """
+
+    def __init__(
+        self,
+        get_conn: Callable[[], sqlite3.Connection],
+        current_path: Path,
+        config: Config | None = None,
+    ) -> None:
+        # a callable so the database is only opened when the Sesh is used
+        self.get_conn = get_conn
+        self.current_path = current_path
+        self.config = config if config is not None else Config.from_env()
+        self.adopted = False
+
+    def start(self, sesh: CurrentSesh) -> None:
+        db_conn = self.adopt_file()
+        try:
+            with db_conn:
+                db_conn.execute(
+                    "INSERT INTO active_sesh (id, title, tags, start_time) "
+                    "VALUES (1, ?, ?, ?)",
+                    DbCurrentManager.encode_row(sesh),
+                )
+        except sqlite3.IntegrityError as e:
+            if db_conn.execute("SELECT 1 FROM active_sesh WHERE id = 1").fetchone():
+                raise SeshInProgressError() from e
+            raise SessionStorageError(f"Failed to save active session: {e}") from e
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to save active session: {e}") from e
+
+    def begin_stop(self) -> None | CurrentSesh:
+        """Remove and return the current Sesh inside the caller's transaction.
+
+        The row comes back if the transaction is rolled back.
+        """
+        db_conn = self.adopt_file()
+        try:
+            row = db_conn.execute(
+                "DELETE FROM active_sesh WHERE id = 1 RETURNING title, tags, start_time"
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to read active session: {e}") from e
+        return None if row is None else DbCurrentManager.decode_row(row)
+
+    def finish_stop(self) -> None:
+        # the row was deleted with the saved Sesh
+        pass
+
+    def pop(self) -> None | CurrentSesh:
+        db_conn = self.adopt_file()
+        try:
+            with db_conn:
+                return self.begin_stop()
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to remove active session: {e}") from e
+
+    def clear(self) -> None:
+        db_conn = self.adopt_file()
+        try:
+            with db_conn:
+                db_conn.execute("DELETE FROM active_sesh")
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to remove active session: {e}") from e
+
+    def read(self) -> None | CurrentSesh:
+        db_conn = self.adopt_file()
+        try:
+            row = db_conn.execute(
+                "SELECT title, tags, start_time FROM active_sesh WHERE id = 1"
+            ).fetchone()
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to read active session: {e}") from e
+        return None if row is None else DbCurrentManager.decode_row(row)
+
+    def write(self, sesh: CurrentSesh) -> None:
+        db_conn = self.adopt_file()
+        try:
+            with db_conn:
+                db_conn.execute(
+                    "INSERT OR REPLACE INTO active_sesh (id, title, tags, start_time) "
+                    "VALUES (1, ?, ?, ?)",
+                    DbCurrentManager.encode_row(sesh),
+                )
+        except sqlite3.Error as e:
+            raise SessionStorageError(f"Failed to save active session: {e}") from e
+
+    def adopt_file(self) -> sqlite3.Connection:
+        """Move a current Sesh file into the table, once per manager.
+
+        Raises SessionStorageError when both hold an active Sesh, rather than
+        guess which one is current.
+        """
+        db_conn = self.get_conn()
+        if self.adopted:
+            return db_conn
+
+        sesh = CurrentManager(self.current_path, self.config).read()
+        if sesh is not None:
+            try:
+                with db_conn:
+                    db_conn.execute(
+                        "INSERT INTO active_sesh (id, title, tags, start_time) "
+                        "VALUES (1, ?, ?, ?)",
+                        DbCurrentManager.encode_row(sesh),
+                    )
+            except sqlite3.IntegrityError as e:
+                raise SessionStorageError(
+                    f"An active session exists both in {self.current_path.name} "
+                    "and in the database, stop or remove one of them"
+                ) from e
+            except sqlite3.Error as e:
+                raise SessionStorageError(
+                    f"Failed to move {self.current_path.name} into the database: {e}"
+                ) from e
+            CurrentManager(self.current_path, self.config).clear()
+
+        self.adopted = True
+        return db_conn
+
+    @staticmethod
+    def encode_row(obj: CurrentSesh) -> tuple[str, str, int]:
+        return (
+            obj.title,
+            ",".join(str(t) for t in obj.tags),
+            obj.start_time.round().timestamp(),
+        )
+
+    @staticmethod
+    def decode_row(row: tuple[str, str, int]) -> CurrentSesh:
+        (title, tags, start_time) = row
+        return CurrentSesh(
+            title=title,
+            tags=[Tag(name) for name in tags.split(",") if name],
+            start_time=Instant.from_timestamp(start_time),
+        )
@@ -0,0 +1,55 @@
+"""Compact binary encoding of the current Sesh.
+
+Layout, little endian::
+
+    magic "SESH" | version u8 | start time i64 (ns since epoch)
+    | title length u16 | tags length u16 | title (UTF-8) | tags (comma-separated)
+
+The fixed header lets readers such as the prompt status line pick out the
+start time and title with one unpack and one decode. Like sesh.prompt, this
+module only uses the standard library.
+"""
+
+import struct
+
+MAGIC = b"SESH"
+VERSION = 1
+HEADER = struct.Struct("<4sBqHH")
+
+
+def is_binary(data: bytes) -> bool:
+    return data.startswith(MAGIC)
+
+
+def pack_current(title: str, tags: list[str], start_ns: int) -> bytes:
+    """Encode the current Sesh, raising ValueError if it does not fit the header."""
+    title_bytes = title.encode("utf-8")
+    tag_bytes = ",".join(tags).encode("ascii")
+    try:
+        header = HEADER.pack(MAGIC, VERSION, start_ns, len(title_bytes), len(tag_bytes))
+    except struct.error as e:
+        # lengths are u16, so titles are limited to 65535 UTF-8 bytes
+        raise ValueError(f"Session too large for the binary format ({e})") from e
+    return header + title_bytes + tag_bytes
+
+
+def unpack_header(data: bytes) -> tuple[int, int, int]:
+    """Return ``(start_ns, title length, tags length)``, raising ValueError."""
+    try:
+        (magic, version, start_ns, title_len, tags_len) = HEADER.unpack_from(data)
+    except struct.error as e:
+        raise ValueError("Truncated binary session file") from e
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Unsupported binary session file (version {version})")
+    if len(data) != HEADER.size + title_len + tags_len:
+        raise ValueError("Truncated binary session file")
+    return start_ns, title_len, tags_len
+
+
+def unpack_current(data: bytes) -> tuple[str, list[str], int]:
+    """Return ``(title, tag names, start_ns)``, raising ValueError."""
+    (start_ns, title_len, tags_len) = unpack_header(data)
+    title_end = HEADER.size + title_len
+    title = data[HEADER.size : title_end].decode("utf-8")
+    tags = data[title_end : title_end + tags_len].decode("ascii")
+    return title, tags.split(",") if tags else [], start_ns
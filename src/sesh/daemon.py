@@ -0,0 +1,111 @@
+"""Long-running ``sesh daemon`` serving commands over a Unix socket.
+
+A fresh ``sesh`` process spends tens of milliseconds starting Python, loading
+click and opening the store before doing any work. The daemon keeps one Store,
+with its migrated connection and tag cache, in a single process and runs the
+commands sent by sesh.client through the regular click group, capturing their
+output. Commands run one at a time on the event loop, which serializes writes
+and keeps the process-wide output redirection safe.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+from pathlib import Path
+
+import click
+
+from sesh.store import Store
+
+# Largest request line accepted, a command line is far smaller
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def run_command(store: Store, args: list[str], color: bool) -> dict:
+    """Run a sesh command line against ``store`` and capture its output."""
+    # imported here, sesh.cli imports nothing from the daemon but is its caller
+    from sesh.cli import main
+
+    out = io.StringIO()
+    err = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            result = main.main(
+                args, prog_name="sesh", obj=store, standalone_mode=False, color=color
+            )
+            # --help and ctx.exit() return their exit code
+            code = result if isinstance(result, int) else 0
+        except click.Abort:
+            err.write("Aborted!\n")
+            code = 1
+        except click.ClickException as e:
+            e.show()
+            code = e.exit_code
+    return {"code": code, "out": out.getvalue(), "err": err.getvalue()}
+
+
+def is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(os.fspath(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+class Daemon:
+    def __init__(self, store: Store, socket_path: Path) -> None:
+        self.store = store
+        self.socket_path = socket_path
+        self.served = 0
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            response = run_command(
+                self.store, list(request["args"]), bool(request.get("color"))
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"code": 2, "out": "", "err": f"Error: Invalid request ({e})\n"}
+        self.served += 1
+
+        try:
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            # the client went away, nothing to report to
+            pass
+
+    async def serve(self) -> None:
+        """Serve until SIGINT or SIGTERM, then remove the socket."""
+        # listen on a temporary name first, so that clients seeing the socket
+        # path never connect between bind() and listen()
+        pending_path = self.socket_path.with_name(f".{self.socket_path.name}")
+        with contextlib.suppress(OSError):
+            pending_path.unlink()
+        server = await asyncio.start_unix_server(
+            self.handle, path=os.fspath(pending_path), limit=MAX_REQUEST_BYTES
+        )
+        try:
+            # the socket accepts commands, keep it to the owner
+            os.chmod(pending_path, 0o600)
+            os.replace(pending_path, self.socket_path)
+
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(signum, stop.set)
+            async with server:
+                await stop.wait()
+        finally:
+            for path in (pending_path, self.socket_path):
+                with contextlib.suppress(OSError):
+                    path.unlink()
@@ -63,3 +63,40 @@ class InvalidArgumentError(SeshError):
 
     def __init__(self, message: str = "Invalid command argument."):
         super().__init__(message)
+
+
+class SeshNotFoundError(SeshError):
+    """Raised when no saved Sesh matches an id."""
+
+    def __init__(self, uid: str = "", message: str = ""):
+        if not message and uid:
+            message = f"No Sesh found with id {uid}"
+        elif not message:
+            message = "No Sesh found."
+        super().__init__(message)
+
+
+class AmbiguousSeshError(SeshError):
+    """Raised when a short id matches more than one saved Sesh."""
+
+    def __init__(self, uid: str = "", matches: list[str] | None = None):
+        message = f"Sesh id {uid} is ambiguous" if uid else "Sesh id is ambiguous"
+        if matches:
+            message += f", it matches {', '.join(matches)}"
+        super().__init__(message)
+
+
+class ConfigError(SeshError):
+    """Raised when a setting has an invalid value."""
+
+    def __init__(self, message: str = "Invalid configuration."):
+        super().__init__(message)
+
+
+class LockTimeoutError(SeshError):
+    """Raised when another process holds the store lock for too long."""
+
+    def __init__(
+        self, message: str = "Another Sesh command is still running, try again."
+    ):
+        super().__init__(message)
@@ -0,0 +1,41 @@
+import csv
+import json
+from collections.abc import Iterable
+from typing import TextIO
+
+FORMATS = ("csv", "jsonl")
+
+# Same column names as the import format, so exports can be imported again
+EXPORT_COLUMNS = ("uid", "title", "details", "start_time", "end_time", "tags")
+
+
+def write_csv(rows: Iterable[tuple], f: TextIO) -> int:
+    """Write exported Sesh rows as CSV with a header, returning the row count."""
+    writer = csv.writer(f)
+    writer.writerow(EXPORT_COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[tuple], f: TextIO) -> int:
+    """Write exported Sesh rows as one JSON object per line, returning the count."""
+    count = 0
+    for uid, title, details, start_time, end_time, tags in rows:
+        record = {
+            "uid": uid,
+            "title": title,
+            "details": details,
+            "start_time": start_time,
+            "end_time": end_time,
+            "tags": tags.split(",") if tags else [],
+        }
+        f.write(json.dumps(record, ensure_ascii=False))
+        f.write("\n")
+        count += 1
+    return count
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl}
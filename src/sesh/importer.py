@@ -0,0 +1,214 @@
+import csv
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import TextIO
+
+from whenever import Instant
+
+from sesh.error import InvalidSeshDataError
+from sesh.parser.tag import Tag
+
+FORMATS = ("csv", "jsonl", "timewarrior")
+
+# Number of skipped records that are reported individually
+IMPORT_ERROR_PREVIEW = 10
+
+# Limits enforced by the CHECK constraints of the sesh and tag tables
+MAX_TITLE_LENGTH = 100
+MAX_DETAILS_LENGTH = 1000
+
+
+@dataclass(slots=True)
+class ImportedSesh:
+    title: str
+    details: str
+    start_time: str
+    end_time: str
+    tags: list[str]
+
+
+@dataclass
+class SeshReader:
+    """Stream validated Seshes out of CSV, JSONL or timewarrior export files.
+
+    Records are parsed one at a time so that arbitrarily large files can be
+    imported in constant memory. Invalid records are skipped; the first
+    ``max_errors`` problems are kept in ``errors`` as ``(record number, reason)``.
+
+    CSV files need a header with ``title``, ``start_time`` and ``end_time``
+    columns, plus optional ``details`` and ``tags`` (comma-separated). JSONL
+    records use the same keys, with ``tags`` as a list or comma-separated
+    string. Timewarrior files are the output of ``timew export``.
+    """
+
+    format: str
+    max_errors: int = 100
+    skipped: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+    def read(self, f: TextIO) -> Iterator[ImportedSesh]:
+        match self.format:
+            case "csv":
+                records = enumerate(csv.DictReader(f), start=1)
+                make = SeshReader.from_record
+            case "jsonl":
+                records = SeshReader.iter_json_lines(f)
+                make = SeshReader.from_json_line
+            case "timewarrior":
+                records = SeshReader.iter_json_lines(f)
+                make = SeshReader.from_timewarrior_line
+            case _:
+                raise ValueError(f"Unsupported import format: {self.format}")
+
+        for number, record in records:
+            try:
+                yield make(record)
+            except InvalidSeshDataError as e:
+                self.skip(number, str(e))
+
+    def skip(self, number: int, reason: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((number, reason))
+
+    @staticmethod
+    def detect_format(filename: str) -> str | None:
+        suffix = filename.rsplit(".", 1)[-1].lower()
+        return {
+            "csv": "csv",
+            "jsonl": "jsonl",
+            "ndjson": "jsonl",
+            "json": "timewarrior",
+        }.get(suffix)
+
+    @staticmethod
+    def iter_json_lines(f: TextIO) -> Iterator[tuple[int, str]]:
+        # `timew export` prints a JSON array with one interval per line, so the
+        # same line-oriented reader handles it once brackets and commas go
+        for number, line in enumerate(f, start=1):
+            line = line.strip().removeprefix("[").removesuffix("]").rstrip(",")
+            if line:
+                yield number, line
+
+    @staticmethod
+    def decode(line: str) -> object:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError as e:
+            raise InvalidSeshDataError(f"Invalid JSON: {e}") from None
+
+    @staticmethod
+    def from_json_line(line: str) -> ImportedSesh:
+        return SeshReader.from_record(SeshReader.decode(line))
+
+    @staticmethod
+    def from_timewarrior_line(line: str) -> ImportedSesh:
+        return SeshReader.from_timewarrior(SeshReader.decode(line))
+
+    @staticmethod
+    def from_record(record: object) -> ImportedSesh:
+        if not isinstance(record, dict):
+            raise InvalidSeshDataError("Record must be an object")
+
+        try:
+            title = record["title"]
+            start_time = record["start_time"]
+            end_time = record["end_time"]
+        except KeyError as e:
+            raise InvalidSeshDataError(f"Missing field {e}") from None
+
+        tags = record.get("tags")
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = tags.split(",")
+        elif not isinstance(tags, list):
+            raise InvalidSeshDataError(
+                "Tags must be a list or a comma-separated string"
+            )
+
+        return SeshReader.make_sesh(
+            title,
+            record.get("details") or "",
+            SeshReader.parse_time(start_time),
+            SeshReader.parse_time(end_time),
+            tags,
+        )
+
+    @staticmethod
+    def from_timewarrior(record: object) -> ImportedSesh:
+        if not isinstance(record, dict):
+            raise InvalidSeshDataError("Record must be an object")
+        if "start" not in record:
+            raise InvalidSeshDataError("Missing field 'start'")
+        if "end" not in record:
+            raise InvalidSeshDataError("Open interval cannot be imported")
+
+        tags = record.get("tags", [])
+        if not isinstance(tags, list):
+            raise InvalidSeshDataError("Tags must be a list")
+        # timewarrior tags are free text, so map them onto the tag alphabet
+        tags = ["-".join(str(t).lower().split()) for t in tags]
+        title = record.get("annotation") or " ".join(tags) or "imported"
+
+        return SeshReader.make_sesh(
+            title,
+            "",
+            SeshReader.parse_timewarrior_time(record["start"]),
+            SeshReader.parse_timewarrior_time(record["end"]),
+            tags,
+        )
+
+    @staticmethod
+    def make_sesh(
+        title: object, details: object, start: Instant, end: Instant, tags: list
+    ) -> ImportedSesh:
+        if not isinstance(title, str) or not title.strip():
+            raise InvalidSeshDataError("Title must be a non-empty string")
+        if len(title) > MAX_TITLE_LENGTH:
+            raise InvalidSeshDataError(
+                f"Title longer than {MAX_TITLE_LENGTH} characters"
+            )
+        if not isinstance(details, str) or len(details) > MAX_DETAILS_LENGTH:
+            raise InvalidSeshDataError(
+                f"Details must be a string of at most {MAX_DETAILS_LENGTH} characters"
+            )
+        if end < start:
+            raise InvalidSeshDataError("End time is before start time")
+
+        tag_names = []
+        for tag in tags:
+            name = str(tag).strip().lower()
+            if not name:
+                continue
+            if not Tag.validate_tag_name(name):
+                raise InvalidSeshDataError(f"Invalid tag: {name}")
+            if name not in tag_names:
+                tag_names.append(name)
+
+        return ImportedSesh(
+            title,
+            details,
+            start.format_common_iso(),
+            end.format_common_iso(),
+            tag_names,
+        )
+
+    @staticmethod
+    def parse_time(value: object) -> Instant:
+        try:
+            return Instant.parse_common_iso(str(value)).round()
+        except ValueError:
+            raise InvalidSeshDataError(f"Invalid timestamp: {value}") from None
+
+    @staticmethod
+    def parse_timewarrior_time(value: object) -> Instant:
+        # timewarrior uses the basic ISO format, e.g. 20250101T093000Z
+        value = str(value)
+        if len(value) != 16 or value[8] != "T" or value[15] != "Z":
+            raise InvalidSeshDataError(f"Invalid timestamp: {value}")
+        return SeshReader.parse_time(
+            f"{value[0:4]}-{value[4:6]}-{value[6:8]}T"
+            f"{value[9:11]}:{value[11:13]}:{value[13:15]}Z"
+        )
@@ -0,0 +1,77 @@
+"""Inter-process lock serializing changes to the current Sesh.
+
+Editor plugins, shell hooks and cron jobs may run Sesh at the same time. The
+current Sesh file is read, checked and replaced in separate steps, so start,
+stop and reset hold an exclusive ``flock`` on a lock file next to it for their
+whole duration. Platforms without fcntl (Windows) skip the lock and rely on
+SQLite locking alone.
+"""
+
+import os
+import time
+from pathlib import Path
+
+from sesh.error import LockTimeoutError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Give up waiting for the lock after this many seconds. Attempts back off
+# exponentially from LOCK_BACKOFF_MIN up to LOCK_BACKOFF_MAX seconds.
+LOCK_TIMEOUT = 10.0
+LOCK_BACKOFF_MIN = 0.001
+LOCK_BACKOFF_MAX = 0.05
+
+
+class FileLock:
+    """Reentrant exclusive lock on ``path``, held while ``depth`` > 0."""
+
+    def __init__(self, path: Path, timeout: float = LOCK_TIMEOUT) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.depth = 0
+        self.fd: int | None = None
+        # number of attempts that found the lock taken, for diagnostics
+        self.contended = 0
+
+    def __enter__(self) -> "FileLock":
+        if self.depth == 0 and fcntl is not None:
+            self.acquire()
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.depth -= 1
+        if self.depth == 0 and self.fd is not None:
+            self.release()
+
+    def acquire(self) -> None:
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            raise LockTimeoutError(f"Failed to open lock file: {e}") from e
+
+        deadline = time.monotonic() + self.timeout
+        delay = LOCK_BACKOFF_MIN
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                self.contended += 1
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise LockTimeoutError() from None
+                time.sleep(delay)
+                delay = min(delay * 2, LOCK_BACKOFF_MAX)
+            except OSError as e:
+                os.close(fd)
+                raise LockTimeoutError(f"Failed to lock {self.path.name}: {e}") from e
+        self.fd = fd
+
+    def release(self) -> None:
+        # closing the descriptor drops the flock
+        os.close(self.fd)
+        self.fd = None
@@ -0,0 +1,149 @@
+import contextlib
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from importlib import resources
+from importlib.resources.abc import Traversable
+
+from sesh.error import MigrationError
+
+MIGRATIONS_DIR = "migrations"
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    sql: str
+    checksum: str
+
+
+def load_migrations() -> list[Migration]:
+    """Load all migration scripts shipped with the package, in version order."""
+    try:
+        migrations = []
+        for f in _migration_files():
+            sql = f.read_text(encoding="utf-8")
+            migrations.append(
+                Migration(
+                    version=f.name.removesuffix(".sql"),
+                    sql=sql,
+                    checksum=hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+                )
+            )
+        return migrations
+    except OSError as e:
+        raise MigrationError(f"Failed to read migration scripts: {e}") from e
+
+
+def count_migrations() -> int:
+    """Count the migration scripts shipped with the package without reading them."""
+    try:
+        return len(_migration_files())
+    except OSError as e:
+        raise MigrationError(f"Failed to list migration scripts: {e}") from e
+
+
+def apply_migrations(db_conn: sqlite3.Connection) -> int:
+    """Apply pending migrations to the database and return how many were applied.
+
+    The number of applied migrations is mirrored in ``PRAGMA user_version`` so that
+    an up-to-date database is detected with a single header read. Only when it lags
+    behind the packaged scripts is the ``schema_version`` table consulted, applied
+    checksums verified, and the pending scripts run inside one transaction.
+    """
+    try:
+        (user_version,) = db_conn.execute("PRAGMA user_version").fetchone()
+    except sqlite3.Error as e:
+        raise MigrationError(f"Failed to read schema version: {e}") from e
+
+    available = count_migrations()
+    if user_version == available:
+        return 0
+    if user_version > available:
+        raise MigrationError(
+            f"Database schema version {user_version} is newer than this Sesh "
+            f"installation supports ({available})"
+        )
+
+    migrations = load_migrations()
+
+    # executescript() commits legacy-mode transactions, so drive this one manually
+    autocommit = db_conn.autocommit
+    db_conn.autocommit = True
+    try:
+        db_conn.execute("BEGIN IMMEDIATE")
+        applied = _applied_versions(db_conn, migrations[0])
+
+        pending = []
+        for migration in migrations:
+            checksum = applied.pop(migration.version, None)
+            if checksum is None:
+                pending.append(migration)
+            elif checksum != migration.checksum:
+                raise MigrationError(
+                    f"Checksum mismatch for applied migration {migration.version}"
+                )
+        if applied:
+            raise MigrationError(
+                f"Unknown applied migrations: {', '.join(sorted(applied))}"
+            )
+
+        for migration in pending:
+            db_conn.executescript(migration.sql)
+            db_conn.execute(
+                "INSERT INTO schema_version (version, checksum) VALUES (?, ?)",
+                (migration.version, migration.checksum),
+            )
+
+        db_conn.execute(f"PRAGMA user_version = {len(migrations)}")
+        db_conn.execute("COMMIT")
+        return len(pending)
+    except sqlite3.Error as e:
+        _rollback(db_conn)
+        raise MigrationError(f"Failed to apply migrations: {e}") from e
+    except BaseException:
+        _rollback(db_conn)
+        raise
+    finally:
+        db_conn.autocommit = autocommit
+
+
+def _migration_files() -> list[Traversable]:
+    files = resources.files("sesh").joinpath(MIGRATIONS_DIR).iterdir()
+    return sorted((f for f in files if f.name.endswith(".sql")), key=lambda f: f.name)
+
+
+def _applied_versions(
+    db_conn: sqlite3.Connection, initial: Migration
+) -> dict[str, str]:
+    db_conn.execute(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version TEXT NOT NULL PRIMARY KEY, "
+        "checksum TEXT NOT NULL, "
+        "applied_at TIMESTAMP NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ','now'))"
+        ")"
+    )
+    applied = dict(db_conn.execute("SELECT version, checksum FROM schema_version"))
+
+    # Stores created before versioning have the initial schema but no records
+    if not applied and _has_legacy_schema(db_conn):
+        db_conn.execute(
+            "INSERT INTO schema_version (version, checksum) VALUES (?, ?)",
+            (initial.version, initial.checksum),
+        )
+        applied[initial.version] = initial.checksum
+
+    return applied
+
+
+def _has_legacy_schema(db_conn: sqlite3.Connection) -> bool:
+    row = db_conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sesh'"
+    ).fetchone()
+    return row is not None
+
+
+def _rollback(db_conn: sqlite3.Connection) -> None:
+    if db_conn.in_transaction:
+        with contextlib.suppress(sqlite3.Error):
+            db_conn.execute("ROLLBACK")
@@ -0,0 +1,11 @@
+-- Only touch updated_at when a tag actually changes. Saving a Sesh upserts its
+-- tags with a no-op update so their ids can be RETURNed in the same statement.
+
+DROP TRIGGER IF EXISTS trg_tag_touch;
+
+CREATE TRIGGER IF NOT EXISTS trg_tag_touch
+AFTER UPDATE ON tag FOR EACH ROW
+WHEN NEW.tag_name != OLD.tag_name OR NEW.is_builtin != OLD.is_builtin
+BEGIN
+    UPDATE tag SET updated_at = strftime('%Y-%m-%dT%H:%M:%SZ','now') WHERE tag_id = NEW.tag_id;
+END;
@@ -0,0 +1,168 @@
+-- Daily rollups of Sesh durations, so reports read one row per day and tag
+-- instead of every Sesh. Rows with tag_id 0 total all Seshes of a day.
+
+--------------------------------------------------------------------
+-- Day split
+--------------------------------------------------------------------
+-- Numbers used to split a Sesh into the UTC days it covers (triggers cannot
+-- use recursive CTEs). Seshes longer than 10000 days are cut off.
+CREATE TABLE IF NOT EXISTS day_seq (
+    n               INTEGER     NOT NULL PRIMARY KEY
+);
+
+WITH RECURSIVE seq (n) AS (
+    SELECT 0 UNION ALL SELECT n + 1 FROM seq WHERE n < 9999
+)
+INSERT OR IGNORE INTO day_seq (n) SELECT n FROM seq;
+
+-- One row per Sesh and UTC day with the seconds spent on that day. started is
+-- 1 only on the day the Sesh started, so summing it counts each Sesh once.
+CREATE VIEW IF NOT EXISTS sesh_day AS
+SELECT
+    s.sesh_id,
+    s.start_time,
+    s.end_time,
+    date(s.start_time, '+' || d.n || ' days') AS day,
+    min(unixepoch(s.end_time), unixepoch(s.start_time, 'start of day', '+' || (d.n + 1) || ' days'))
+        - max(unixepoch(s.start_time), unixepoch(s.start_time, 'start of day', '+' || d.n || ' days')) AS seconds,
+    d.n = 0 AS started
+FROM sesh s
+JOIN day_seq d ON d.n <= julianday(date(s.end_time)) - julianday(date(s.start_time))
+WHERE d.n = 0 OR unixepoch(s.start_time, 'start of day', '+' || d.n || ' days') < unixepoch(s.end_time);
+
+--------------------------------------------------------------------
+-- Rollups
+--------------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS sesh_day_rollup (
+    day             TEXT        NOT NULL,
+    tag_id          INTEGER     NOT NULL,
+    sesh_count      INTEGER     NOT NULL DEFAULT 0,
+    seconds         INTEGER     NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag_id, day)
+) WITHOUT ROWID;
+
+INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+SELECT day, 0, sum(started), sum(seconds) FROM sesh_day GROUP BY day;
+
+INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+SELECT d.day, st.tag_id, sum(d.started), sum(d.seconds)
+FROM sesh_day d JOIN sesh_tag st ON st.sesh_id = d.sesh_id
+GROUP BY d.day, st.tag_id;
+
+--------------------------------------------------------------------
+-- Rollup maintenance
+--------------------------------------------------------------------
+-- Add a new Sesh to the all-Seshes rollup, its tags follow via sesh_tag
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_insert
+AFTER INSERT ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, 0, started, seconds FROM sesh_day WHERE sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+END;
+
+-- Remove a deleted Sesh from the rollups while its row still exists. Its
+-- sesh_tag rows are deleted here so their trigger takes care of the tags.
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_delete
+BEFORE DELETE ON sesh FOR EACH ROW
+BEGIN
+    DELETE FROM sesh_tag WHERE sesh_id = OLD.sesh_id;
+
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, 0, -started, -seconds FROM sesh_day WHERE sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE tag_id = 0 AND sesh_count = 0 AND seconds = 0
+        AND day BETWEEN date(OLD.start_time) AND date(OLD.end_time);
+END;
+
+-- Take the old times of a Sesh out of the rollups before they change
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_update
+BEFORE UPDATE OF start_time, end_time ON sesh
+FOR EACH ROW
+WHEN OLD.start_time != NEW.start_time OR OLD.end_time != NEW.end_time
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT d.day, t.tag_id, -d.started, -d.seconds
+    FROM sesh_day d
+    JOIN (SELECT 0 AS tag_id UNION ALL SELECT tag_id FROM sesh_tag WHERE sesh_id = OLD.sesh_id) t
+    WHERE d.sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE sesh_count = 0 AND seconds = 0
+        AND day BETWEEN date(OLD.start_time) AND date(OLD.end_time);
+END;
+
+-- Add the new times of an edited Sesh back, then tag it 'edited'. Both run in
+-- one trigger so the 'edited' tag is rolled up exactly once.
+DROP TRIGGER IF EXISTS trg_sesh_tag_edited;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_tag_edited
+AFTER UPDATE ON sesh
+FOR EACH ROW
+WHEN OLD.start_time != NEW.start_time OR OLD.end_time != NEW.end_time
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT d.day, t.tag_id, d.started, d.seconds
+    FROM sesh_day d
+    JOIN (SELECT 0 AS tag_id UNION ALL SELECT tag_id FROM sesh_tag WHERE sesh_id = NEW.sesh_id) t
+    WHERE d.sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    INSERT OR IGNORE INTO sesh_tag (sesh_id, tag_id)
+    SELECT NEW.sesh_id, tag_id FROM tag WHERE tag_name = 'edited';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_tag_rollup_insert
+AFTER INSERT ON sesh_tag FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, NEW.tag_id, started, seconds FROM sesh_day WHERE sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_tag_rollup_delete
+AFTER DELETE ON sesh_tag FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, OLD.tag_id, -started, -seconds FROM sesh_day WHERE sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE tag_id = OLD.tag_id AND sesh_count = 0 AND seconds = 0
+        AND day IN (SELECT day FROM sesh_day WHERE sesh_id = OLD.sesh_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_tag_rollup_update
+AFTER UPDATE OF sesh_id, tag_id ON sesh_tag FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, OLD.tag_id, -started, -seconds FROM sesh_day WHERE sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE tag_id = OLD.tag_id AND sesh_count = 0 AND seconds = 0
+        AND day IN (SELECT day FROM sesh_day WHERE sesh_id = OLD.sesh_id);
+
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, NEW.tag_id, started, seconds FROM sesh_day WHERE sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+END;
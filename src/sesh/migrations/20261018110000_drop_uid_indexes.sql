@@ -0,0 +1,6 @@
+-- Short ids are uid prefixes, which the UNIQUE index on sesh_uid already
+-- serves with a range scan. Drop the duplicate full-uid index and the index
+-- on the last six characters that no lookup uses; both slowed every insert.
+
+DROP INDEX IF EXISTS idx_sesh_uid;
+DROP INDEX IF EXISTS idx_sesh_uid_short;
@@ -0,0 +1,39 @@
+-- Full-text index over Sesh titles and details. The index stores no copy of
+-- the text (external content), it reads it back from sesh by sesh_id.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS sesh_fts USING fts5 (
+    title,
+    details,
+    content = 'sesh',
+    content_rowid = 'sesh_id',
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+-- Index existing Seshes
+INSERT INTO sesh_fts (sesh_fts) VALUES ('rebuild');
+
+--------------------------------------------------------------------
+-- Index maintenance
+--------------------------------------------------------------------
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_insert
+AFTER INSERT ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (rowid, title, details)
+    VALUES (NEW.sesh_id, NEW.title, NEW.details);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_delete
+AFTER DELETE ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (sesh_fts, rowid, title, details)
+    VALUES ('delete', OLD.sesh_id, OLD.title, OLD.details);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_update
+AFTER UPDATE OF title, details ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (sesh_fts, rowid, title, details)
+    VALUES ('delete', OLD.sesh_id, OLD.title, OLD.details);
+    INSERT INTO sesh_fts (rowid, title, details)
+    VALUES (NEW.sesh_id, NEW.title, NEW.details);
+END;
@@ -0,0 +1,10 @@
+-- The active Sesh when SESH_CURRENT_STORAGE=database. At most one row, so
+-- starting a second Sesh fails on the primary key and stopping is a single
+-- DELETE ... RETURNING inside the transaction that saves the Sesh.
+
+CREATE TABLE IF NOT EXISTS active_sesh (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    title TEXT NOT NULL CHECK (length(title) <= 100),
+    tags TEXT NOT NULL DEFAULT '',
+    start_time TIMESTAMP NOT NULL
+);
@@ -0,0 +1,189 @@
+-- Store Sesh times as INTEGER Unix seconds instead of ISO-8601 text. Integer
+-- keys are 8 bytes or less instead of 20, compare without collation and
+-- subtract without parsing, so range scans and duration sums get cheaper.
+-- sesh_iso keeps the old textual form for ad-hoc queries and scripts.
+--
+-- SQLite cannot change a column type, so sesh is rebuilt. Renaming the new
+-- table must not rewrite triggers of other tables that refer to the dropped
+-- sesh_day view, hence the legacy rename; sesh_tag keeps referring to sesh.
+
+PRAGMA legacy_alter_table = ON;
+
+DROP VIEW IF EXISTS sesh_day;
+
+--------------------------------------------------------------------
+-- Sessions
+--------------------------------------------------------------------
+CREATE TABLE sesh_new (
+    sesh_id         INTEGER     NOT NULL PRIMARY KEY AUTOINCREMENT,
+    sesh_uid        TEXT        NOT NULL UNIQUE DEFAULT (lower(hex(randomblob(16)))),
+    title           TEXT        NOT NULL CHECK (length(title) <= 100),
+    details         TEXT        NOT NULL CHECK (length(details) <= 1000),
+    start_time      INTEGER     NOT NULL CHECK (typeof(start_time) = 'integer'),
+    end_time        INTEGER     NOT NULL CHECK (typeof(end_time) = 'integer' AND end_time >= start_time),
+    created_at      TIMESTAMP   NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ','now')),
+    updated_at      TIMESTAMP   NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ','now'))
+);
+
+INSERT INTO sesh_new (sesh_id, sesh_uid, title, details, start_time, end_time, created_at, updated_at)
+SELECT sesh_id, sesh_uid, title, details, unixepoch(start_time), unixepoch(end_time), created_at, updated_at
+FROM sesh;
+
+-- Keep AUTOINCREMENT from reusing the ids of deleted Seshes
+DELETE FROM sqlite_sequence WHERE name = 'sesh_new';
+INSERT INTO sqlite_sequence (name, seq)
+SELECT 'sesh_new', seq FROM sqlite_sequence WHERE name = 'sesh';
+
+DROP TABLE sesh;
+ALTER TABLE sesh_new RENAME TO sesh;
+
+PRAGMA legacy_alter_table = OFF;
+
+CREATE INDEX IF NOT EXISTS idx_sesh_start_time ON sesh (start_time);
+CREATE INDEX IF NOT EXISTS idx_sesh_end_time ON sesh (end_time);
+CREATE INDEX IF NOT EXISTS idx_sesh_time_range ON sesh (start_time, end_time);
+CREATE INDEX IF NOT EXISTS idx_sesh_created_at ON sesh (created_at);
+
+-- Saved Seshes with ISO-8601 times, as stored before this migration
+CREATE VIEW IF NOT EXISTS sesh_iso AS
+SELECT
+    sesh_id,
+    sesh_uid,
+    title,
+    details,
+    strftime('%Y-%m-%dT%H:%M:%SZ', start_time, 'unixepoch') AS start_time,
+    strftime('%Y-%m-%dT%H:%M:%SZ', end_time, 'unixepoch') AS end_time,
+    created_at,
+    updated_at
+FROM sesh;
+
+--------------------------------------------------------------------
+-- Day split
+--------------------------------------------------------------------
+-- As before, one row per Sesh and UTC day it covers. day0 is the midnight
+-- starting the first day, floored for times before 1970 as well.
+CREATE VIEW IF NOT EXISTS sesh_day AS
+SELECT
+    s.sesh_id,
+    s.start_time,
+    s.end_time,
+    date(s.day0 + d.n * 86400, 'unixepoch') AS day,
+    min(s.end_time, s.day0 + (d.n + 1) * 86400) - max(s.start_time, s.day0 + d.n * 86400) AS seconds,
+    d.n = 0 AS started
+FROM (
+    SELECT sesh_id, start_time, end_time, start_time - (start_time % 86400 + 86400) % 86400 AS day0
+    FROM sesh
+) s
+JOIN day_seq d ON d.n <= (s.end_time - s.day0) / 86400
+WHERE d.n = 0 OR s.day0 + d.n * 86400 < s.end_time;
+
+--------------------------------------------------------------------
+-- Triggers on sesh, dropped with the old table
+--------------------------------------------------------------------
+CREATE TRIGGER IF NOT EXISTS trg_sesh_touch
+AFTER UPDATE ON sesh FOR EACH ROW
+BEGIN
+    UPDATE sesh SET updated_at = strftime('%Y-%m-%dT%H:%M:%SZ','now') WHERE sesh_id = NEW.sesh_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_insert
+AFTER INSERT ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, 0, started, seconds FROM sesh_day WHERE sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_delete
+BEFORE DELETE ON sesh FOR EACH ROW
+BEGIN
+    DELETE FROM sesh_tag WHERE sesh_id = OLD.sesh_id;
+
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT day, 0, -started, -seconds FROM sesh_day WHERE sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE tag_id = 0 AND sesh_count = 0 AND seconds = 0
+        AND day BETWEEN date(OLD.start_time, 'unixepoch') AND date(OLD.end_time, 'unixepoch');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_rollup_update
+BEFORE UPDATE OF start_time, end_time ON sesh
+FOR EACH ROW
+WHEN OLD.start_time != NEW.start_time OR OLD.end_time != NEW.end_time
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT d.day, t.tag_id, -d.started, -d.seconds
+    FROM sesh_day d
+    JOIN (SELECT 0 AS tag_id UNION ALL SELECT tag_id FROM sesh_tag WHERE sesh_id = OLD.sesh_id) t
+    WHERE d.sesh_id = OLD.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    DELETE FROM sesh_day_rollup
+    WHERE sesh_count = 0 AND seconds = 0
+        AND day BETWEEN date(OLD.start_time, 'unixepoch') AND date(OLD.end_time, 'unixepoch');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_tag_edited
+AFTER UPDATE ON sesh
+FOR EACH ROW
+WHEN OLD.start_time != NEW.start_time OR OLD.end_time != NEW.end_time
+BEGIN
+    INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds)
+    SELECT d.day, t.tag_id, d.started, d.seconds
+    FROM sesh_day d
+    JOIN (SELECT 0 AS tag_id UNION ALL SELECT tag_id FROM sesh_tag WHERE sesh_id = NEW.sesh_id) t
+    WHERE d.sesh_id = NEW.sesh_id
+    ON CONFLICT (tag_id, day) DO UPDATE SET
+        sesh_count = sesh_count + excluded.sesh_count,
+        seconds = seconds + excluded.seconds;
+
+    INSERT OR IGNORE INTO sesh_tag (sesh_id, tag_id)
+    SELECT NEW.sesh_id, tag_id FROM tag WHERE tag_name = 'edited';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_insert
+AFTER INSERT ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (rowid, title, details)
+    VALUES (NEW.sesh_id, NEW.title, NEW.details);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_delete
+AFTER DELETE ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (sesh_fts, rowid, title, details)
+    VALUES ('delete', OLD.sesh_id, OLD.title, OLD.details);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_sesh_fts_update
+AFTER UPDATE OF title, details ON sesh FOR EACH ROW
+BEGIN
+    INSERT INTO sesh_fts (sesh_fts, rowid, title, details)
+    VALUES ('delete', OLD.sesh_id, OLD.title, OLD.details);
+    INSERT INTO sesh_fts (rowid, title, details)
+    VALUES (NEW.sesh_id, NEW.title, NEW.details);
+END;
+
+--------------------------------------------------------------------
+-- Active Sesh
+--------------------------------------------------------------------
+CREATE TABLE active_sesh_new (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    title TEXT NOT NULL CHECK (length(title) <= 100),
+    tags TEXT NOT NULL DEFAULT '',
+    start_time INTEGER NOT NULL CHECK (typeof(start_time) = 'integer')
+);
+
+INSERT INTO active_sesh_new (id, title, tags, start_time)
+SELECT id, title, tags, unixepoch(start_time) FROM active_sesh;
+
+DROP TABLE active_sesh;
+ALTER TABLE active_sesh_new RENAME TO active_sesh;
@@ -1,2 +1,107 @@
-class BasicSeshQuery:
-    pass
+import functools
+import shlex
+from dataclasses import dataclass
+
+import click
+from whenever import Instant
+
+from sesh.error import InvalidArgumentError, InvalidTagError
+from sesh.parser.tag import Tag
+from sesh.parser.timerange import parse_time_bound
+
+# Distinct query strings whose parse result is kept
+QUERY_CACHE_SIZE = 256
+
+UID_CHARACTERS = frozenset("0123456789abcdef")
+
+
+@dataclass(frozen=True, slots=True)
+class SeshQuery:
+    """Parsed form of a Sesh query, all conditions must hold."""
+
+    # start time bounds, since inclusive and until exclusive
+    since: Instant | None = None
+    until: Instant | None = None
+    # tags a Sesh must have, and tags it must not have
+    tags: tuple[Tag, ...] = ()
+    excluded_tags: tuple[Tag, ...] = ()
+    # prefix of the Sesh uid
+    uid: str | None = None
+    # words that must appear in the title or details
+    words: tuple[str, ...] = ()
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def parse_query(text: str) -> SeshQuery:
+    """Parse a Sesh query, raising InvalidArgumentError or InvalidTagError.
+
+    Terms are separated by whitespace and may be quoted:
+
+        +tag             has the tag
+        -tag             does not have the tag
+        since:DATE       started on or after DATE (date or timestamp)
+        until:DATE       started up to DATE, a date includes the whole day
+        uid:PREFIX       uid starts with PREFIX
+        word             title or details contain the word (word* for a prefix)
+    """
+    try:
+        terms = shlex.split(text)
+    except ValueError as e:
+        raise InvalidArgumentError(f"Invalid query ({e})") from None
+
+    fields: dict = {"tags": [], "excluded_tags": [], "words": []}
+    for term in terms:
+        if not term:
+            # an empty quoted term, '' or ""
+            continue
+        (key, sep, value) = term.partition(":")
+        if sep and key in ("since", "until"):
+            if fields.get(key) is not None:
+                raise InvalidArgumentError(f"{key}: given more than once")
+            try:
+                fields[key] = parse_time_bound(value, end=key == "until")
+            except ValueError:
+                raise InvalidArgumentError(f"Invalid date or time ({value})") from None
+        elif sep and key == "uid":
+            uid = value.lower()
+            if not uid or not UID_CHARACTERS.issuperset(uid):
+                raise InvalidArgumentError(f"Invalid Sesh id ({value})")
+            if fields.get("uid") is not None:
+                raise InvalidArgumentError("uid: given more than once")
+            fields["uid"] = uid
+        elif term[0] in "+-" and len(term) > 1:
+            key = "tags" if term[0] == "+" else "excluded_tags"
+            fields[key].append(Tag(term[1:].lower()))
+        else:
+            fields["words"].append(term)
+
+    if not any(fields.values()):
+        raise InvalidArgumentError("Empty query")
+    return SeshQuery(
+        since=fields.get("since"),
+        until=fields.get("until"),
+        tags=tuple(dict.fromkeys(fields["tags"])),
+        excluded_tags=tuple(dict.fromkeys(fields["excluded_tags"])),
+        uid=fields.get("uid"),
+        words=tuple(fields["words"]),
+    )
+
+
+class BasicSeshQuery(click.ParamType):
+    """Click parameter type for Sesh queries, see parse_query.
+
+    Examples:
+        - "+backend since:2025-01-01" -> Seshes tagged backend since 2025
+        - "uid:9a3b" -> the Sesh whose id starts with 9a3b
+        - "deploy -review until:2025-06-30" -> mention deploy, not tagged review
+    """
+
+    name = "query"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, SeshQuery):
+            return value
+        try:
+            return parse_query(value)
+        except (InvalidArgumentError, InvalidTagError) as e:
+            self.fail(str(e), param, ctx)
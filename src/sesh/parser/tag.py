@@ -1,18 +1,33 @@
+import re
+from collections.abc import Iterable
+from typing import ClassVar
+
 import click
 
 from sesh.error import InvalidTagError
 
+# Tag names are 1-20 lowercase letters, digits and hyphens, not starting or
+# ending with a hyphen (the tag table CHECKs the same length)
+TAG_NAME_MAX_LENGTH = 20
+TAG_NAME_PATTERN = re.compile(
+    rf"[a-z0-9](?:[a-z0-9-]{{0,{TAG_NAME_MAX_LENGTH - 2}}}[a-z0-9])?"
+)
+
 
 class Tag:
-    """A validated tag with display name generation.
+    """A validated, immutable tag with display name generation.
 
     Tags are used to categorize and organize sessions. They must follow specific
     naming rules: contain only lowercase letters, digits, and hyphens, cannot
-    start or end with hyphens, and must be at least 1 character long.
+    start or end with hyphens, and must be 1 to 20 characters long.
 
     The display name is automatically generated by replacing hyphens with spaces
     for better readability in user interfaces.
 
+    Tags compare and hash by name. Tags with the default display name are
+    interned, so ``Tag("python") is Tag("python")`` and code handling millions
+    of tag references shares one small object per name.
+
     Raises:
         InvalidTagError: If the tag name doesn't meet validation requirements.
 
@@ -24,16 +39,52 @@ class Tag:
         'machine learning'
     """
 
-    def __init__(self, name: str, display_name: str | None = None):
-        if Tag.validate_tag_name(name):
-            self.name = name
-        else:
+    __slots__ = ("name", "display_name")
+
+    name: str
+    display_name: str
+
+    # process-wide table of tags with the default display name
+    _interned: ClassVar[dict[str, "Tag"]] = {}
+
+    def __new__(cls, name: str, display_name: str | None = None) -> "Tag":
+        if display_name is None:
+            tag = cls._interned.get(name)
+            if tag is not None:
+                return tag
+
+        if not Tag.validate_tag_name(name):
             raise InvalidTagError(name)
 
+        tag = super().__new__(cls)
+        object.__setattr__(tag, "name", name)
         if display_name is None:
-            self.display_name = Tag.make_display_name(name)
-        else:
-            self.display_name = display_name
+            object.__setattr__(tag, "display_name", Tag.make_display_name(name))
+            return cls._interned.setdefault(name, tag)
+        object.__setattr__(tag, "display_name", display_name)
+        return tag
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Tag):
+            return self.name == other.name
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __reduce__(self):
+        # unpickle tags with the default display name through the intern table
+        if self.display_name == Tag.make_display_name(self.name):
+            return (Tag, (self.name,))
+        return (Tag, (self.name, self.display_name))
 
     def __str__(self):
         return self.name
@@ -43,16 +94,47 @@ class Tag:
 
     @staticmethod
     def make_display_name(name: str) -> str:
-        return " ".join(name.split("-"))
+        return name.replace("-", " ")
 
     @staticmethod
     def validate_tag_name(tag: str) -> bool:
-        return (
-            len(tag) >= 1
-            and all(c.isdigit() or c == "-" or ("a" <= c <= "z") for c in tag)
-            and tag[0] != "-"
-            and tag[-1] != "-"
-        )
+        return TAG_NAME_PATTERN.fullmatch(tag) is not None
+
+
+def parse_tags_bulk(
+    items: Iterable[str], separator: str | None = ",", normalize: bool = True
+) -> tuple[list[Tag], list[tuple[int, str]]]:
+    """Parse a batch of tag lists into unique tags in one pass.
+
+    Each item holds tag names split on ``separator`` (``None`` takes the whole
+    item as one name). With ``normalize``, names are stripped and lowercased
+    and empty names skipped. Each distinct name is validated once.
+
+    Returns the unique valid tags in first-seen order, and ``(item index,
+    name)`` for every invalid name instead of raising on the first one.
+
+    Examples:
+        >>> parse_tags_bulk(["python, Web-Dev", "python,bad_tag"])
+        ([python, web dev], [(1, 'bad_tag')])
+    """
+    # name as given -> (normalized name, Tag or None when invalid)
+    parsed: dict[str, tuple[str, Tag | None]] = {}
+    tags: dict[Tag, None] = {}
+    errors = []
+    for index, item in enumerate(items):
+        for raw in item.split(separator) if separator is not None else (item,):
+            entry = parsed.get(raw)
+            if entry is None:
+                name = raw.strip().lower() if normalize else raw
+                tag = Tag(name) if Tag.validate_tag_name(name) else None
+                entry = parsed[raw] = (name, tag)
+
+            (name, tag) = entry
+            if tag is not None:
+                tags[tag] = None
+            elif name or not normalize:  # skip empty strings from separation
+                errors.append((index, name))
+    return list(tags), errors
 
 
 class TagOption(click.ParamType):
@@ -60,7 +142,8 @@ class TagOption(click.ParamType):
 
     Converts string input containing comma-separated tag names into a list of
     Tag objects. Input is automatically converted to lowercase and whitespace
-    is stripped from individual tag names before validation.
+    is stripped from individual tag names before validation. Repeated tags
+    are returned once.
 
     Supports both single tags and comma-separated lists:
     - "python" -> [Tag("python")]
@@ -85,14 +168,8 @@ class TagOption(click.ParamType):
         if isinstance(value, list):
             return value
 
-        tags = []
-        for tag in value.lower().split(","):
-            tag = tag.strip()
-            if not tag:  # Skip empty strings from comma separation
-                continue
-            try:
-                tags.append(Tag(tag))
-            except InvalidTagError:
-                # Use UsageError for cleaner error messages
-                raise click.UsageError(f"Invalid tag ({tag})") from None
+        (tags, errors) = parse_tags_bulk([value])
+        if errors:
+            # Use UsageError for cleaner error messages
+            raise click.UsageError(f"Invalid tag ({errors[0][1]})")
         return tags
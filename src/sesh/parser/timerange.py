@@ -0,0 +1,47 @@
+import click
+from whenever import Date, Instant, Time
+
+
+class TimeOption(click.ParamType):
+    """Click parameter type for time range bounds.
+
+    Accepts an ISO 8601 date (interpreted in UTC) or a full timestamp with an
+    offset. Dates given as an end bound cover the whole day, so
+    ``--since 2025-01-01 --until 2025-01-31`` includes all of January.
+
+    Examples:
+        - "2025-01-01" -> Instant 2025-01-01T00:00:00Z
+        - "2025-01-01" (end=True) -> Instant 2025-01-02T00:00:00Z
+        - "2025-01-01T09:30:00+02:00" -> Instant 2025-01-01T07:30:00Z
+    """
+
+    name = "time"
+
+    def __init__(self, end: bool = False) -> None:
+        self.end = end
+
+    def convert(
+        self,
+        value: str | Instant,
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> Instant:
+        if isinstance(value, Instant):
+            return value
+
+        try:
+            return parse_time_bound(value, self.end)
+        except ValueError:
+            # Use UsageError for cleaner error messages
+            raise click.UsageError(f"Invalid date or time ({value})") from None
+
+
+def parse_time_bound(value: str, end: bool = False) -> Instant:
+    """Parse a date or timestamp as TimeOption does; raises ValueError."""
+    try:
+        date = Date.parse_common_iso(value)
+    except ValueError:
+        return Instant.parse_common_iso(value)
+    if end:
+        date = date.add(days=1)
+    return date.at(Time.MIDNIGHT).assume_utc()
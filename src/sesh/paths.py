@@ -0,0 +1,18 @@
+# File names inside the Sesh root directory. Kept free of imports so that the
+# prompt fast path in sesh.__main__ can use them without loading pathlib.
+SESH_DIR = ".sesh"
+DATA_SQLITE = "store.db"
+CURRENT_SESSION_JSON = "current.json"
+CONFIG_TOML = "config.toml"
+LOCK_FILE = "store.lock"
+DAEMON_SOCKET = "daemon.sock"
+
+# Where the active Sesh is kept, "file" (current.json) or "database" (the
+# active_sesh table). Read by the prompt fast path as well as sesh.config.
+ENV_CURRENT_STORAGE = "SESH_CURRENT_STORAGE"
+FILE_STORAGE = "file"
+DATABASE_STORAGE = "database"
+
+# Enables the diagnostic trace of sesh.trace, like the --profile option. Read
+# by sesh.__main__ to keep traced commands out of the daemon.
+ENV_TRACE = "SESH_TRACE"
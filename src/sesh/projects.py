@@ -0,0 +1,212 @@
+"""Reports and exports over the stores of many projects (``--all``).
+
+Every project keeps its own ``.sesh/store.db``. Stores are discovered by
+walking the directories in SESH_ROOTS (the home directory by default). The
+list is cached, so large home directories are not walked on every run. Stores
+are opened through read-only connections. Reports are built per store in
+worker processes and their partial totals added up here. Exports are streamed
+from one cursor per store in this process and merged by start time, so memory
+use stays constant however many Seshes there are.
+"""
+
+import heapq
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from whenever import Instant
+
+from sesh.config import Config
+from sesh.error import SeshError
+from sesh.parser.tag import Tag
+from sesh.paths import DATA_SQLITE, SESH_DIR
+from sesh.store import Store
+
+# Directories searched for projects, separated like PATH
+ENV_ROOTS = "SESH_ROOTS"
+
+# Discovered stores are cached in this file under $XDG_CACHE_HOME (or
+# ~/.cache) and walked for again when older than DISCOVERY_MAX_AGE seconds
+DISCOVERY_CACHE = Path("sesh", "stores.json")
+DISCOVERY_MAX_AGE = 24 * 60 * 60
+
+# How deep below a root projects are looked for, and directories never
+# entered because they are large and hold no projects
+MAX_DEPTH = 6
+SKIPPED_DIRS = frozenset(
+    {"node_modules", "__pycache__", "site-packages", "target", "build", "dist"}
+)
+
+
+def configured_roots(environ: Mapping[str, str] = os.environ) -> list[Path]:
+    """Directories to search, from SESH_ROOTS or the home directory."""
+    value = environ.get(ENV_ROOTS, "")
+    roots = [Path(p).expanduser() for p in value.split(os.pathsep) if p]
+    return [root.resolve() for root in roots or [Path.home()]]
+
+
+def discovery_cache_path(environ: Mapping[str, str] = os.environ) -> Path:
+    cache_home = environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / DISCOVERY_CACHE
+
+
+def walk_stores(root: Path, depth: int = MAX_DEPTH) -> Iterator[Path]:
+    """Yield every Sesh root (``.sesh`` directory) with a database below ``root``."""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        # unreadable or vanished directory
+        return
+    for entry in entries:
+        if not entry.is_dir(follow_symlinks=False):
+            continue
+        if entry.name == SESH_DIR:
+            if os.path.exists(os.path.join(entry.path, DATA_SQLITE)):
+                yield Path(entry.path)
+        elif depth > 0 and not (
+            entry.name.startswith(".") or entry.name in SKIPPED_DIRS
+        ):
+            yield from walk_stores(Path(entry.path), depth - 1)
+
+
+def discover_stores(
+    roots: list[Path], cache_path: Path, rescan: bool = False
+) -> list[Path]:
+    """Sesh roots below ``roots``, from the cache unless stale or ``rescan``."""
+    key = [os.fspath(root) for root in roots]
+    if not rescan:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            fresh = time.time() - cached["scanned_at"] < DISCOVERY_MAX_AGE
+            if fresh and cached["roots"] == key:
+                # projects deleted since the scan are dropped, new ones wait
+                # for the next scan
+                stores = [Path(p) for p in cached["stores"]]
+                return [p for p in stores if (p / DATA_SQLITE).exists()]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    stores = sorted({store for root in roots for store in walk_stores(root)})
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "roots": key,
+                    "scanned_at": time.time(),
+                    "stores": [os.fspath(p) for p in stores],
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError:
+        # a read-only cache directory only costs the next run a walk
+        pass
+    return stores
+
+
+def project_stores(current: Path | None = None, rescan: bool = False) -> list[Path]:
+    """Discovered Sesh roots, plus ``current`` if it has a database."""
+    stores = discover_stores(configured_roots(), discovery_cache_path(), rescan)
+    if current is not None and (current / DATA_SQLITE).exists():
+        current = current.resolve()
+        if current not in stores:
+            stores.append(current)
+    return stores
+
+
+def map_stores(
+    func: Callable[..., Any], stores: list[Path], *args: Any
+) -> Iterator[tuple[Path, Any, SeshError | None]]:
+    """Run ``func(store_root, *args)`` for every store in a process pool.
+
+    Yields ``(store_root, result, error)`` in the order of ``stores``, with
+    the SeshError of a store that could not be read instead of its result.
+    """
+    if len(stores) <= 1:
+        # not worth starting a pool for
+        futures = None
+    else:
+        # multiprocessing is slow to import and only needed here
+        from concurrent.futures import ProcessPoolExecutor
+
+        pool = ProcessPoolExecutor(min(len(stores), os.cpu_count() or 1))
+        futures = [pool.submit(func, store, *args) for store in stores]
+    try:
+        for i, store in enumerate(stores):
+            try:
+                result = futures[i].result() if futures else func(store, *args)
+            except SeshError as e:
+                yield (store, None, e)
+            else:
+                yield (store, result, None)
+    finally:
+        if futures is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def open_read_only(root: Path) -> Store:
+    # settings of the store itself do not matter for reading it
+    store = Store(root, Config())
+    store.connect_read_only()
+    return store
+
+
+def open_stores(
+    stores: list[Path],
+) -> Iterator[tuple[Path, Store | None, SeshError | None]]:
+    """Open every store read-only in this process.
+
+    Yields ``(store_root, store, error)`` like map_stores. The caller must
+    close the stores.
+    """
+    for root in stores:
+        try:
+            yield (root, open_read_only(root), None)
+        except SeshError as e:
+            yield (root, None, e)
+
+
+def store_report(
+    root: Path,
+    group_by: str,
+    since: Instant | None,
+    until: Instant | None,
+    tags: list[Tag],
+) -> list[tuple[str, int, int]]:
+    """Report rows of one store, run in a worker process."""
+    store = open_read_only(root)
+    try:
+        return store.report(group_by, since, until, tags)
+    finally:
+        store.close()
+
+
+def merge_reports(
+    group_by: str, reports: list[list[tuple[str, int, int]]]
+) -> list[tuple[str, int, int]]:
+    """Add up report rows of the same group, ordered like Store.report."""
+    totals: dict[str, list[int]] = {}
+    for rows in reports:
+        for key, count, seconds in rows:
+            total = totals.setdefault(key, [0, 0])
+            total[0] += count
+            total[1] += seconds
+    rows = [(key, count, seconds) for key, (count, seconds) in totals.items()]
+    if group_by == "tag":
+        return sorted(rows, key=lambda row: (-row[2], row[0]))
+    return sorted(rows)
+
+
+def merge_seshes(
+    exports: list[Iterable[tuple[str, str, str, str, str, str]]],
+) -> Iterator[tuple[str, str, str, str, str, str]]:
+    """Interleave exported rows of several stores in start time order.
+
+    Rows are pulled from each export as they are written, one at a time.
+    """
+    # ISO-8601 UTC times sort like the instants they stand for
+    return heapq.merge(*exports, key=lambda row: row[3])
@@ -0,0 +1,106 @@
+"""Compact status line for shell prompts.
+
+This module only depends on the standard library so that ``sesh status --prompt``
+can be served from ``sesh.__main__`` without importing click, whenever or pathlib.
+sqlite3 is only loaded to read the active Sesh in database storage.
+"""
+
+import os
+import time
+
+from sesh.current_binary import HEADER, is_binary, unpack_header
+from sesh.error import SessionStorageError
+
+PROMPT_TITLE_WIDTH = 30
+
+
+def format_compact_elapsed(seconds: int) -> str:
+    (h, rest) = divmod(seconds, 3600)
+    (m, s) = divmod(rest, 60)
+    if h == 0:
+        if m == 0:
+            return f"{s}s"
+        return f"{m}m"
+    return f"{h}h{m:02d}m"
+
+
+def read_active_row(db_path: str | os.PathLike) -> tuple[str, float] | None:
+    """Title and start time of the active Sesh in database storage.
+
+    The database is opened read-only and never created or migrated here.
+    """
+    import sqlite3
+    from datetime import datetime
+
+    try:
+        db_conn = sqlite3.connect(f"file:{os.fspath(db_path)}?mode=ro", uri=True)
+    except sqlite3.Error:
+        # no database yet, so no active Sesh
+        return None
+    try:
+        row = db_conn.execute(
+            "SELECT title, start_time FROM active_sesh WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        # not migrated yet
+        return None
+    except sqlite3.Error as e:
+        raise SessionStorageError(f"Failed to read active session: {e}") from e
+    finally:
+        db_conn.close()
+
+    if row is None:
+        return None
+    if isinstance(row[1], int):
+        return (row[0], float(row[1]))
+    try:
+        # ISO-8601 text in a database not migrated to Unix seconds yet
+        return (row[0], datetime.fromisoformat(row[1]).timestamp())
+    except ValueError as e:
+        raise SessionStorageError(f"Invalid active session: {e}") from e
+
+
+def prompt_line(
+    current_path: str | os.PathLike, db_path: str | os.PathLike | None = None
+) -> str:
+    """Return a one-line summary of the current Sesh, or "" when none is active.
+
+    With ``db_path`` (database storage), the active_sesh table is read when no
+    current Sesh file is waiting to be moved into it.
+    """
+    try:
+        with open(current_path, "rb") as f:
+            raw = f.read()
+
+        if is_binary(raw):
+            # decode only the title, tags are not shown
+            (start_ns, title_len, _) = unpack_header(raw)
+            title = raw[HEADER.size : HEADER.size + title_len].decode("utf-8")
+            start = start_ns / 1e9
+        else:
+            # the JSON parser is only loaded for JSON session files
+            import json
+            from datetime import datetime
+
+            data = json.loads(raw)
+            if not data:
+                return ""
+
+            title = data["title"]
+            start = datetime.fromisoformat(data["start_time"]).timestamp()
+    except FileNotFoundError:
+        if db_path is None:
+            return ""
+        active = read_active_row(db_path)
+        if active is None:
+            return ""
+        (title, start) = active
+    except OSError as e:
+        raise SessionStorageError(f"Failed to read session file: {e}") from e
+    except (ValueError, KeyError, TypeError) as e:
+        raise SessionStorageError(f"Invalid session file format: {e}") from e
+
+    if len(title) > PROMPT_TITLE_WIDTH:
+        title = title[: PROMPT_TITLE_WIDTH - 1] + "…"
+    elapsed = max(0, int(time.time() - start))
+    return f"{title} ({format_compact_elapsed(elapsed)})"
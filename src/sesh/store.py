@@ -1,182 +1,896 @@
 import contextlib
+import functools
+import itertools
+import json
 import sqlite3
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
-from whenever import Instant
+from whenever import Instant, TimeDelta
 
-from sesh.current import CurrentManager, CurrentSesh
+from sesh import trace
+from sesh.config import Config
+from sesh.current import CurrentManager, CurrentSesh, DbCurrentManager
 from sesh.error import (
+    AmbiguousSeshError,
     DatabaseError,
+    InvalidSeshDataError,
     MigrationError,
     NoActiveSeshError,
-    SeshInProgressError,
+    SeshNotFoundError,
+    SessionStorageError,
 )
+from sesh.importer import ImportedSesh
+from sesh.lock import FileLock
+from sesh.migration import apply_migrations, count_migrations
+from sesh.parser.basic import QUERY_CACHE_SIZE, UID_CHARACTERS, SeshQuery
 from sesh.parser.tag import Tag
+from sesh.paths import CURRENT_SESSION_JSON, DATA_SQLITE, DATABASE_STORAGE, LOCK_FILE
+
+# Bound parameters per multi-row tag upsert, well below SQLITE_MAX_VARIABLE_NUMBER
+UPSERT_CHUNK_SIZE = 500
+IMPORT_BATCH_SIZE = 50_000
+EXPORT_FETCH_SIZE = 5_000
+
+# Seconds a write waits for another connection's write lock before failing
+# with "database is locked"
+BUSY_TIMEOUT = 10.0
+
+# Full-text search result size, snippet length in words, and how much more a
+# match in the title counts than one in the details
+SEARCH_LIMIT = 20
+SEARCH_SNIPPET_WORDS = 12
+SEARCH_TITLE_WEIGHT = 4.0
+
+# Leading uid characters printed for a saved Sesh, and the number of
+# candidates listed when a short id is ambiguous
+SHORT_UID_LENGTH = 6
+AMBIGUOUS_UID_PREVIEW = 5
+
+# Comma-separated tag names of the Sesh ``s``
+SESH_TAGS = (
+    "coalesce(("
+    "SELECT group_concat(t.tag_name, ',') FROM sesh_tag st "
+    "JOIN tag t ON t.tag_id = st.tag_id WHERE st.sesh_id = s.sesh_id"
+    "), '')"
+)
+
+# Times are stored as Unix seconds and read back as ISO-8601 (sesh_iso view)
+ISO_TIME = "strftime('%Y-%m-%dT%H:%M:%SZ', {}, 'unixepoch')"
 
-DATA_SQLITE = "store.db"
-CURRENT_SESSION_JSON = "current.json"
+# Columns of a saved Sesh as returned by iter_seshes and get_sesh
+SESH_COLUMNS = (
+    "s.sesh_uid, s.title, s.details, "
+    f"{ISO_TIME.format('s.start_time')}, {ISO_TIME.format('s.end_time')}, {SESH_TAGS}"
+)
+
+# Grouping keys for time-based reports, computed from a UTC day (YYYY-MM-DD).
+# ISO weeks belong to the year of their Thursday.
+REPORT_PERIODS = {
+    "day": "{day}",
+    "week": (
+        "printf('%s-W%02d', "
+        "strftime('%Y', {day}, '-3 days', 'weekday 4'), "
+        "(strftime('%j', {day}, '-3 days', 'weekday 4') - 1) / 7 + 1)"
+    ),
+    "month": "substr({day}, 1, 7)",
+}
+
+# Restricts a sesh_id column to Seshes carrying (or not carrying) the tag
+# bound to the parameter
+TAG_SESH_IDS = (
+    "SELECT st.sesh_id FROM sesh_tag st WHERE st.tag_id = "
+    "(SELECT tag_id FROM tag WHERE tag_name = ?)"
+)
+TAG_FILTER = f"{{}} IN ({TAG_SESH_IDS})"
+EXCLUDED_TAG_FILTER = f"{{}} NOT IN ({TAG_SESH_IDS})"
 
 
 class Store:
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, config: Config | None = None) -> None:
         self.db_path = root / DATA_SQLITE
         self.current_path = root / CURRENT_SESSION_JSON
+        self.config = config if config is not None else Config.load(root)
+        # serializes start, stop and reset across processes
+        self.lock = FileLock(root / LOCK_FILE)
 
         self.init_root(root)
 
-        try:
-            self.db_conn = sqlite3.connect(self.db_path)
-        except sqlite3.Error as e:
-            raise DatabaseError(f"Failed to connect to database: {e}") from e
+        # the database is opened on first use, see db_conn
+        self._db_conn: sqlite3.Connection | None = None
 
-        self.current_manager = CurrentManager(self.current_path)
+        # tag name -> tag_id, loaded on first use, see tag_ids
+        self._tag_ids: dict[str, int] | None = None
+        self._tag_data_version: int | None = None
+        self.tag_cache_hits = 0
+        self.tag_cache_misses = 0
+
+        self.current_manager: CurrentManager | DbCurrentManager
+        if self.config.current_storage == DATABASE_STORAGE:
+            self.current_manager = DbCurrentManager(
+                lambda: self.db_conn, self.current_path, self.config
+            )
+        else:
+            self.current_manager = CurrentManager(self.current_path, self.config)
+
+    @property
+    def db_conn(self) -> sqlite3.Connection:
+        """Database connection, opened and migrated on first access.
+
+        Commands that only touch the current Sesh never open the database.
+        """
+        if self._db_conn is None:
+            self.connect()
+        return self._db_conn
 
     def init_root(self, root: Path) -> None:
-        # create directories and empty file
+        # create directories
         root.mkdir(parents=True, exist_ok=True)
-        self.db_path.touch(exist_ok=True)
 
-        # run migration
-        self.migrate()
+    def connect(self) -> None:
+        with trace.span("connect"):
+            try:
+                # writes take the write lock when their transaction begins, so
+                # they wait in the busy handler instead of failing half way when
+                # another process wrote in between
+                self._db_conn = sqlite3.connect(
+                    self.db_path,
+                    timeout=BUSY_TIMEOUT,
+                    isolation_level="IMMEDIATE",
+                    cached_statements=self.config.statement_cache_size(),
+                    factory=trace.connection_factory(),
+                )
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to connect to database: {e}") from e
+
+            # names and values are validated by Config, PRAGMAs take no parameters
+            try:
+                for name, value in self.config.connection_pragmas().items():
+                    self._db_conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as e:
+                self.close()
+                raise DatabaseError(f"Failed to configure database: {e}") from e
 
-    def migrate(self) -> None:
-        """Run all migration scripts in alphabetical order."""
-        migrations_dir = Path.cwd() / "migrations"
+            # run migration
+            try:
+                self.migrate()
+            except BaseException:
+                self.close()
+                raise
 
-        if not migrations_dir.exists():
-            return  # No migrations directory, skip
+            # enforce sesh_tag references and their ON DELETE CASCADE; only
+            # now, since migrations rebuilding a table must not cascade
+            try:
+                self._db_conn.execute("PRAGMA foreign_keys = ON")
+            except sqlite3.Error as e:
+                self.close()
+                raise DatabaseError(f"Failed to configure database: {e}") from e
 
-        # get all .sql files in migrations directory
-        migration_files = sorted(migrations_dir.glob("*.sql"))
+    def connect_read_only(self) -> None:
+        """Open the database for queries only, without creating or migrating it.
 
-        # open database connection
+        Used to read other projects' stores. The database must exist and be
+        migrated by this version of Sesh already.
+        """
+        uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
         try:
-            db_conn = sqlite3.connect(self.db_path)
+            self._db_conn = sqlite3.connect(
+                uri,
+                uri=True,
+                timeout=BUSY_TIMEOUT,
+                factory=trace.connection_factory(),
+            )
+            (user_version,) = self._db_conn.execute("PRAGMA user_version").fetchone()
         except sqlite3.Error as e:
-            raise DatabaseError(
-                f"Failed to connect to database for migration: {e}"
-            ) from e
+            self.close()
+            raise DatabaseError(f"Failed to open {self.db_path}: {e}") from e
+
+        if user_version != count_migrations():
+            self.close()
+            raise MigrationError(
+                f"{self.db_path} has schema version {user_version}, run any "
+                "sesh command in its project to migrate it"
+            )
 
-        # execute each migration file
-        for migration_file in migration_files:
-            try:
-                with open(migration_file) as f:
-                    migration_sql = f.read()
-
-                # Execute the migration SQL
-                db_conn.executescript(migration_sql)
-                db_conn.commit()
-            except OSError as e:
-                raise MigrationError(
-                    f"Failed to read migration file {migration_file}: {e}"
-                ) from e
-            except sqlite3.Error as e:
-                raise MigrationError(
-                    f"Failed to execute migration script {migration_file}: {e}"
-                ) from e
-            except Exception as e:
-                raise MigrationError(
-                    f"Unexpected error during migration {migration_file}: {e}"
-                ) from e
+    def close(self) -> None:
+        self.invalidate_tag_cache()
+        if self._db_conn is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._db_conn.close()
+            self._db_conn = None
 
-        with contextlib.suppress(sqlite3.Error):
-            db_conn.close()
+    def migrate(self) -> None:
+        """Apply pending migration scripts shipped with the package."""
+        with trace.span("migrate"):
+            apply_migrations(self.db_conn)
+
+    @contextlib.contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Commit on success, or roll back and drop the tag-id cache on error.
+
+        Tags inserted by a rolled back transaction no longer exist, so the ids
+        cached for them must not be used again. With ``immediate`` the write
+        lock is taken up front, so that values read at the start of the
+        transaction cannot be changed by another writer before it writes.
+        """
+        try:
+            with self.db_conn as db_conn:
+                if immediate and not db_conn.in_transaction:
+                    db_conn.execute("BEGIN IMMEDIATE")
+                yield db_conn
+        except BaseException:
+            self.invalidate_tag_cache()
+            raise
 
     def start_sesh(
         self,
         title: str,
         tags: list[Tag],
     ) -> None:
-        # check that no active Sesh
-        if self.current_manager.read() is not None:
-            raise SeshInProgressError()
+        # raises SeshInProgressError when a Sesh is active
+        with self.lock:
+            self.current_manager.start(CurrentSesh(title, tags, Instant.now()))
 
-        # create new Sesh
-        current = CurrentSesh(title, tags, Instant.now())
+    def end_sesh(self, details: str, tags: list[Tag]) -> str:
+        # the Sesh must not be saved twice by concurrent stops
+        with self.lock:
+            return self._end_sesh(details, tags)
 
-        # write Sesh to file
-        self.current_manager.write(current)
+    def _end_sesh(self, details: str, tags: list[Tag]) -> str:
+        try:
+            # take the current Sesh and save it with its tags and relationships
+            # in a single transaction
+            with self.transaction():
+                # in database storage the active row is deleted here and
+                # restored on rollback, a current file is only removed once saved
+                current_sesh = self.current_manager.begin_stop()
+
+                # error when no active Sesh
+                if current_sesh is None:
+                    raise NoActiveSeshError()
+
+                # merge tags
+                tag_names = sorted({str(tag) for tag in [*current_sesh.tags, *tags]})
+
+                (sesh_id, sesh_uid) = self.db_conn.execute(
+                    "INSERT INTO sesh (title, details, start_time, end_time) "
+                    "VALUES (?, ?, ?, ?) RETURNING sesh_id, sesh_uid",
+                    (
+                        current_sesh.title,
+                        details,
+                        current_sesh.start_time.round().timestamp(),
+                        Instant.now().round().timestamp(),
+                    ),
+                ).fetchone()
+
+                if tag_names:
+                    self.db_conn.executemany(
+                        "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (?, ?)",
+                        [
+                            (sesh_id, tag_id)
+                            for tag_id in self.tag_ids(tag_names).values()
+                        ],
+                    )
+        except (
+            MigrationError,
+            NoActiveSeshError,
+            SessionStorageError,
+            InvalidSeshDataError,
+        ):
+            raise
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Database operation failed: {e}") from e
+        except Exception as e:
+            raise DatabaseError(f"Unexpected error during session save: {e}") from e
 
-    def end_sesh(self, details: str, tags: list[Tag]) -> str:
-        # pop current Sesh
-        current_sesh = self.current_manager.pop()
+        # clear current Sesh - will raise SessionStorageError if it fails
+        self.current_manager.finish_stop()
 
-        # error when no active Sesh
-        if current_sesh is None:
-            raise NoActiveSeshError()
+        return sesh_uid[:SHORT_UID_LENGTH]
 
-        # merge tags
-        current_sesh.tags = list(set(tags).union(current_sesh.tags))
+    def tag_ids(self, tag_names: list[str]) -> dict[str, int]:
+        """Return the ids of the given tag names, creating missing tags.
 
-        try:
-            # insert tags and get tag ids
-            cur = self.db_conn.cursor()
-            tag_ids = []
-            if current_sesh.tags:  # Only insert tags if the list is not empty
-                cur.executemany(
-                    "INSERT OR IGNORE INTO tag (tag_name) VALUES (?)",
-                    [(str(tag),) for tag in current_sesh.tags],
-                )
-                cur.execute(
-                    "SELECT tag_id FROM tag WHERE tag_name IN ({})".format(
-                        ",".join("?" * len(current_sesh.tags))
+        Ids are served from an in-process cache of the tag table, so tagging a
+        Sesh with known tags needs no lookup. The cache is reloaded when
+        another connection changed the database (``PRAGMA data_version``);
+        code on this connection that renames or deletes tags must call
+        invalidate_tag_cache. Must be called inside Store.transaction.
+        """
+        (data_version,) = self.db_conn.execute("PRAGMA data_version").fetchone()
+        if self._tag_ids is None or data_version != self._tag_data_version:
+            self._tag_ids = dict(
+                self.db_conn.execute("SELECT tag_name, tag_id FROM tag")
+            )
+            self._tag_data_version = data_version
+
+        missing = [name for name in tag_names if name not in self._tag_ids]
+        self.tag_cache_misses += len(missing)
+        self.tag_cache_hits += len(tag_names) - len(missing)
+        if missing:
+            self._tag_ids.update(self.upsert_tags(missing))
+        return {name: self._tag_ids[name] for name in tag_names}
+
+    def invalidate_tag_cache(self) -> None:
+        """Drop cached tag ids, they are reloaded on next use."""
+        self._tag_ids = None
+        self._tag_data_version = None
+
+    def upsert_tags(self, tag_names: list[str]) -> dict[str, int]:
+        """Insert missing tags and return the ids of all given tag names.
+
+        Must be called inside a transaction; raises sqlite3.Error.
+        """
+        tag_ids = {}
+        for start in range(0, len(tag_names), UPSERT_CHUNK_SIZE):
+            chunk = tag_names[start : start + UPSERT_CHUNK_SIZE]
+            tag_ids.update(
+                self.db_conn.execute(
+                    "INSERT INTO tag (tag_name) VALUES {} "
+                    "ON CONFLICT (tag_name) DO UPDATE SET tag_name = excluded.tag_name "
+                    "RETURNING tag_name, tag_id".format(
+                        ", ".join(["(?)"] * len(chunk))
                     ),
-                    [str(tag) for tag in current_sesh.tags],
+                    chunk,
                 )
-                tag_ids = [row[0] for row in cur.fetchall()]
-                self.db_conn.commit()
-
-            # insert Sesh
-            cur.execute(
-                "INSERT INTO sesh (title, details, start_time, end_time) "
-                "VALUES (?, ?, ?, ?)",
-                (
-                    current_sesh.title,
-                    details,
-                    current_sesh.start_time.round().format_common_iso(),
-                    Instant.now().round().format_common_iso(),
-                ),
-            )
-            self.db_conn.commit()
-
-            # get sesh id
-            cur.execute("SELECT last_insert_rowid()")
-            result = cur.fetchone()
-            if not result:
-                raise DatabaseError("Failed to get sesh ID after insertion")
-            sesh_id = result[0]
-
-            # insert sesh-tag relationships
-            if tag_ids:  # Only insert relationships if we have tag IDs
-                cur.executemany(
-                    "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (?, ?)",
-                    [(sesh_id, tag_id) for tag_id in tag_ids],
+            )
+        return tag_ids
+
+    def import_seshes(
+        self,
+        seshes: Iterable[ImportedSesh],
+        batch_size: int = IMPORT_BATCH_SIZE,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> int:
+        """Bulk insert completed Seshes and their tags, returning how many were saved.
+
+        Seshes are written in transactions of ``batch_size`` rows with explicit
+        ids, so rows and their tag links go through one executemany each instead
+        of a round-trip per Sesh. ``on_batch`` is called with the running total
+        after every committed batch.
+        """
+        total = 0
+        try:
+            for batch in itertools.batched(seshes, batch_size, strict=False):
+                # the ids are assigned here rather than by SQLite, so no other
+                # Sesh may be saved between reading the next id and inserting
+                with self.transaction(immediate=True):
+                    tag_ids = self.tag_ids(
+                        sorted({name for sesh in batch for name in sesh.tags})
+                    )
+
+                    next_id = self.next_sesh_id()
+
+                    self.db_conn.executemany(
+                        "INSERT INTO sesh "
+                        "(sesh_id, title, details, start_time, end_time) "
+                        "VALUES (?, ?, ?, unixepoch(?), unixepoch(?))",
+                        [
+                            (
+                                next_id + i,
+                                sesh.title,
+                                sesh.details,
+                                sesh.start_time,
+                                sesh.end_time,
+                            )
+                            for (i, sesh) in enumerate(batch)
+                        ],
+                    )
+                    self.db_conn.executemany(
+                        "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (?, ?)",
+                        [
+                            (next_id + i, tag_ids[name])
+                            for (i, sesh) in enumerate(batch)
+                            for name in sesh.tags
+                        ],
+                    )
+
+                total += len(batch)
+                if on_batch is not None:
+                    on_batch(total)
+        except MigrationError:
+            raise
+        except sqlite3.Error as e:
+            raise DatabaseError(
+                f"Import failed after {total} Seshes were saved: {e}"
+            ) from e
+
+        return total
+
+    def iter_seshes(
+        self,
+        since: Instant | None = None,
+        until: Instant | None = None,
+        tags: list[Tag] | None = None,
+        fetch_size: int = EXPORT_FETCH_SIZE,
+    ) -> Iterator[tuple[str, str, str, str, str, str]]:
+        """Stream saved Seshes in start time order.
+
+        Yields ``(sesh_uid, title, details, start_time, end_time, tags)`` tuples,
+        with tags comma-separated, fetched ``fetch_size`` rows at a time so that
+        memory use does not grow with the store. Seshes are filtered by start
+        time (``since`` inclusive, ``until`` exclusive) and must carry every tag
+        in ``tags``; the filters are answered from idx_sesh_start_time and
+        idx_sesh_tag_tag_id.
+        """
+        query, params = Store.build_sesh_filter(since, until, tags)
+        try:
+            cur = self.db_conn.execute(
+                f"SELECT {SESH_COLUMNS} FROM sesh s{query} ORDER BY s.start_time",
+                params,
+            )
+            while rows := cur.fetchmany(fetch_size):
+                yield from rows
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to read Seshes: {e}") from e
+
+    def resolve_uid(self, prefix: str) -> str:
+        """Expand a (short) Sesh id to the full uid of the one Sesh it starts.
+
+        The prefix is matched with a range scan on the UNIQUE sesh_uid index,
+        so lookups take O(log n) regardless of the store size.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix or not UID_CHARACTERS.issuperset(prefix):
+            raise SeshNotFoundError(prefix)
+
+        (lower, upper) = Store.uid_range(prefix)
+        try:
+            matches = [
+                uid
+                for (uid,) in self.db_conn.execute(
+                    "SELECT sesh_uid FROM sesh WHERE sesh_uid >= ? AND sesh_uid < ? "
+                    "ORDER BY sesh_uid LIMIT ?",
+                    (lower, upper, AMBIGUOUS_UID_PREVIEW + 1),
                 )
-                self.db_conn.commit()
+            ]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to look up Sesh: {e}") from e
+
+        if not matches:
+            raise SeshNotFoundError(prefix)
+        if len(matches) > 1:
+            # show just enough of each uid to tell the candidates apart
+            width = len(prefix) + SHORT_UID_LENGTH
+            shown = [uid[:width] for uid in matches[:AMBIGUOUS_UID_PREVIEW]]
+            if len(matches) > AMBIGUOUS_UID_PREVIEW:
+                shown.append("...")
+            raise AmbiguousSeshError(prefix, shown)
+        return matches[0]
+
+    @staticmethod
+    def uid_range(prefix: str) -> tuple[str, str]:
+        """Bounds ``lower <= uid < upper`` of the uids starting with ``prefix``."""
+        # every uid starting with the prefix sorts below the prefix with its
+        # last character incremented
+        return (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1))
+
+    def find_seshes(
+        self, query: SeshQuery
+    ) -> list[tuple[str, str, str, str, str, str]]:
+        """Return the saved Seshes matching ``query`` in start time order.
+
+        Rows have the columns of get_sesh.
+        """
+        (sql, params) = Store.build_find_query(query)
+        try:
+            return self.db_conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to query Seshes: {e}") from e
+
+    def edit_seshes(
+        self,
+        query: SeshQuery,
+        title: str | None = None,
+        details: str | None = None,
+        add_tags: list[Tag] | None = None,
+        remove_tags: list[Tag] | None = None,
+    ) -> int:
+        """Change every Sesh matching ``query`` in one transaction.
+
+        ``title`` and ``details`` replace the current values unless None.
+        Returns the number of Seshes changed.
+        """
+        (where, params) = Store.build_query_filter(query)
+        try:
+            with self.transaction():
+                sesh_ids = [
+                    sesh_id
+                    for (sesh_id,) in self.db_conn.execute(
+                        f"SELECT s.sesh_id FROM sesh s WHERE {where}", params
+                    )
+                ]
+                self._edit_seshes(sesh_ids, title, details, add_tags, remove_tags)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to edit Seshes: {e}") from e
+        return len(sesh_ids)
+
+    def edit_seshes_by_uid(
+        self,
+        sesh_uids: list[str],
+        title: str | None = None,
+        details: str | None = None,
+        add_tags: list[Tag] | None = None,
+        remove_tags: list[Tag] | None = None,
+    ) -> int:
+        """Change the Seshes with the given full uids in one transaction.
+
+        Used to edit exactly the Seshes a user confirmed, whatever was saved
+        or changed since they were listed. Returns the number of Seshes
+        changed, which is lower than requested if some were deleted.
+        """
+        try:
+            with self.transaction():
+                # one JSON parameter, so any number of uids fits the statement
+                sesh_ids = [
+                    sesh_id
+                    for (sesh_id,) in self.db_conn.execute(
+                        "SELECT sesh_id FROM sesh WHERE sesh_uid IN "
+                        "(SELECT value FROM json_each(?))",
+                        (json.dumps(sesh_uids),),
+                    )
+                ]
+                self._edit_seshes(sesh_ids, title, details, add_tags, remove_tags)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to edit Seshes: {e}") from e
+        return len(sesh_ids)
 
-            # fetch sesh uid
-            cur.execute("SELECT sesh_uid FROM sesh WHERE sesh_id = ?", (sesh_id,))
-            result = cur.fetchone()
-            if not result:
-                raise DatabaseError("Failed to fetch sesh UID") from None
-            sesh_uid = result[0]
+    def _edit_seshes(
+        self,
+        sesh_ids: list[int],
+        title: str | None,
+        details: str | None,
+        add_tags: list[Tag] | None,
+        remove_tags: list[Tag] | None,
+    ) -> None:
+        if title is not None or details is not None:
+            self.db_conn.executemany(
+                "UPDATE sesh SET title = coalesce(?, title), "
+                "details = coalesce(?, details) WHERE sesh_id = ?",
+                [(title, details, sesh_id) for sesh_id in sesh_ids],
+            )
+        if add_tags:
+            tag_ids = self.tag_ids(sorted({str(tag) for tag in add_tags}))
+            self.db_conn.executemany(
+                "INSERT OR IGNORE INTO sesh_tag (sesh_id, tag_id) VALUES (?, ?)",
+                itertools.product(sesh_ids, tag_ids.values()),
+            )
+        if remove_tags:
+            self.db_conn.executemany(
+                "DELETE FROM sesh_tag WHERE sesh_id = ? AND tag_id = "
+                "(SELECT tag_id FROM tag WHERE tag_name = ?)",
+                itertools.product(sesh_ids, [str(tag) for tag in remove_tags]),
+            )
 
-            return sesh_uid[:6]
+    @staticmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def build_find_query(query: SeshQuery) -> tuple[str, tuple[str | int, ...]]:
+        (where, params) = Store.build_query_filter(query)
+        return (
+            f"SELECT {SESH_COLUMNS} FROM sesh s WHERE {where} ORDER BY s.start_time",
+            params,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def build_query_filter(query: SeshQuery) -> tuple[str, tuple[str | int, ...]]:
+        """Compile a parsed query to a WHERE clause on ``sesh s`` and its parameters.
+
+        Every condition is answered from an index: start time ranges from
+        idx_sesh_time_range, uid prefixes from the UNIQUE sesh_uid index, tags
+        from idx_sesh_tag_tag_id and words from the sesh_fts index. Only a
+        query made of excluded tags alone has to scan. Results are cached per
+        query.
+        """
+        (clauses, params) = Store.build_sesh_clauses(
+            query.since, query.until, list(query.tags)
+        )
+        for tag in query.excluded_tags:
+            clauses.append(EXCLUDED_TAG_FILTER.format("s.sesh_id"))
+            params.append(str(tag))
+        if query.uid is not None:
+            clauses.append("s.sesh_uid >= ? AND s.sesh_uid < ?")
+            params.extend(Store.uid_range(query.uid))
+        if query.words:
+            clauses.append(
+                "s.sesh_id IN (SELECT rowid FROM sesh_fts WHERE sesh_fts MATCH ?)"
+            )
+            params.append(Store.build_match_query(" ".join(query.words)))
+        return (" AND ".join(clauses) or "1", tuple(params))
 
+    def get_sesh(self, prefix: str) -> tuple[str, str, str, str, str, str]:
+        """Return the saved Sesh with the given (short) id as iter_seshes does."""
+        sesh_uid = self.resolve_uid(prefix)
+        try:
+            return self.db_conn.execute(
+                f"SELECT {SESH_COLUMNS} FROM sesh s WHERE s.sesh_uid = ?", (sesh_uid,)
+            ).fetchone()
         except sqlite3.Error as e:
-            raise DatabaseError(f"Database operation failed: {e}") from e
-        except Exception as e:
-            raise DatabaseError(f"Unexpected error during session save: {e}") from e
+            raise DatabaseError(f"Failed to read Sesh: {e}") from e
+
+    def search(
+        self,
+        text: str,
+        since: Instant | None = None,
+        until: Instant | None = None,
+        tags: list[Tag] | None = None,
+        limit: int = SEARCH_LIMIT,
+        markers: tuple[str, str] = ("[", "]"),
+    ) -> list[tuple[str, str, str, str, str, str]]:
+        """Find saved Seshes whose title or details contain every word of ``text``.
+
+        Returns ``(sesh_uid, title, start_time, end_time, tags, snippet)`` rows,
+        best match first, with matched words in the snippet wrapped in
+        ``markers``. Words match on their stem ("migrations" finds "migrate"),
+        a trailing ``*`` matches any word with that prefix. Seshes are filtered
+        like iter_seshes.
+        """
+        match = Store.build_match_query(text)
+        if not match:
+            return []
+
+        clauses, params = Store.build_sesh_clauses(since, until, tags)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        try:
+            return self.db_conn.execute(
+                "SELECT s.sesh_uid, s.title, "
+                f"{ISO_TIME.format('s.start_time')}, {ISO_TIME.format('s.end_time')}, "
+                f"{SESH_TAGS}, "
+                "snippet(sesh_fts, -1, ?, ?, '...', ?) "
+                "FROM sesh_fts JOIN sesh s ON s.sesh_id = sesh_fts.rowid "
+                f"WHERE sesh_fts MATCH ?{where} "
+                "ORDER BY bm25(sesh_fts, ?, 1.0), s.start_time DESC LIMIT ?",
+                [
+                    *markers,
+                    SEARCH_SNIPPET_WORDS,
+                    match,
+                    *params,
+                    SEARCH_TITLE_WEIGHT,
+                    limit,
+                ],
+            ).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to search Seshes: {e}") from e
+
+    @staticmethod
+    def build_match_query(text: str) -> str:
+        """Quote each word of ``text`` so FTS5 operators in user input are inert."""
+        terms = []
+        for word in text.split():
+            prefix = word.endswith("*") and len(word) > 1
+            word = word.removesuffix("*") if prefix else word
+            terms.append(
+                '"{}"{}'.format(word.replace('"', '""'), "*" if prefix else "")
+            )
+        return " ".join(terms)
+
+    def report(
+        self,
+        group_by: str,
+        since: Instant | None = None,
+        until: Instant | None = None,
+        tags: list[Tag] | None = None,
+    ) -> list[tuple[str, int, int]]:
+        """Aggregate saved Seshes into ``(key, sesh count, seconds)`` rows.
+
+        Seshes are grouped by tag name, or split into the UTC days they cover
+        and grouped by day, ISO week (``2025-W01``) or month. A Sesh is counted
+        in the period it started in. The range is widened to whole UTC days.
+        Tag groups are ordered by duration, time groups chronologically.
+
+        Reports are read from the daily rollups unless they need more than one
+        tag at a time, in which case Seshes are split on the fly.
+        """
+        tags = tags or []
+        since_day, until_day = Store.report_days(since, until)
+        if not tags or (group_by != "tag" and len(tags) == 1):
+            sql, params = Store.build_rollup_query(group_by, since_day, until_day, tags)
+        else:
+            sql, params = Store.build_sesh_day_query(
+                group_by, since_day, until_day, tags
+            )
+
+        try:
+            return self.db_conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to build report: {e}") from e
+
+    @staticmethod
+    def report_days(
+        since: Instant | None, until: Instant | None
+    ) -> tuple[str | None, str | None]:
+        """Widen a time range to the UTC days ``[since_day, until_day)``."""
+        since_day = since.format_common_iso()[:10] if since is not None else None
+        until_day = None
+        if until is not None:
+            # round up to the next midnight unless already on one
+            until = until + TimeDelta(hours=24, nanoseconds=-1)
+            until_day = until.format_common_iso()[:10]
+        return since_day, until_day
+
+    @staticmethod
+    def build_rollup_query(
+        group_by: str, since_day: str | None, until_day: str | None, tags: list[Tag]
+    ) -> tuple[str, list[str]]:
+        """Build a report query over ``sesh_day_rollup`` for at most one tag."""
+        clauses = []
+        params = []
+        if group_by == "tag":
+            clauses.append("r.tag_id != 0")
+        elif tags:
+            clauses.append("r.tag_id = (SELECT tag_id FROM tag WHERE tag_name = ?)")
+            params.append(str(tags[0]))
+        else:
+            clauses.append("r.tag_id = 0")
+        if since_day is not None:
+            clauses.append("r.day >= ?")
+            params.append(since_day)
+        if until_day is not None:
+            clauses.append("r.day < ?")
+            params.append(until_day)
+        where = " AND ".join(clauses)
+
+        if group_by == "tag":
+            sql = (
+                "SELECT t.tag_name, sum(r.sesh_count), sum(r.seconds) "
+                "FROM sesh_day_rollup r JOIN tag t ON t.tag_id = r.tag_id "
+                f"WHERE {where} GROUP BY r.tag_id ORDER BY 3 DESC, 1"
+            )
+        else:
+            period = REPORT_PERIODS[group_by].format(day="r.day")
+            sql = (
+                f"SELECT {period} AS period, sum(r.sesh_count), sum(r.seconds) "
+                f"FROM sesh_day_rollup r WHERE {where} "
+                "GROUP BY period ORDER BY period"
+            )
+        return sql, params
+
+    @staticmethod
+    def build_sesh_day_query(
+        group_by: str, since_day: str | None, until_day: str | None, tags: list[Tag]
+    ) -> tuple[str, list[str]]:
+        """Build a report query splitting matching Seshes with the sesh_day view."""
+        clauses = []
+        params = []
+        if since_day is not None:
+            # the time bounds on sesh let SQLite narrow Seshes through an index
+            clauses.extend(["d.end_time >= unixepoch(?)", "d.day >= ?"])
+            params.extend([since_day, since_day])
+        if until_day is not None:
+            clauses.extend(["d.start_time < unixepoch(?)", "d.day < ?"])
+            params.extend([until_day, until_day])
+        for tag in tags:
+            clauses.append(TAG_FILTER.format("d.sesh_id"))
+            params.append(str(tag))
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+
+        if group_by == "tag":
+            sql = (
+                "SELECT t.tag_name, sum(d.started), sum(d.seconds) FROM sesh_day d "
+                "JOIN sesh_tag st ON st.sesh_id = d.sesh_id "
+                f"JOIN tag t ON t.tag_id = st.tag_id{where} "
+                "GROUP BY t.tag_id ORDER BY 3 DESC, 1"
+            )
+        else:
+            period = REPORT_PERIODS[group_by].format(day="d.day")
+            sql = (
+                f"SELECT {period} AS period, sum(d.started), sum(d.seconds) "
+                f"FROM sesh_day d{where} GROUP BY period ORDER BY period"
+            )
+        return sql, params
+
+    def rebuild_rollups(self) -> int:
+        """Recompute the daily rollups from saved Seshes, returning the row count."""
+        try:
+            with self.db_conn:
+                self.db_conn.execute("DELETE FROM sesh_day_rollup")
+                self.db_conn.execute(
+                    "INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds) "
+                    "SELECT day, 0, sum(started), sum(seconds) FROM sesh_day "
+                    "GROUP BY day"
+                )
+                self.db_conn.execute(
+                    "INSERT INTO sesh_day_rollup (day, tag_id, sesh_count, seconds) "
+                    "SELECT d.day, st.tag_id, sum(d.started), sum(d.seconds) "
+                    "FROM sesh_day d JOIN sesh_tag st ON st.sesh_id = d.sesh_id "
+                    "GROUP BY d.day, st.tag_id"
+                )
+                (count,) = self.db_conn.execute(
+                    "SELECT count(*) FROM sesh_day_rollup"
+                ).fetchone()
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to rebuild rollups: {e}") from e
+        return count
+
+    @staticmethod
+    def build_sesh_filter(
+        since: Instant | None, until: Instant | None, tags: list[Tag] | None
+    ) -> tuple[str, list[str | int]]:
+        """Build the WHERE clause selecting Seshes from ``sesh s`` by time and tags."""
+        clauses, params = Store.build_sesh_clauses(since, until, tags)
+        if not clauses:
+            return "", params
+        return " WHERE " + " AND ".join(clauses), params
+
+    @staticmethod
+    def build_sesh_clauses(
+        since: Instant | None, until: Instant | None, tags: list[Tag] | None
+    ) -> tuple[list[str], list[str | int]]:
+        """Build the conditions of build_sesh_filter for combining with others."""
+        clauses = []
+        params = []
+        if since is not None:
+            clauses.append("s.start_time >= ?")
+            params.append(since.round().timestamp())
+        if until is not None:
+            clauses.append("s.start_time < ?")
+            params.append(until.round().timestamp())
+        for tag in tags or []:
+            clauses.append(TAG_FILTER.format("s.sesh_id"))
+            params.append(str(tag))
+        return clauses, params
+
+    def next_sesh_id(self) -> int:
+        """Return the id AUTOINCREMENT would assign to the next Sesh."""
+        (next_id,) = self.db_conn.execute(
+            "SELECT max("
+            "coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'sesh'), 0), "
+            "coalesce((SELECT max(sesh_id) FROM sesh), 0)"
+            ") + 1"
+        ).fetchone()
+        return next_id
 
     def reset_data(self) -> None:
-        """Reset all session data by deleting all rows from the database tables."""
+        """Reset all session data by replacing the database with an empty one.
+
+        A freshly migrated in-memory template is copied over the database with
+        the backup API in a single step. The copy is one atomic write that
+        truncates the file, so it takes milliseconds however large the store
+        is, keeps the journal mode, and other open connections see the empty
+        database instead of a file that was swapped under them.
+        """
+        self.invalidate_tag_cache()
         try:
-            self.db_conn.execute("DELETE FROM sesh")
-            self.db_conn.execute("DELETE FROM tag")
-            self.db_conn.commit()
+            with self.lock:
+                (page_size,) = self.db_conn.execute("PRAGMA page_size").fetchone()
+                template = sqlite3.connect(":memory:")
+                try:
+                    # a WAL database only accepts pages of its own size
+                    template.execute(f"PRAGMA page_size = {int(page_size)}")
+                    apply_migrations(template)
+                    template.backup(self.db_conn)
+                finally:
+                    template.close()
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to reset database: {e}") from e
 
+    def collect_garbage(self) -> tuple[int, int]:
+        """Delete orphaned Sesh-tag links and tags no Sesh uses.
+
+        Links to missing Seshes or tags are left by stores written without
+        foreign key enforcement. Built-in tags are kept. Returns the number
+        of links and tags deleted.
+        """
+        try:
+            with self.transaction():
+                links = self.db_conn.execute(
+                    "DELETE FROM sesh_tag "
+                    "WHERE sesh_id NOT IN (SELECT sesh_id FROM sesh) "
+                    "OR tag_id NOT IN (SELECT tag_id FROM tag)"
+                ).rowcount
+                tags = self.db_conn.execute(
+                    "DELETE FROM tag WHERE is_builtin = 0 "
+                    "AND tag_id NOT IN (SELECT tag_id FROM sesh_tag)"
+                ).rowcount
+                self.db_conn.execute(
+                    "DELETE FROM sesh_day_rollup WHERE tag_id != 0 "
+                    "AND tag_id NOT IN (SELECT tag_id FROM tag)"
+                )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to collect garbage: {e}") from e
+        self.invalidate_tag_cache()
+        return links, tags
+
     def load(self) -> None:
         pass
 
@@ -0,0 +1,230 @@
+"""Per-phase timings and an SQL statement trace for diagnosing slow commands.
+
+Enabled with ``sesh --profile [--profile-output FILE] COMMAND`` or with
+``SESH_TRACE=1`` (or ``SESH_TRACE=FILE``) in the environment. The trace lists
+the phases of the command (startup, opening the store, migrations, current
+Sesh file I/O, the command itself) and every SQL statement with its duration
+and row count. Parameters are never recorded, so traces can be attached to
+bug reports.
+
+Without a file the trace is printed to stderr. A ``.json`` file receives
+Chrome trace events (chrome://tracing, Perfetto), a ``.prof`` or ``.pstats``
+file a cProfile dump of the command for pstats or snakeviz.
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Iterator
+from typing import Any
+
+# SESH_TRACE values printing the trace to stderr, and values leaving tracing off
+STDERR_OUTPUTS = ("1", "-", "stderr")
+OFF_OUTPUTS = ("", "0")
+PROFILE_SUFFIXES = (".prof", ".pstats")
+
+# Statements are shortened to this many characters in the stderr summary
+STATEMENT_WIDTH = 100
+
+
+class Tracer:
+    """Records timed events and writes them out in finish()."""
+
+    def __init__(self, output: str) -> None:
+        self.output = output
+        self.origin = time.perf_counter()
+        self.events: list[dict[str, Any]] = []
+
+        self.profiler = None
+        if output.endswith(PROFILE_SUFFIXES):
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def add(
+        self, name: str, category: str, start: float, end: float, **args: Any
+    ) -> dict[str, Any]:
+        """Record an event that ran from ``start`` to ``end`` (perf_counter)."""
+        event = {"name": name, "cat": category, "start": start, "end": end}
+        if args:
+            event["args"] = args
+        self.events.append(event)
+        return event
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the body as a phase called ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, "phase", start, time.perf_counter())
+
+    def finish(self) -> None:
+        """Write the trace to its output."""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.output)
+        elif self.output in STDERR_OUTPUTS:
+            sys.stderr.write(self.summary())
+            return
+        else:
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.trace_events()}, f)
+        sys.stderr.write(f"Trace written to {self.output}\n")
+
+    def summary(self) -> str:
+        """One line per event in start order, for reading on a terminal."""
+        lines = []
+        statements = 0
+        sql_seconds = 0.0
+        for event in sorted(self.events, key=lambda e: e["start"]):
+            ms = (event["end"] - event["start"]) * 1000
+            if event["cat"] == "sql":
+                statements += 1
+                sql_seconds += event["end"] - event["start"]
+                rows = event["args"]["rows"]
+                statement = " ".join(event["name"].split())
+                if len(statement) > STATEMENT_WIDTH:
+                    statement = statement[: STATEMENT_WIDTH - 3] + "..."
+                lines.append(f"sql    {ms:9.2f} ms {rows:>7} rows  {statement}")
+            else:
+                lines.append(f"phase  {ms:9.2f} ms  {event['name']}")
+        lines.append(
+            f"total  {statements} SQL statements in {sql_seconds * 1000:.2f} ms"
+        )
+        return "\n".join(lines) + "\n"
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """Events in the Chrome trace event format, times in microseconds."""
+        pid = os.getpid()
+        origin = min((event["start"] for event in self.events), default=0.0)
+        return [
+            {
+                "name": event["name"],
+                "cat": event["cat"],
+                "ph": "X",
+                "ts": round((event["start"] - origin) * 1e6, 1),
+                "dur": round((event["end"] - event["start"]) * 1e6, 1),
+                "pid": pid,
+                "tid": 0,
+                "args": event.get("args", {}),
+            }
+            for event in self.events
+        ]
+
+
+# The tracer of this process, if tracing is enabled
+active: Tracer | None = None
+
+NO_SPAN = contextlib.nullcontext()
+
+
+def start(output: str) -> Tracer | None:
+    """Enable tracing to ``output`` unless it is an off value."""
+    global active
+    if output in OFF_OUTPUTS:
+        return None
+    active = Tracer(output)
+    return active
+
+
+def stop() -> None:
+    """Write the trace of the active tracer and disable tracing."""
+    global active
+    tracer, active = active, None
+    if tracer is not None:
+        tracer.finish()
+
+
+def span(name: str) -> contextlib.AbstractContextManager:
+    """Time the body as a phase when tracing, do nothing otherwise."""
+    return NO_SPAN if active is None else active.span(name)
+
+
+def connection_factory() -> type[sqlite3.Connection]:
+    """Connection class for sqlite3.connect(), timing statements when tracing."""
+    return sqlite3.Connection if active is None else TracedConnection
+
+
+class TracedCursor(sqlite3.Cursor):
+    """Cursor adding the time and rows of its statement to the trace.
+
+    Fetching counts as part of the statement, SQLite computes rows on demand.
+    """
+
+    event: dict[str, Any] | None = None
+
+    def execute(self, sql: str, parameters=(), /) -> "TracedCursor":
+        return self.timed(sql, super().execute, sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters, /) -> "TracedCursor":
+        return self.timed(sql, super().executemany, sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str, /) -> "TracedCursor":
+        return self.timed(sql_script, super().executescript, sql_script)
+
+    def timed(self, sql: str, func, *args) -> "TracedCursor":
+        start = time.perf_counter()
+        try:
+            func(*args)
+        finally:
+            end = time.perf_counter()
+            if active is not None:
+                self.event = active.add(
+                    sql, "sql", start, end, rows=max(self.rowcount, 0)
+                )
+        return self
+
+    def fetched(self, start: float, rows: int) -> None:
+        if self.event is not None:
+            self.event["end"] += time.perf_counter() - start
+            self.event["args"]["rows"] += rows
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = super().fetchone()
+        self.fetched(start, row is not None)
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self.fetched(start, len(rows))
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self.fetched(start, len(rows))
+        return rows
+
+    def __next__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self.fetched(start, 0)
+            raise
+        self.fetched(start, 1)
+        return row
+
+
+class TracedConnection(sqlite3.Connection):
+    """Connection whose statements run on TracedCursors."""
+
+    def cursor(self, factory=TracedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters=(), /) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters, /) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str, /) -> sqlite3.Cursor:
+        return self.cursor().executescript(sql_script)
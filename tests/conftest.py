@@ -0,0 +1,18 @@
+import pytest
+
+from sesh.store import Store
+
+
+@pytest.fixture
+def store(request, tmp_path):
+    """A Store in a temporary directory holding the Seshes of the test module.
+
+    Seshes are imported from the module's ``SESHES`` list, or from the
+    parameter when the fixture is parametrized indirectly.
+    """
+    store = Store(tmp_path / ".sesh")
+    store.import_seshes(
+        getattr(request, "param", getattr(request.module, "SESHES", []))
+    )
+    yield store
+    store.close()
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+import pytest
+from whenever import Instant
+
+from sesh.aio import AsyncStore
+from sesh.config import Config
+from sesh.current import CurrentManager, CurrentSesh, DbCurrentManager
+from sesh.error import NoActiveSeshError, SeshInProgressError
+from sesh.importer import ImportedSesh
+from sesh.parser.tag import Tag
+from sesh.paths import CURRENT_SESSION_JSON, DATABASE_STORAGE
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def imported(i: int) -> ImportedSesh:
+    return ImportedSesh(
+        f"task {i}", "", "2025-01-01T09:00:00Z", "2025-01-01T10:00:00Z", ["batch"]
+    )
+
+
+class TestAsyncStore:
+    """Test cases for the asyncio Store facade."""
+
+    def test_start_status_stop(self, tmp_path):
+        """Test that start, status and stop behave like Store."""
+
+        async def scenario():
+            async with AsyncStore(tmp_path / ".sesh", Config(fsync=False)) as store:
+                await store.start_sesh("fix bug", [Tag("web")])
+                assert (await store.status()).title == "fix bug"
+                with pytest.raises(SeshInProgressError):
+                    await store.start_sesh("other", [])
+
+                uid = await store.end_sesh("done", [])
+                assert (await store.get_sesh(uid))[1] == "fix bug"
+                assert await store.status() is None
+                with pytest.raises(NoActiveSeshError):
+                    await store.end_sesh("", [])
+
+        run(scenario())
+
+    def test_status_adopts_file_on_writer(self, tmp_path, monkeypatch):
+        """Test that status moves a leftover current file in on the writer thread."""
+        root = tmp_path / ".sesh"
+        root.mkdir()
+        CurrentManager(root / CURRENT_SESSION_JSON, Config(fsync=False)).write(
+            CurrentSesh("left over", [], Instant.now())
+        )
+        threads = []
+        adopt_file = DbCurrentManager.adopt_file
+
+        def spy(self):
+            threads.append(threading.current_thread().name)
+            return adopt_file(self)
+
+        monkeypatch.setattr(DbCurrentManager, "adopt_file", spy)
+
+        async def scenario():
+            config = Config(fsync=False, current_storage=DATABASE_STORAGE)
+            async with AsyncStore(root, config) as store:
+                assert (await store.status()).title == "left over"
+
+        run(scenario())
+        assert threads and all(name.startswith("sesh-writer") for name in threads)
+        assert not (root / CURRENT_SESSION_JSON).exists()
+
+    def test_add_sesh_coalesces(self, tmp_path):
+        """Test that concurrent adds are saved in fewer transactions."""
+
+        async def scenario():
+            async with AsyncStore(tmp_path / ".sesh", Config(fsync=False)) as store:
+                await asyncio.gather(*(store.add_sesh(imported(i)) for i in range(50)))
+                assert store.batches < 50
+                assert await store.report("tag") == [("batch", 50, 50 * 3600)]
+
+        run(scenario())
+
+    def test_add_sesh_error_reaches_callers(self, tmp_path):
+        """Test that a failed batch raises in every call that was part of it."""
+
+        async def scenario():
+            async with AsyncStore(tmp_path / ".sesh", Config(fsync=False)) as store:
+                bad = ImportedSesh("x" * 200, "", "2025-01-01T09:00:00Z", "", [])
+                results = await asyncio.gather(
+                    store.add_sesh(bad), return_exceptions=True
+                )
+                assert isinstance(results[0], Exception)
+
+        run(scenario())
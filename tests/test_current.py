@@ -0,0 +1,157 @@
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+from whenever import Instant
+
+from sesh.cli import main
+from sesh.config import Config
+from sesh.current import CurrentManager, CurrentSesh
+from sesh.error import ConfigError, SessionStorageError
+from sesh.parser.tag import Tag
+from sesh.paths import SESH_DIR
+
+SESH = CurrentSesh(
+    "fix bug ✓", [Tag("bug"), Tag("web-dev")], Instant.from_utc(2025, 1, 1, 9)
+)
+
+
+@pytest.fixture(params=["json", "binary"])
+def manager(request, tmp_path):
+    return CurrentManager(
+        tmp_path / "current.json", Config(current_format=request.param, fsync=False)
+    )
+
+
+class TestCurrentManager:
+    """Test cases for reading and writing the current Sesh file."""
+
+    def test_round_trip(self, manager):
+        """Test that a written Sesh reads back unchanged in both formats."""
+        manager.write(SESH)
+        assert manager.read() == SESH
+        assert manager.pop() == SESH
+        assert manager.read() is None
+
+    def test_reads_either_format(self, tmp_path):
+        """Test that files are read by content, whatever the configured format."""
+        path = tmp_path / "current.json"
+        CurrentManager(path, Config(current_format="binary")).write(SESH)
+        assert path.read_bytes().startswith(b"SESH")
+        assert CurrentManager(path, Config(current_format="json")).read() == SESH
+
+        CurrentManager(path, Config(current_format="json")).write(SESH)
+        assert json.loads(path.read_text())["title"] == SESH.title
+        assert CurrentManager(path, Config(current_format="binary")).read() == SESH
+
+    def test_failed_write_keeps_old_file(self, manager, monkeypatch):
+        """Test that a write interrupted before the rename changes nothing."""
+        manager.write(SESH)
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        with pytest.raises(SessionStorageError):
+            manager.write(CurrentSesh("other", [], Instant.now()))
+
+        assert manager.read() == SESH
+        assert os.listdir(manager.current_path.parent) == ["current.json"]
+
+    def test_oversized_binary_title_raises(self, tmp_path):
+        """Test that a title too long for the binary header is a storage error."""
+        manager = CurrentManager(
+            tmp_path / "current.json", Config(current_format="binary", fsync=False)
+        )
+        with pytest.raises(SessionStorageError):
+            manager.write(CurrentSesh("✓" * 30_000, [], Instant.now()))
+        assert not manager.current_path.exists()
+
+    def test_truncated_file_raises(self, manager):
+        """Test that a truncated file is reported as invalid."""
+        manager.write(SESH)
+        data = manager.current_path.read_bytes()
+        manager.current_path.write_bytes(data[: len(data) - 3])
+        with pytest.raises(SessionStorageError):
+            manager.read()
+
+    def test_clear_without_file(self, manager):
+        """Test that clearing without an active Sesh is a no-op."""
+        manager.clear()
+        assert manager.read() is None
+
+
+class TestConfig:
+    """Test cases for settings from the environment."""
+
+    def test_defaults(self):
+        """Test the defaults when nothing is set."""
+        assert Config.from_env({}) == Config(current_format="json", fsync=True)
+
+    def test_values(self):
+        """Test that values are parsed case-insensitively."""
+        config = Config.from_env(
+            {
+                "SESH_CURRENT_FORMAT": "Binary",
+                "SESH_FSYNC": "off",
+                "SESH_CURRENT_STORAGE": "Database",
+            }
+        )
+        assert config == Config(
+            current_format="binary", fsync=False, current_storage="database"
+        )
+
+    def test_invalid_values(self):
+        """Test that invalid values raise ConfigError."""
+        with pytest.raises(ConfigError):
+            Config.from_env({"SESH_CURRENT_FORMAT": "xml"})
+        with pytest.raises(ConfigError):
+            Config.from_env({"SESH_FSYNC": "maybe"})
+        with pytest.raises(ConfigError):
+            Config.from_env({"SESH_CURRENT_STORAGE": "redis"})
+
+    def test_config_file(self, tmp_path):
+        """Test that config.toml is read and the environment overrides it."""
+        (tmp_path / "config.toml").write_text(
+            'fsync = false\ncurrent_format = "binary"\n\n'
+            '[database]\nprofile = "tuned"\nmmap_size = 0\ncached_statements = 64\n'
+        )
+        config = Config.load(tmp_path, {"SESH_CURRENT_FORMAT": "json"})
+        assert config.current_format == "json"
+        assert config.fsync is False
+        assert config.connection_pragmas()["mmap_size"] == 0
+        assert config.connection_pragmas()["journal_mode"] == "WAL"
+        assert config.statement_cache_size() == 64
+
+    def test_invalid_config_file(self, tmp_path):
+        """Test that unknown settings and bad PRAGMA values raise ConfigError."""
+        path = tmp_path / "config.toml"
+        for text in (
+            "colour = true",
+            "[database]\njournal_mode = 'fast'",
+            "[database]\ncache_size = '1 GB'",
+            "not toml",
+        ):
+            path.write_text(text)
+            with pytest.raises(ConfigError):
+                Config.load(tmp_path, {})
+
+    def test_invalid_config_file_cli_error(self, tmp_path, monkeypatch):
+        """Test that the CLI reports a bad config.toml as a configuration error."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / SESH_DIR).mkdir()
+        (tmp_path / SESH_DIR / "config.toml").write_text("colour = true")
+        result = CliRunner().invoke(main, ["status"])
+        assert result.exit_code == 1
+        assert "Error: Invalid configuration (config.toml: unknown setting" in (
+            result.stderr
+        )
+
+    def test_database_storage_implies_wal(self):
+        """Test that database storage turns on WAL with the default profile."""
+        assert Config().connection_pragmas() == {}
+        assert Config(current_storage="database").connection_pragmas() == {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+        }
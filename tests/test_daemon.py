@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import time
+
+from sesh.client import run_via_daemon
+from sesh.daemon import run_command
+from sesh.paths import DAEMON_SOCKET, SESH_DIR
+
+
+class TestRunCommand:
+    """Test cases for running commands inside the daemon."""
+
+    def test_output_and_exit_codes(self, store):
+        """Test that output is captured and errors become exit codes."""
+        assert run_command(store, ["start", "fix", "bug"], False)["code"] == 0
+
+        response = run_command(store, ["status"], False)
+        assert response["code"] == 0
+        assert "Active Sesh: fix bug" in response["out"]
+
+        response = run_command(store, ["start", "again"], False)
+        assert response["code"] == 1
+        assert "already in progress" in response["err"]
+
+        response = run_command(store, ["status", "--bogus"], False)
+        assert response["code"] == 2
+        assert "No such option" in response["err"]
+
+    def test_inline_tags_not_shared_between_requests(self, store):
+        """Test that inline tags of one request do not carry into the next."""
+        for args in (["start", "a", "+foo"], ["start", "b", "+bar"], ["start", "c"]):
+            assert run_command(store, args, False)["code"] == 0
+            assert run_command(store, ["stop"], False)["code"] == 0
+
+        rows = store.iter_seshes()
+        assert [(row[1], row[5]) for row in rows] == [
+            ("a foo", "foo"),
+            ("b bar", "bar"),
+            ("c", ""),
+        ]
+
+    def test_uses_given_store(self, store):
+        """Test that commands run against the daemon's Store."""
+        run_command(store, ["start", "fix"], False)
+        run_command(store, ["stop"], False)
+        assert store.next_sesh_id() == 2
+
+
+class TestClient:
+    """Test cases for handing commands to a running daemon."""
+
+    def test_no_daemon(self, tmp_path):
+        """Test that the client falls back when nothing is listening."""
+        assert run_via_daemon(os.fspath(tmp_path / "missing.sock"), ["status"]) is None
+
+    def test_local_only_command(self, tmp_path):
+        """Test that commands the daemon does not serve are not sent."""
+        assert run_via_daemon(os.fspath(tmp_path / "x.sock"), ["reset"]) is None
+
+    def test_round_trip(self, tmp_path, capsys):
+        """Test a command served by a daemon process, and its shutdown."""
+        socket_path = tmp_path / SESH_DIR / DAEMON_SOCKET
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "sesh", "daemon"],
+            cwd=tmp_path,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            deadline = time.monotonic() + 10
+            while not socket_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert run_via_daemon(os.fspath(socket_path), ["start", "fix"]) == 0
+            assert run_via_daemon(os.fspath(socket_path), ["status"]) == 0
+            assert "Active Sesh: fix" in capsys.readouterr().out
+        finally:
+            daemon.terminate()
+            daemon.wait(10)
+        assert not socket_path.exists()
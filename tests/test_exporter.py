@@ -0,0 +1,63 @@
+import io
+import json
+
+from whenever import Instant
+
+from sesh.exporter import write_csv, write_jsonl
+from sesh.importer import ImportedSesh, SeshReader
+from sesh.parser.tag import Tag
+
+SESHES = [
+    ImportedSesh("plan", "", "2025-01-01T09:00:00Z", "2025-01-01T10:00:00Z", ["a"]),
+    ImportedSesh(
+        "code", "x", "2025-01-02T09:00:00Z", "2025-01-02T12:00:00Z", ["a", "b"]
+    ),
+    ImportedSesh("test", "", "2025-01-03T09:00:00Z", "2025-01-03T09:30:00Z", []),
+]
+
+
+class TestIterSeshes:
+    """Test cases for streaming saved Seshes."""
+
+    def test_all_in_start_order(self, store):
+        """Test that every Sesh is returned in start time order with its tags."""
+        rows = list(store.iter_seshes(fetch_size=1))
+        assert [(r[1], r[5]) for r in rows] == [
+            ("plan", "a"),
+            ("code", "a,b"),
+            ("test", ""),
+        ]
+
+    def test_time_range(self, store):
+        """Test that since is inclusive and until exclusive on start time."""
+        rows = store.iter_seshes(
+            since=Instant.from_utc(2025, 1, 2, 9), until=Instant.from_utc(2025, 1, 3)
+        )
+        assert [r[1] for r in rows] == ["code"]
+
+    def test_all_tags_required(self, store):
+        """Test that tag filters must all match."""
+        assert [r[1] for r in store.iter_seshes(tags=[Tag("a")])] == ["plan", "code"]
+        assert [r[1] for r in store.iter_seshes(tags=[Tag("a"), Tag("b")])] == ["code"]
+        assert list(store.iter_seshes(tags=[Tag("missing")])) == []
+
+
+class TestWriters:
+    """Test cases for export writers."""
+
+    def test_csv_round_trips_through_import(self, store):
+        """Test that a CSV export can be imported again."""
+        out = io.StringIO()
+        assert write_csv(store.iter_seshes(), out) == 3
+
+        out.seek(0)
+        seshes = list(SeshReader("csv").read(out))
+        assert seshes == SESHES
+
+    def test_jsonl_tags_as_lists(self, store):
+        """Test that JSONL exports carry tags as lists."""
+        out = io.StringIO()
+        assert write_jsonl(store.iter_seshes(), out) == 3
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [r["tags"] for r in records] == [["a"], ["a", "b"], []]
@@ -0,0 +1,128 @@
+import io
+
+from sesh.importer import SeshReader
+
+CSV_HISTORY = """\
+title,details,start_time,end_time,tags
+write docs,first draft,2025-01-01T09:00:00Z,2025-01-01T10:00:00Z,"docs, Writing"
+backwards,,2025-01-01T09:00:00Z,2025-01-01T08:00:00Z,
+bad tag,,2025-01-01T09:00:00Z,2025-01-01T10:00:00Z,bad_tag
+offset,,2025-01-01T09:00:00+02:00,2025-01-01T10:00:00+02:00,docs
+"""
+
+TIMEWARRIOR_EXPORT = """\
+[
+{"id":2,"start":"20250101T090000Z","end":"20250101T100000Z","tags":["Code Review"]},
+{"id":1,"start":"20250102T090000Z","tags":["open"]}
+]
+"""
+
+
+class TestSeshReader:
+    """Test cases for streaming import records."""
+
+    def test_csv_valid_and_invalid_records(self):
+        """Test that valid CSV rows are normalized and invalid ones skipped."""
+        reader = SeshReader("csv")
+        seshes = list(reader.read(io.StringIO(CSV_HISTORY)))
+
+        assert [s.title for s in seshes] == ["write docs", "offset"]
+        assert seshes[0].tags == ["docs", "writing"]
+        assert seshes[1].start_time == "2025-01-01T07:00:00Z"
+        assert reader.skipped == 2
+        assert [number for number, _ in reader.errors] == [2, 3]
+
+    def test_jsonl_records(self):
+        """Test that JSONL records accept tag lists and report bad lines."""
+        reader = SeshReader("jsonl")
+        lines = (
+            '{"title": "a", "start_time": "2025-01-01T09:00:00Z", '
+            '"end_time": "2025-01-01T09:30:00Z", "tags": ["x", "x"]}\n'
+            "not json\n"
+        )
+        seshes = list(reader.read(io.StringIO(lines)))
+
+        assert len(seshes) == 1
+        assert seshes[0].tags == ["x"]
+        assert reader.errors[0][0] == 2
+
+    def test_jsonl_invalid_tags_skipped(self):
+        """Test that tags of the wrong type skip the record, not the import."""
+        reader = SeshReader("jsonl")
+        times = (
+            '"start_time": "2025-01-01T09:00:00Z", "end_time": "2025-01-01T10:00:00Z"'
+        )
+        lines = "".join(
+            f'{{"title": "t", {times}, "tags": {tags}}}\n'
+            for tags in ("5", '{"a": 1}', '"a,b"', "null")
+        )
+        seshes = list(reader.read(io.StringIO(lines)))
+
+        assert [sesh.tags for sesh in seshes] == [["a", "b"], []]
+        assert [number for number, _ in reader.errors] == [1, 2]
+
+    def test_timewarrior_export(self):
+        """Test that timewarrior intervals are mapped and open ones skipped."""
+        reader = SeshReader("timewarrior")
+        seshes = list(reader.read(io.StringIO(TIMEWARRIOR_EXPORT)))
+
+        assert len(seshes) == 1
+        assert seshes[0].tags == ["code-review"]
+        assert seshes[0].end_time == "2025-01-01T10:00:00Z"
+        assert reader.errors == [(3, "Open interval cannot be imported")]
+
+    def test_detect_format(self):
+        """Test format detection from file names."""
+        assert SeshReader.detect_format("history.CSV") == "csv"
+        assert SeshReader.detect_format("log.ndjson") == "jsonl"
+        assert SeshReader.detect_format("timew.json") == "timewarrior"
+        assert SeshReader.detect_format("notes.txt") is None
+
+
+class TestImportSeshes:
+    """Test cases for bulk inserting imported Seshes."""
+
+    def test_import_in_batches(self, store):
+        """Test that records are saved with their tags across batches."""
+        seshes = SeshReader("csv").read(io.StringIO(CSV_HISTORY))
+        batches = []
+        assert store.import_seshes(seshes, batch_size=1, on_batch=batches.append) == 2
+        assert batches == [1, 2]
+
+        rows = store.db_conn.execute(
+            "SELECT title, group_concat(tag_name) FROM sesh "
+            "JOIN sesh_tag USING (sesh_id) JOIN tag USING (tag_id) "
+            "GROUP BY sesh_id ORDER BY sesh_id"
+        ).fetchall()
+        assert rows == [("write docs", "docs,writing"), ("offset", "docs")]
+
+    def test_next_id_read_under_write_lock(self, store, monkeypatch):
+        """Test that ids are reserved before the first insert of a batch."""
+        seshes = list(SeshReader("csv").read(io.StringIO(CSV_HISTORY)))
+        # every tag cached, so the batch writes nothing before reading the id
+        store.import_seshes(seshes)
+
+        locked = []
+        next_sesh_id = store.next_sesh_id
+
+        def spy() -> int:
+            locked.append(store.db_conn.in_transaction)
+            return next_sesh_id()
+
+        monkeypatch.setattr(store, "next_sesh_id", spy)
+        store.import_seshes(seshes)
+        assert locked == [True]
+
+    def test_import_after_existing_seshes(self, store):
+        """Test that imported ids continue after existing Seshes."""
+        store.start_sesh("live", [])
+        store.end_sesh("", [])
+        store.import_seshes(SeshReader("csv").read(io.StringIO(CSV_HISTORY)))
+
+        ids = [
+            sesh_id
+            for (sesh_id,) in store.db_conn.execute(
+                "SELECT sesh_id FROM sesh ORDER BY 1"
+            )
+        ]
+        assert ids == [1, 2, 3]
@@ -0,0 +1,169 @@
+import sqlite3
+
+import pytest
+
+from sesh import migration
+from sesh.error import MigrationError
+from sesh.migration import apply_migrations, count_migrations, load_migrations
+
+
+@pytest.fixture
+def db_conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "store.db")
+    yield conn
+    conn.close()
+
+
+class TestApplyMigrations:
+    """Test cases for the versioned migration runner."""
+
+    def test_migrations_found_in_package(self):
+        """Test that migration scripts are loaded from the installed package."""
+        migrations = load_migrations()
+        assert len(migrations) == count_migrations() >= 1
+        assert [m.version for m in migrations] == sorted(m.version for m in migrations)
+
+    def test_fresh_database_applies_all(self, db_conn):
+        """Test that every migration is applied and recorded on a new database."""
+        assert apply_migrations(db_conn) == count_migrations()
+        rows = db_conn.execute(
+            "SELECT version, checksum FROM schema_version"
+        ).fetchall()
+        assert rows == [(m.version, m.checksum) for m in load_migrations()]
+        (user_version,) = db_conn.execute("PRAGMA user_version").fetchone()
+        assert user_version == count_migrations()
+
+    def test_up_to_date_database_runs_single_query(self, db_conn):
+        """Test that an up-to-date database is detected without running DDL."""
+        apply_migrations(db_conn)
+
+        statements = []
+        db_conn.set_trace_callback(statements.append)
+        assert apply_migrations(db_conn) == 0
+        assert statements == ["PRAGMA user_version"]
+
+    def test_builtin_tags_inserted_once(self, db_conn):
+        """Test that re-running migrations does not re-insert built-in tags."""
+        apply_migrations(db_conn)
+        apply_migrations(db_conn)
+        (count,) = db_conn.execute(
+            "SELECT count(*) FROM tag WHERE is_builtin = 1"
+        ).fetchone()
+        assert count == 2
+
+    def test_legacy_database_adopted(self, db_conn):
+        """Test that a store created before versioning is not migrated twice."""
+        db_conn.executescript(load_migrations()[0].sql)
+        apply_migrations(db_conn)
+        (version,) = db_conn.execute(
+            "SELECT version FROM schema_version ORDER BY version LIMIT 1"
+        ).fetchone()
+        assert version == load_migrations()[0].version
+
+    def test_checksum_mismatch_raises(self, db_conn):
+        """Test that an edited, already-applied migration is rejected."""
+        apply_migrations(db_conn)
+        db_conn.execute("UPDATE schema_version SET checksum = 'tampered'")
+        db_conn.execute("PRAGMA user_version = 0")
+        db_conn.commit()
+        with pytest.raises(MigrationError, match="Checksum mismatch"):
+            apply_migrations(db_conn)
+
+    def test_newer_database_raises(self, db_conn):
+        """Test that a database migrated by a newer Sesh is rejected."""
+        db_conn.execute(f"PRAGMA user_version = {count_migrations() + 1}")
+        with pytest.raises(MigrationError, match="newer"):
+            apply_migrations(db_conn)
+
+
+class TestIntegerTimes:
+    """Test cases for the migration of Sesh times to Unix seconds."""
+
+    @pytest.fixture
+    def text_db(self, db_conn, monkeypatch):
+        """A database migrated up to, not including, the integer times."""
+        files = migration._migration_files()
+        (integer_times,) = (f for f in files if "integer_times" in f.name)
+        monkeypatch.setattr(
+            migration,
+            "_migration_files",
+            lambda: [f for f in files if f.name < integer_times.name],
+        )
+        apply_migrations(db_conn)
+        monkeypatch.undo()
+
+        with db_conn:
+            db_conn.execute("INSERT INTO tag (tag_name) VALUES ('work')")
+            db_conn.executemany(
+                "INSERT INTO sesh (sesh_id, title, details, start_time, end_time) "
+                "VALUES (?, ?, 'notes', ?, ?)",
+                [
+                    (1, "overnight", "2025-01-01T23:00:00Z", "2025-01-02T01:30:00Z"),
+                    (2, "morning", "2025-01-02T09:00:00Z", "2025-01-02T09:45:00Z"),
+                    (3, "deleted", "2025-01-03T00:00:00Z", "2025-01-03T01:00:00Z"),
+                ],
+            )
+            db_conn.execute("DELETE FROM sesh WHERE sesh_id = 3")
+            db_conn.execute(
+                "INSERT INTO sesh_tag (sesh_id, tag_id) "
+                "SELECT 1, tag_id FROM tag WHERE tag_name = 'work'"
+            )
+            db_conn.execute(
+                "INSERT INTO active_sesh (id, title, start_time) "
+                "VALUES (1, 'running', '2025-01-03T08:00:00Z')"
+            )
+        return db_conn
+
+    def test_times_converted(self, text_db):
+        """Test that text times become integers and read back through sesh_iso."""
+        rollups = text_db.execute(
+            "SELECT * FROM sesh_day_rollup ORDER BY tag_id, day"
+        ).fetchall()
+        apply_migrations(text_db)
+
+        assert text_db.execute(
+            "SELECT sesh_id, start_time, end_time FROM sesh ORDER BY sesh_id"
+        ).fetchall() == [(1, 1735772400, 1735781400), (2, 1735808400, 1735811100)]
+        assert text_db.execute(
+            "SELECT start_time, end_time FROM sesh_iso WHERE sesh_id = 2"
+        ).fetchone() == ("2025-01-02T09:00:00Z", "2025-01-02T09:45:00Z")
+        assert text_db.execute("SELECT start_time FROM active_sesh").fetchone() == (
+            1735891200,
+        )
+        assert (
+            text_db.execute(
+                "SELECT * FROM sesh_day_rollup ORDER BY tag_id, day"
+            ).fetchall()
+            == rollups
+        )
+
+    def test_schema_rebuilt(self, text_db):
+        """Test that ids, tags, search and triggers survive the table rebuild."""
+        apply_migrations(text_db)
+        with text_db:
+            (sesh_id,) = text_db.execute(
+                "INSERT INTO sesh (title, details, start_time, end_time) "
+                "VALUES ('evening', '', 1735840800, 1735844400) RETURNING sesh_id"
+            ).fetchone()
+        # AUTOINCREMENT does not hand out the id of the deleted Sesh again
+        assert sesh_id == 4
+        assert text_db.execute(
+            "SELECT s.title FROM sesh_tag st JOIN sesh s USING (sesh_id)"
+        ).fetchall() == [("overnight",)]
+        assert text_db.execute(
+            "SELECT rowid FROM sesh_fts WHERE sesh_fts MATCH 'evening OR morning' "
+            "ORDER BY rowid"
+        ).fetchall() == [(2,), (4,)]
+        assert text_db.execute(
+            "SELECT sesh_count, seconds FROM sesh_day_rollup "
+            "WHERE tag_id = 0 AND day = '2025-01-02'"
+        ).fetchone() == (2, 5400 + 2700 + 3600)
+
+    def test_text_times_rejected(self, db_conn):
+        """Test that ISO-8601 text can no longer be stored as a time."""
+        apply_migrations(db_conn)
+        with pytest.raises(sqlite3.IntegrityError):
+            db_conn.execute(
+                "INSERT INTO sesh (title, details, start_time, end_time) "
+                "VALUES ('x', '', '2025-01-01T00:00:00Z', '2025-01-01T01:00:00Z')"
+            )
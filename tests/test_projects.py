@@ -0,0 +1,177 @@
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from sesh import projects
+from sesh.cli import main
+from sesh.error import DatabaseError, MigrationError
+from sesh.importer import ImportedSesh
+from sesh.paths import DATA_SQLITE
+from sesh.projects import ENV_ROOTS
+from sesh.store import Store
+
+WORK = [
+    ImportedSesh("plan", "", "2025-01-02T09:00:00Z", "2025-01-02T10:00:00Z", ["a"]),
+    ImportedSesh("code", "", "2025-01-03T09:00:00Z", "2025-01-03T12:00:00Z", ["b"]),
+]
+HOBBY = [
+    ImportedSesh(
+        "read", "", "2025-01-02T20:00:00Z", "2025-01-02T22:00:00Z", ["a", "c"]
+    ),
+]
+
+
+def make_store(root, seshes):
+    store = Store(root)
+    store.import_seshes(seshes)
+    store.close()
+    return root
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    make_store(home / "work" / ".sesh", WORK)
+    make_store(home / "code" / "hobby" / ".sesh", HOBBY)
+    # never searched
+    make_store(home / "node_modules" / "pkg" / ".sesh", WORK)
+    make_store(home / ".hidden" / ".sesh", WORK)
+
+    here = tmp_path / "here"
+    here.mkdir()
+    monkeypatch.chdir(here)
+    monkeypatch.setenv(ENV_ROOTS, str(home))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return home
+
+
+class TestDiscovery:
+    """Test cases for finding the stores of other projects."""
+
+    def test_walk_skips_hidden_and_vendored(self, home):
+        """Test that only stores outside hidden and vendored directories are found."""
+        assert sorted(projects.walk_stores(home)) == [
+            home / "code" / "hobby" / ".sesh",
+            home / "work" / ".sesh",
+        ]
+
+    def test_cache_reused_until_rescan(self, home, tmp_path):
+        """Test that discovery is cached and only walked again on rescan."""
+        cache = tmp_path / "stores.json"
+        found = projects.discover_stores([home], cache)
+        assert len(found) == 2
+
+        new = make_store(home / "new" / ".sesh", HOBBY)
+        assert projects.discover_stores([home], cache) == found
+        assert new in projects.discover_stores([home], cache, rescan=True)
+
+    def test_cache_drops_deleted_and_expires(self, home, tmp_path):
+        """Test that deleted stores are dropped and stale caches walked again."""
+        cache = tmp_path / "stores.json"
+        projects.discover_stores([home], cache)
+        os.remove(home / "work" / ".sesh" / DATA_SQLITE)
+        assert projects.discover_stores([home], cache) == [
+            home / "code" / "hobby" / ".sesh"
+        ]
+
+        cached = json.loads(cache.read_text())
+        cached["scanned_at"] -= projects.DISCOVERY_MAX_AGE
+        cache.write_text(json.dumps(cached))
+        new = make_store(home / "new" / ".sesh", HOBBY)
+        assert new in projects.discover_stores([home], cache)
+
+    def test_roots_from_env(self, tmp_path):
+        """Test that SESH_ROOTS is split like PATH and defaults to home."""
+        value = os.pathsep.join([str(tmp_path / "a"), "", str(tmp_path / "b")])
+        assert projects.configured_roots({ENV_ROOTS: value}) == [
+            tmp_path / "a",
+            tmp_path / "b",
+        ]
+        assert len(projects.configured_roots({})) == 1
+
+
+class TestReadOnly:
+    """Test cases for opening other projects' stores."""
+
+    def test_read_only_connection(self, home):
+        """Test that stores are readable but not writable."""
+        store = Store(home / "work" / ".sesh")
+        store.connect_read_only()
+        assert store.report("tag") == [("b", 1, 10800), ("a", 1, 3600)]
+        with pytest.raises(DatabaseError):
+            store.start_sesh("nope", [])
+            store.end_sesh("", [])
+        store.close()
+
+    def test_missing_or_outdated_store(self, tmp_path):
+        """Test that stores are never created or migrated."""
+        store = Store(tmp_path / ".sesh")
+        with pytest.raises(DatabaseError):
+            store.connect_read_only()
+        assert not (tmp_path / ".sesh" / DATA_SQLITE).exists()
+
+        store.connect()
+        store.db_conn.execute("PRAGMA user_version = 1")
+        store.close()
+        with pytest.raises(MigrationError):
+            store.connect_read_only()
+
+
+class TestAllProjects:
+    """Test cases for report --all and export --all."""
+
+    def test_merge_reports(self):
+        """Test that groups are added up and ordered like single reports."""
+        merged = projects.merge_reports(
+            "tag", [[("a", 1, 60), ("b", 1, 30)], [("b", 2, 50), ("c", 1, 80)]]
+        )
+        assert merged == [("b", 3, 80), ("c", 1, 80), ("a", 1, 60)]
+        merged = projects.merge_reports(
+            "day", [[("2025-01-02", 1, 60)], [("2025-01-01", 1, 5)]]
+        )
+        assert merged == [("2025-01-01", 1, 5), ("2025-01-02", 1, 60)]
+
+    def test_merge_seshes_is_lazy(self):
+        """Test that exports are merged without reading them ahead."""
+        pulled = []
+
+        def export(times):
+            for time in times:
+                pulled.append(time)
+                yield ("", "", "", time, "", "")
+
+        merged = projects.merge_seshes([export(["1", "4"]), export(["2", "3"])])
+        assert next(merged)[3] == "1"
+        assert pulled == ["1", "2"]
+        assert [row[3] for row in merged] == ["2", "3", "4"]
+
+    def test_report_all(self, home):
+        """Test that the report adds up every discovered store."""
+        result = CliRunner().invoke(main, ["report", "--all"])
+        assert result.exit_code == 0
+        assert "Read 2 of 2 Sesh stores" in result.stderr
+        rows = [line.split()[:2] for line in result.stdout.splitlines()[1:]]
+        assert rows == [["a", "2"], ["b", "1"], ["c", "1"]]
+
+    def test_report_all_skips_broken_store(self, home):
+        """Test that unreadable stores are reported and left out."""
+        broken = home / "broken" / ".sesh"
+        broken.mkdir(parents=True)
+        (broken / DATA_SQLITE).write_text("not a database")
+        result = CliRunner().invoke(
+            main, ["report", "--all", "--rescan", "--by", "day"]
+        )
+        assert result.exit_code == 0
+        assert f"Skipped {broken}" in result.stderr
+        assert "Read 2 of 3 Sesh stores" in result.stderr
+        assert "Total              3  6h 0m 0s" in result.stdout
+
+    def test_export_all_in_start_order(self, home):
+        """Test that exported Seshes of all stores are merged by start time."""
+        result = CliRunner().invoke(main, ["export", "--all"])
+        assert result.exit_code == 0
+        titles = [line.split(",")[1] for line in result.stdout.splitlines()[1:]]
+        assert titles == ["plan", "read", "code"]
+        assert "Exported 3 Seshes from 2 of 2 Sesh stores" in result.stderr
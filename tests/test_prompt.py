@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from sesh.current_binary import pack_current
+from sesh.error import SessionStorageError
+from sesh.prompt import format_compact_elapsed, prompt_line
+
+
+class TestPromptLine:
+    """Test cases for the shell prompt status line."""
+
+    def test_no_session_file(self, tmp_path):
+        """Test that no active Sesh renders an empty line."""
+        assert prompt_line(tmp_path / "current.json") == ""
+
+    def test_active_session(self, tmp_path):
+        """Test that the title and elapsed time are rendered."""
+        path = tmp_path / "current.json"
+        path.write_text(
+            json.dumps(
+                {"title": "fix bug", "tags": [], "start_time": "2025-01-01T00:00:00Z"}
+            )
+        )
+        assert prompt_line(path).startswith("fix bug (")
+
+    def test_long_title_truncated(self, tmp_path):
+        """Test that long titles are shortened to fit a prompt."""
+        path = tmp_path / "current.json"
+        path.write_text(
+            json.dumps(
+                {"title": "x" * 100, "tags": [], "start_time": "2025-01-01T00:00:00Z"}
+            )
+        )
+        assert prompt_line(path).startswith("x" * 29 + "…")
+
+    def test_binary_session(self, tmp_path):
+        """Test that the binary session encoding is read too."""
+        path = tmp_path / "current.json"
+        path.write_bytes(pack_current("fix bug", ["bug"], 1_735_689_600 * 10**9))
+        assert prompt_line(path).startswith("fix bug (")
+
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(SessionStorageError):
+            prompt_line(path)
+
+    def test_invalid_file_raises(self, tmp_path):
+        """Test that a corrupt session file raises SessionStorageError."""
+        path = tmp_path / "current.json"
+        path.write_text("{")
+        with pytest.raises(SessionStorageError):
+            prompt_line(path)
+
+    def test_format_compact_elapsed(self):
+        """Test compact elapsed time formatting."""
+        assert format_compact_elapsed(42) == "42s"
+        assert format_compact_elapsed(125) == "2m"
+        assert format_compact_elapsed(3 * 3600 + 5 * 60) == "3h05m"
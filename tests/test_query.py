@@ -0,0 +1,176 @@
+import click
+import pytest
+from click.testing import CliRunner
+from whenever import Instant
+
+from sesh.cli import main
+from sesh.error import InvalidArgumentError, InvalidTagError
+from sesh.importer import ImportedSesh
+from sesh.parser.basic import SeshQuery, parse_query
+from sesh.parser.tag import Tag
+from sesh.store import Store
+
+SESHES = [
+    ImportedSesh(
+        "fix login bug", "", "2025-01-01T09:00:00Z", "2025-01-01T10:00:00Z", ["web"]
+    ),
+    ImportedSesh(
+        "deploy api",
+        "to staging",
+        "2025-02-01T09:00:00Z",
+        "2025-02-01T09:30:00Z",
+        ["ops", "web"],
+    ),
+    ImportedSesh("plan", "", "2025-03-01T09:00:00Z", "2025-03-01T11:00:00Z", []),
+]
+
+
+def plan(store: Store, text: str) -> list[str]:
+    (sql, params) = Store.build_find_query(parse_query(text))
+    return [
+        row[3] for row in store.db_conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    ]
+
+
+class TestParseQuery:
+    """Test cases for parsing Sesh queries."""
+
+    def test_all_terms(self):
+        """Test that every kind of term is parsed."""
+        query = parse_query('+Web -ops since:2025-01-01 until:2025-01-31 uid:AB "a b"')
+        assert query == SeshQuery(
+            since=Instant.from_utc(2025, 1, 1),
+            until=Instant.from_utc(2025, 2, 1),
+            tags=(Tag("web"),),
+            excluded_tags=(Tag("ops"),),
+            uid="ab",
+            words=("a b",),
+        )
+
+    def test_cached_by_text(self):
+        """Test that parsing the same text twice returns the cached result."""
+        assert parse_query("+web deploy") is parse_query("+web deploy")
+
+    def test_empty_quoted_terms_skipped(self):
+        """Test that '' and "" terms are ignored instead of crashing."""
+        query = parse_query("+a '' b \"\"")
+        assert query == SeshQuery(tags=(Tag("a"),), words=("b",))
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", '""', "since:nope", "uid:xyz", "uid:", "since:2025 since:2026", '"a'],
+    )
+    def test_invalid(self, text):
+        """Test that malformed queries raise InvalidArgumentError."""
+        with pytest.raises(InvalidArgumentError):
+            parse_query(text)
+
+    def test_invalid_tag(self):
+        """Test that invalid tag names raise InvalidTagError."""
+        with pytest.raises(InvalidTagError):
+            parse_query("+bad_tag")
+
+
+class TestFindSeshes:
+    """Test cases for running queries."""
+
+    @pytest.mark.parametrize(
+        ("text", "titles"),
+        [
+            ("+web", ["fix login bug", "deploy api"]),
+            ("+web -ops", ["fix login bug"]),
+            ("since:2025-02-01", ["deploy api", "plan"]),
+            ("until:2025-02-01", ["fix login bug", "deploy api"]),
+            ("staging", ["deploy api"]),
+            ("log*", ["fix login bug"]),
+            ("-web", ["plan"]),
+        ],
+    )
+    def test_filters(self, store, text, titles):
+        """Test that each term restricts the matched Seshes."""
+        assert [row[1] for row in store.find_seshes(parse_query(text))] == titles
+
+    def test_uid_prefix(self, store):
+        """Test that uid: matches on the uid prefix."""
+        (uid, title, *_) = store.find_seshes(parse_query("plan"))[0]
+        rows = store.find_seshes(parse_query(f"uid:{uid[:8]}"))
+        assert [row[1] for row in rows] == [title]
+
+
+class TestQueryPlan:
+    """Test cases asserting that compiled queries use indexes."""
+
+    def test_time_range(self, store):
+        """Test that start time bounds search idx_sesh_time_range."""
+        assert any(
+            detail.startswith("SEARCH s USING INDEX idx_sesh_time_range (start_time>?")
+            for detail in plan(store, "since:2025-01-01 until:2025-02-01")
+        )
+
+    def test_uid(self, store):
+        """Test that uid prefixes search the UNIQUE sesh_uid index."""
+        assert any(
+            detail.startswith("SEARCH s USING INDEX sqlite_autoindex_sesh_1")
+            for detail in plan(store, "uid:abc")
+        )
+
+    @pytest.mark.parametrize("text", ["+web", "+web -ops", "deploy", "+web deploy"])
+    def test_tags_and_words(self, store, text):
+        """Test that tags and words look up Seshes by id without scanning."""
+        details = plan(store, text)
+        assert "SEARCH s USING INTEGER PRIMARY KEY (rowid=?)" in details
+        assert not any(detail.startswith("SCAN s ") for detail in details)
+        if "+" in text:
+            assert "SEARCH st USING INDEX idx_sesh_tag_tag_id (tag_id=?)" in details
+
+
+class TestEditSeshes:
+    """Test cases for changing the Seshes matched by a query."""
+
+    def test_title_and_tags(self, store):
+        """Test that titles and tags change only on matched Seshes."""
+        count = store.edit_seshes(
+            parse_query("+web"),
+            title="renamed",
+            add_tags=[Tag("review")],
+            remove_tags=[Tag("ops")],
+        )
+        assert count == 2
+
+        rows = store.find_seshes(parse_query("+review"))
+        assert [(row[1], sorted(row[5].split(","))) for row in rows] == [
+            ("renamed", ["review", "web"]),
+            ("renamed", ["review", "web"]),
+        ]
+        assert store.find_seshes(parse_query("renamed")) == rows
+        assert [row[1] for row in store.find_seshes(parse_query("-review"))] == ["plan"]
+
+    def test_edit_confirmed_seshes_only(self, store, monkeypatch):
+        """Test that sesh edit changes the listed Seshes, not later matches."""
+
+        def confirm(text, abort):
+            # saved while the user reads the list
+            store.import_seshes(
+                [
+                    ImportedSesh(
+                        "late",
+                        "",
+                        "2025-04-01T09:00:00Z",
+                        "2025-04-01T10:00:00Z",
+                        ["web"],
+                    )
+                ]
+            )
+            return True
+
+        monkeypatch.setattr(click, "confirm", confirm)
+        result = CliRunner().invoke(main, ["edit", "+web", "-t", "review"], obj=store)
+        assert result.exit_code == 0
+        assert "Edited 2 Seshes" in result.output
+
+        rows = store.find_seshes(parse_query("+web"))
+        assert [(row[1], "review" in row[5]) for row in rows] == [
+            ("fix login bug", True),
+            ("deploy api", True),
+            ("late", False),
+        ]
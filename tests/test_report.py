@@ -0,0 +1,112 @@
+from whenever import Instant
+
+from sesh.command.report import format_report
+from sesh.importer import ImportedSesh
+from sesh.parser.tag import Tag
+
+SESHES = [
+    ImportedSesh("plan", "", "2024-12-30T09:00:00Z", "2024-12-30T10:00:00Z", ["a"]),
+    ImportedSesh(
+        "code", "", "2025-01-02T09:00:00Z", "2025-01-02T12:00:00Z", ["a", "b"]
+    ),
+    ImportedSesh("test", "", "2025-02-03T09:00:00Z", "2025-02-03T09:30:00Z", []),
+    ImportedSesh(
+        "late", "", "2025-02-03T22:00:00Z", "2025-02-04T02:00:00Z", ["a", "b"]
+    ),
+]
+
+
+class TestReport:
+    """Test cases for aggregated reports."""
+
+    def test_by_tag(self, store):
+        """Test that tags are ordered by total duration."""
+        assert store.report("tag") == [("a", 3, 28800), ("b", 2, 25200)]
+
+    def test_by_day_splits_at_midnight(self, store):
+        """Test that time is split across UTC days and Seshes counted once."""
+        assert store.report("day") == [
+            ("2024-12-30", 1, 3600),
+            ("2025-01-02", 1, 10800),
+            ("2025-02-03", 2, 9000),
+            ("2025-02-04", 0, 7200),
+        ]
+
+    def test_by_iso_week(self, store):
+        """Test that weeks follow ISO numbering across the year boundary."""
+        assert store.report("week") == [
+            ("2025-W01", 2, 14400),
+            ("2025-W06", 2, 16200),
+        ]
+
+    def test_by_month_with_filters(self, store):
+        """Test that time range and tag filters restrict the report."""
+        assert store.report("month", since=Instant.from_utc(2025, 1, 1)) == [
+            ("2025-01", 1, 10800),
+            ("2025-02", 2, 16200),
+        ]
+        assert store.report("month", tags=[Tag("a")]) == [
+            ("2024-12", 1, 3600),
+            ("2025-01", 1, 10800),
+            ("2025-02", 1, 14400),
+        ]
+
+    def test_range_widened_to_days(self, store):
+        """Test that the time range covers whole UTC days."""
+        assert store.report(
+            "day",
+            since=Instant.from_utc(2025, 2, 3, 12),
+            until=Instant.from_utc(2025, 2, 3, 12),
+        ) == [("2025-02-03", 2, 9000)]
+
+    def test_several_tags_without_rollups(self, store):
+        """Test that reports needing several tags split Seshes on the fly."""
+        assert store.report("day", tags=[Tag("a"), Tag("b")]) == [
+            ("2025-01-02", 1, 10800),
+            ("2025-02-03", 1, 7200),
+            ("2025-02-04", 0, 7200),
+        ]
+        assert store.report("tag", tags=[Tag("b")]) == [
+            ("a", 2, 25200),
+            ("b", 2, 25200),
+        ]
+
+    def test_format_total_for_time_groups_only(self, store):
+        """Test that only time groups get a total row."""
+        assert format_report("month", store.report("month"))[-1].startswith("Total")
+        assert not format_report("tag", store.report("tag"))[-1].startswith("Total")
+
+
+def rollups(store):
+    return store.db_conn.execute(
+        "SELECT * FROM sesh_day_rollup ORDER BY tag_id, day"
+    ).fetchall()
+
+
+class TestRollups:
+    """Test cases for the trigger-maintained daily rollups."""
+
+    def test_matches_rebuild(self, store):
+        """Test that rollups kept by triggers equal freshly rebuilt ones."""
+        kept = rollups(store)
+        assert store.rebuild_rollups() == len(kept)
+        assert rollups(store) == kept
+
+    def test_edit_moves_time_and_tags_edited(self, store):
+        """Test that changing times moves the rollups and adds 'edited'."""
+        with store.db_conn:
+            store.db_conn.execute(
+                "UPDATE sesh SET end_time = unixepoch('2025-02-05T01:00:00Z') "
+                "WHERE title = 'late'"
+            )
+        kept = rollups(store)
+        store.rebuild_rollups()
+        assert rollups(store) == kept
+        assert ("edited", 1, 97200) in store.report("tag")
+
+    def test_delete_removes_rollups(self, store):
+        """Test that deleting Seshes removes their rollups and tags."""
+        with store.db_conn:
+            store.db_conn.execute("DELETE FROM sesh WHERE title != 'test'")
+        assert rollups(store) == [("2025-02-03", 0, 1, 1800)]
+        assert store.db_conn.execute("SELECT count(*) FROM sesh_tag").fetchone() == (0,)
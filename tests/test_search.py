@@ -0,0 +1,72 @@
+from whenever import Instant
+
+from sesh.importer import ImportedSesh
+from sesh.parser.tag import Tag
+
+SESHES = [
+    ImportedSesh(
+        "plan auth migration",
+        "list the tables to move",
+        "2025-01-01T09:00:00Z",
+        "2025-01-01T10:00:00Z",
+        ["backend"],
+    ),
+    ImportedSesh(
+        "review",
+        "the auth migrations look good",
+        "2025-02-01T09:00:00Z",
+        "2025-02-01T10:00:00Z",
+        [],
+    ),
+    ImportedSesh(
+        "write docs", "", "2025-03-01T09:00:00Z", "2025-03-01T10:00:00Z", ["docs"]
+    ),
+]
+
+
+def titles(results):
+    return [result[1] for result in results]
+
+
+class TestSearch:
+    """Test cases for full-text search over Seshes."""
+
+    def test_ranks_title_matches_first(self, store):
+        """Test that stems match and title matches rank above details."""
+        assert titles(store.search("migrations")) == ["plan auth migration", "review"]
+
+    def test_snippet_markers(self, store):
+        """Test that matched words are wrapped in the markers."""
+        (result,) = store.search("tables", markers=("<", ">"))
+        assert result[5] == "list the <tables> to move"
+
+    def test_filters(self, store):
+        """Test that tag and time filters combine with the text match."""
+        assert titles(store.search("auth", tags=[Tag("backend")])) == [
+            "plan auth migration"
+        ]
+        assert titles(store.search("auth", since=Instant.from_utc(2025, 1, 15))) == [
+            "review"
+        ]
+        assert titles(store.search("auth", limit=1)) == ["plan auth migration"]
+
+    def test_prefix_and_operators(self, store):
+        """Test that a trailing * matches prefixes and FTS5 syntax is inert."""
+        assert titles(store.search("doc*")) == ["write docs"]
+        assert store.search('auth OR "docs" NEAR(') == []
+        assert store.search("   ") == []
+
+    def test_index_follows_updates_and_deletes(self, store):
+        """Test that triggers keep the index in sync with the sesh table."""
+        with store.db_conn:
+            store.db_conn.execute(
+                "UPDATE sesh SET title = 'write guides' WHERE title = 'write docs'"
+            )
+            store.db_conn.execute("DELETE FROM sesh WHERE title = 'review'")
+            store.db_conn.execute(
+                "INSERT INTO sesh_fts (sesh_fts) VALUES ('integrity-check')"
+            )
+
+        assert store.search("docs") == []
+        assert titles(store.search("guides")) == ["write guides"]
+        assert titles(store.search("migration")) == ["plan auth migration"]
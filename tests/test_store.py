@@ -0,0 +1,405 @@
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from whenever import Instant
+
+from sesh.config import Config
+from sesh.current import CurrentManager, CurrentSesh
+from sesh.error import (
+    AmbiguousSeshError,
+    DatabaseError,
+    LockTimeoutError,
+    NoActiveSeshError,
+    SeshInProgressError,
+    SeshNotFoundError,
+    SessionStorageError,
+)
+from sesh.importer import ImportedSesh
+from sesh.lock import FileLock
+from sesh.parser.tag import Tag
+from sesh.prompt import prompt_line
+from sesh.store import Store
+
+
+@pytest.fixture
+def db_store(tmp_path):
+    store = Store(tmp_path / ".sesh", Config(fsync=False, current_storage="database"))
+    yield store
+    store.close()
+
+
+class TestLazyStore:
+    """Test cases for deferred database access in Store."""
+
+    def test_init_does_not_open_database(self, store):
+        """Test that constructing a Store leaves the database untouched."""
+        assert not store.db_path.exists()
+
+    def test_start_and_status_skip_database(self, store):
+        """Test that starting and reading the current Sesh skip SQLite."""
+        store.start_sesh("writing tests", [Tag("python")])
+        assert store.current_manager.read() is not None
+        assert not store.db_path.exists()
+
+    def test_db_conn_opens_and_migrates(self, store):
+        """Test that the first database access creates the schema."""
+        (count,) = store.db_conn.execute("SELECT count(*) FROM sesh").fetchone()
+        assert count == 0
+        assert store.db_path.exists()
+
+
+class TestSeshLifecycle:
+    """Test cases for starting and stopping a Sesh."""
+
+    def test_start_twice_raises(self, store):
+        """Test that a second start while a Sesh is active is rejected."""
+        store.start_sesh("first", [])
+        with pytest.raises(SeshInProgressError):
+            store.start_sesh("second", [])
+
+    def test_stop_without_active_raises(self, store):
+        """Test that stopping without an active Sesh is rejected."""
+        with pytest.raises(NoActiveSeshError):
+            store.end_sesh("", [])
+
+    def test_stop_saves_sesh_with_tags(self, store):
+        """Test that a stopped Sesh is saved with merged tags."""
+        store.start_sesh("fix bug", [Tag("bug")])
+        uid = store.end_sesh("done", [Tag("backend")])
+
+        (sesh_uid, title, details) = store.db_conn.execute(
+            "SELECT sesh_uid, title, details FROM sesh"
+        ).fetchone()
+        assert sesh_uid.startswith(uid)
+        assert (title, details) == ("fix bug", "done")
+
+        tags = {
+            name
+            for (name,) in store.db_conn.execute(
+                "SELECT tag_name FROM tag JOIN sesh_tag USING (tag_id)"
+            )
+        }
+        assert tags == {"bug", "backend"}
+        assert store.current_manager.read() is None
+
+    def test_stop_reuses_existing_tags(self, store):
+        """Test that tags shared between Seshes are stored once."""
+        for title in ("first", "second"):
+            store.start_sesh(title, [Tag("python")])
+            store.end_sesh("", [])
+
+        (count,) = store.db_conn.execute(
+            "SELECT count(*) FROM tag WHERE tag_name = 'python'"
+        ).fetchone()
+        (links,) = store.db_conn.execute("SELECT count(*) FROM sesh_tag").fetchone()
+        assert (count, links) == (1, 2)
+
+    def test_failed_stop_is_atomic(self, store):
+        """Test that a failed save keeps the current Sesh and writes nothing."""
+        store.start_sesh("x" * 101, [Tag("python")])  # violates title CHECK
+        with pytest.raises(DatabaseError):
+            store.end_sesh("", [Tag("backend")])
+
+        assert store.current_manager.read() is not None
+        (count,) = store.db_conn.execute(
+            "SELECT count(*) FROM tag WHERE is_builtin = 0"
+        ).fetchone()
+        assert count == 0
+
+
+@pytest.fixture
+def uid_store(store):
+    with store.db_conn:
+        store.db_conn.executemany(
+            "INSERT INTO sesh (sesh_uid, title, details, start_time, end_time) "
+            "VALUES (?, 'x', '', 1735722000, 1735725600)",
+            [("abc123" + "0" * 26,), ("abc456" + "0" * 26,), ("abd000" + "0" * 26,)],
+        )
+    return store
+
+
+class TestResolveUid:
+    """Test cases for resolving short Sesh ids."""
+
+    def test_unique_prefix(self, uid_store):
+        """Test that a unique prefix resolves case-insensitively."""
+        assert uid_store.resolve_uid("ABD") == "abd000" + "0" * 26
+        assert uid_store.resolve_uid("abc123") == "abc123" + "0" * 26
+        assert uid_store.get_sesh("abc4")[1] == "x"
+
+    def test_ambiguous_prefix(self, uid_store):
+        """Test that a prefix matching several Seshes lists the candidates."""
+        with pytest.raises(AmbiguousSeshError, match="abc123000, abc456000"):
+            uid_store.resolve_uid("abc")
+
+    def test_not_found(self, uid_store):
+        """Test that unknown and malformed ids are rejected."""
+        for prefix in ("abe", "xyz", ""):
+            with pytest.raises(SeshNotFoundError):
+                uid_store.resolve_uid(prefix)
+
+    def test_uses_uid_index(self, uid_store):
+        """Test that the lookup is a range search on the UNIQUE uid index."""
+        plan = uid_store.db_conn.execute(
+            "EXPLAIN QUERY PLAN SELECT sesh_uid FROM sesh "
+            "WHERE sesh_uid >= ? AND sesh_uid < ?",
+            ("abc", "abd"),
+        ).fetchall()
+        assert "sesh_uid>? AND sesh_uid<?" in plan[0][3]
+
+
+class TestTagCache:
+    """Test cases for the in-process tag-id cache."""
+
+    def stop(self, store, *tags):
+        store.start_sesh("work", [Tag(tag) for tag in tags])
+        store.end_sesh("", [])
+
+    def test_known_tags_skip_lookup(self, store):
+        """Test that tagging with cached tags issues no tag statements."""
+        self.stop(store, "python", "cli")
+        assert (store.tag_cache_hits, store.tag_cache_misses) == (0, 2)
+
+        statements = []
+        store.db_conn.set_trace_callback(statements.append)
+        self.stop(store, "python", "cli")
+        assert (store.tag_cache_hits, store.tag_cache_misses) == (2, 2)
+        assert not any("FROM tag" in s or "INTO tag " in s for s in statements)
+
+    def test_rollback_drops_cache(self, store):
+        """Test that ids of tags from a rolled back save are not reused."""
+        bad = ImportedSesh(
+            "x" * 101, "", "2025-01-01T09:00:00Z", "2025-01-01T10:00:00Z", ["python"]
+        )
+        with pytest.raises(DatabaseError):
+            store.import_seshes([bad])  # tags are saved before the title CHECK fails
+        assert store.tag_cache_misses == 1
+
+        # python must be inserted again rather than served from the cache
+        self.stop(store, "python")
+        assert store.tag_cache_misses == 2
+        (links,) = store.db_conn.execute(
+            "SELECT count(*) FROM sesh_tag JOIN tag USING (tag_id) "
+            "WHERE tag_name = 'python'"
+        ).fetchone()
+        assert links == 1
+
+    def test_reloads_after_other_connection_writes(self, store):
+        """Test that tag changes by another connection refresh the cache."""
+        self.stop(store, "python")
+        other = sqlite3.connect(store.db_path)
+        with other:
+            other.execute("UPDATE tag SET tag_id = 100 WHERE tag_name = 'python'")
+        other.close()
+
+        self.stop(store, "python")
+        assert store.tag_ids(["python"]) == {"python": 100}
+
+
+class TestConnectionProfile:
+    """Test cases for applying the connection profile."""
+
+    def test_tuned_profile(self, tmp_path):
+        """Test that the tuned profile PRAGMAs are set on the connection."""
+        store = Store(tmp_path / ".sesh", Config(db_profile="tuned"))
+        db_conn = store.db_conn
+        assert db_conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert db_conn.execute("PRAGMA cache_size").fetchone() == (-65_536,)
+        assert db_conn.execute("PRAGMA temp_store").fetchone() == (2,)
+        store.close()
+
+    def test_config_file_in_root(self, tmp_path):
+        """Test that a Store reads config.toml from its root."""
+        root = tmp_path / ".sesh"
+        root.mkdir()
+        (root / "config.toml").write_text("[database]\ncache_size = -1024\n")
+        store = Store(root)
+        assert store.db_conn.execute("PRAGMA cache_size").fetchone() == (-1024,)
+        store.close()
+
+
+def start_stop_worker(root, storage: str, attempts: int) -> tuple[int, int, int]:
+    """Start and stop a Sesh ``attempts`` times, counting starts and stops."""
+    store = Store(root, Config(fsync=False, current_storage=storage))
+    (started, stopped, errors) = (0, 0, 0)
+    for i in range(attempts):
+        try:
+            store.start_sesh(f"{os.getpid()} task {i}", [Tag("stress")])
+            started += 1
+        except SeshInProgressError:
+            pass
+        except Exception:
+            errors += 1
+        try:
+            store.end_sesh("", [])
+            stopped += 1
+        except NoActiveSeshError:
+            pass
+        except Exception:
+            errors += 1
+    store.close()
+    return (started, stopped, errors)
+
+
+class TestLocking:
+    """Test cases for serializing Store changes across processes."""
+
+    def test_lock_is_reentrant(self, tmp_path):
+        """Test that nested use of one lock does not deadlock."""
+        lock = FileLock(tmp_path / "store.lock")
+        with lock, lock:
+            assert lock.depth == 2
+        assert lock.fd is None
+
+    def test_lock_timeout(self, tmp_path):
+        """Test that waiting for a held lock gives up after the timeout."""
+        with FileLock(tmp_path / "store.lock"):
+            other = FileLock(tmp_path / "store.lock", timeout=0.05)
+            with pytest.raises(LockTimeoutError), other:
+                pass
+            assert other.contended > 1
+
+    @pytest.mark.parametrize("storage", ["file", "database"])
+    def test_concurrent_start_stop(self, tmp_path, storage):
+        """Test that every Sesh started by concurrent processes is saved once."""
+        root = tmp_path / ".sesh"
+        Store(root).db_conn.close()
+        with ProcessPoolExecutor(4) as pool:
+            results = list(
+                pool.map(start_stop_worker, [root] * 4, [storage] * 4, [25] * 4)
+            )
+
+        assert sum(errors for _, _, errors in results) == 0
+        store = Store(root)
+        (saved, titles) = store.db_conn.execute(
+            "SELECT count(*), count(DISTINCT title) FROM sesh"
+        ).fetchone()
+        store.close()
+        assert saved == titles == sum(started for started, _, _ in results)
+        assert saved == sum(stopped for _, stopped, _ in results)
+
+
+class TestDatabaseStorage:
+    """Test cases for keeping the active Sesh in the database."""
+
+    def test_start_status_stop(self, db_store):
+        """Test that a Sesh goes through active_sesh and no file is written."""
+        db_store.start_sesh("fix bug", [Tag("web")])
+        assert not db_store.current_path.exists()
+        assert db_store.current_manager.read().title == "fix bug"
+        assert db_store.db_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        with pytest.raises(SeshInProgressError):
+            db_store.start_sesh("other", [])
+
+        uid = db_store.end_sesh("done", [Tag("review")])
+        assert db_store.get_sesh(uid)[5] == "review,web"
+        assert db_store.current_manager.read() is None
+        with pytest.raises(NoActiveSeshError):
+            db_store.end_sesh("", [])
+
+    def test_failed_save_keeps_active_sesh(self, db_store):
+        """Test that the active row comes back when saving the Sesh fails."""
+        db_store.start_sesh("fix bug", [])
+        db_store.db_conn.execute("DROP TABLE sesh_tag")
+        with pytest.raises(DatabaseError):
+            db_store.end_sesh("", [Tag("web")])
+        assert db_store.current_manager.read().title == "fix bug"
+
+    def test_adopts_current_file(self, db_store):
+        """Test that a Sesh started in file storage moves into the database."""
+        sesh = CurrentSesh("from file", [Tag("a")], Instant.from_utc(2025, 1, 1, 9))
+        CurrentManager(db_store.current_path, db_store.config).write(sesh)
+
+        assert db_store.current_manager.read() == sesh
+        assert not db_store.current_path.exists()
+        db_store.end_sesh("", [])
+        assert db_store.current_manager.read() is None
+
+    def test_conflicting_sessions_raise(self, db_store):
+        """Test that a Sesh in both the file and the database is not merged."""
+        db_store.start_sesh("in database", [])
+        sesh = CurrentSesh("in file", [], Instant.from_utc(2025, 1, 1, 9))
+        CurrentManager(db_store.current_path, db_store.config).write(sesh)
+
+        store = Store(db_store.current_path.parent, db_store.config)
+        with pytest.raises(SessionStorageError):
+            store.current_manager.read()
+        store.close()
+
+    def test_prompt_reads_database(self, db_store):
+        """Test that the prompt line is served from active_sesh."""
+        assert prompt_line(db_store.current_path, db_store.db_path) == ""
+        db_store.start_sesh("fix bug", [])
+        assert prompt_line(db_store.current_path, db_store.db_path).startswith(
+            "fix bug ("
+        )
+
+
+class TestReset:
+    """Test cases for resetting and cleaning up the database."""
+
+    def test_reset_keeps_builtin_tags(self, store):
+        """Test that reset empties the store down to the built-in tags."""
+        store.start_sesh("fix bug", [Tag("backend")])
+        store.end_sesh("", [])
+        store.reset_data()
+
+        assert store.db_conn.execute("SELECT count(*) FROM sesh").fetchone() == (0,)
+        assert store.db_conn.execute(
+            "SELECT tag_name FROM tag ORDER BY tag_name"
+        ).fetchall() == [("edited",), ("manual",)]
+        assert store.report("tag") == []
+
+        # ids and tags are handed out again from scratch
+        store.start_sesh("again", [Tag("backend")])
+        store.end_sesh("", [])
+        assert store.db_conn.execute("SELECT sesh_id FROM sesh").fetchall() == [(1,)]
+
+    def test_reset_seen_by_other_connections(self, tmp_path):
+        """Test that reset replaces the contents of a WAL database in place."""
+        config = Config(fsync=False, db_profile="tuned")
+        store = Store(tmp_path / ".sesh", config)
+        store.import_seshes(
+            [
+                ImportedSesh(
+                    "old", "", "2025-01-01T09:00:00Z", "2025-01-01T10:00:00Z", []
+                )
+            ]
+        )
+        other = Store(tmp_path / ".sesh", config)
+        assert other.db_conn.execute("SELECT count(*) FROM sesh").fetchone() == (1,)
+
+        store.reset_data()
+        assert other.db_conn.execute("SELECT count(*) FROM sesh").fetchone() == (0,)
+        assert store.db_conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        other.close()
+        store.close()
+
+    def test_foreign_keys_enforced(self, store):
+        """Test that links to missing Seshes are rejected."""
+        with pytest.raises(sqlite3.IntegrityError), store.db_conn:
+            store.db_conn.execute(
+                "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (9, 1)"
+            )
+
+    def test_collect_garbage(self, store):
+        """Test that orphaned links and unused tags are deleted in bulk."""
+        store.start_sesh("fix bug", [Tag("kept")])
+        store.end_sesh("", [])
+        with store.db_conn:
+            store.upsert_tags(["unused"])
+        store.db_conn.execute("PRAGMA foreign_keys = OFF")
+        with store.db_conn:
+            store.db_conn.execute(
+                "INSERT INTO sesh_tag (sesh_id, tag_id) VALUES (9, 1), (1, 99)"
+            )
+        store.db_conn.execute("PRAGMA foreign_keys = ON")
+
+        assert store.collect_garbage() == (2, 1)
+        assert store.db_conn.execute(
+            "SELECT tag_name FROM tag ORDER BY tag_name"
+        ).fetchall() == [("edited",), ("kept",), ("manual",)]
+        assert store.collect_garbage() == (0, 0)
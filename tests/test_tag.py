@@ -1,9 +1,11 @@
+import pickle
+
 import click
 import pytest
 from click.testing import CliRunner
 
 from sesh.error import InvalidTagError
-from sesh.parser.tag import Tag, TagOption
+from sesh.parser.tag import Tag, TagOption, parse_tags_bulk
 
 
 class TestTag:
@@ -102,6 +104,40 @@ class TestTag:
         assert Tag.validate_tag_name("python_web") is False
         assert Tag.validate_tag_name("web dev") is False
 
+    def test_length_limit(self):
+        """Test that names longer than 20 characters are rejected."""
+        assert Tag.validate_tag_name("a" * 20) is True
+        assert Tag.validate_tag_name("a" * 21) is False
+        with pytest.raises(InvalidTagError):
+            Tag("a" * 21)
+
+    def test_trailing_newline_rejected(self):
+        """Test that a trailing newline does not pass validation."""
+        assert Tag.validate_tag_name("python\n") is False
+
+    def test_equality_and_hash_by_name(self):
+        """Test that tags compare and hash by name."""
+        assert Tag("python") == Tag("python", "Python")
+        assert Tag("python") != Tag("rust")
+        assert Tag("python") != "python"
+        assert len({Tag("python"), Tag("python", "Python"), Tag("rust")}) == 2
+
+    def test_interned(self):
+        """Test that tags with the default display name are shared."""
+        assert Tag("python") is Tag("python")
+        assert Tag("python", "Python") is not Tag("python")
+        assert pickle.loads(pickle.dumps(Tag("python"))) is Tag("python")
+        assert repr(pickle.loads(pickle.dumps(Tag("ml", "ML")))) == "ML"
+
+    def test_immutable_without_dict(self):
+        """Test that tags have no instance dict and cannot be changed."""
+        tag = Tag("python")
+        assert not hasattr(tag, "__dict__")
+        with pytest.raises(AttributeError):
+            tag.name = "rust"
+        with pytest.raises(AttributeError):
+            del tag.display_name
+
     def test_make_display_name(self):
         """Test make_display_name static method."""
         assert Tag.make_display_name("python") == "python"
@@ -109,6 +145,28 @@ class TestTag:
         assert Tag.make_display_name("machine-learning-ai") == "machine learning ai"
 
 
+class TestParseTagsBulk:
+    """Test cases for batch tag parsing."""
+
+    def test_normalizes_and_deduplicates(self):
+        """Test that names are normalized and unique across the batch."""
+        (tags, errors) = parse_tags_bulk(["Python, web-dev", "python,,API", " , "])
+        assert [str(tag) for tag in tags] == ["python", "web-dev", "api"]
+        assert errors == []
+
+    def test_collects_errors_per_item(self):
+        """Test that every invalid name is reported with its item index."""
+        (tags, errors) = parse_tags_bulk(["ok,bad_tag", "-x", "ok,bad_tag"])
+        assert tags == [Tag("ok")]
+        assert errors == [(0, "bad_tag"), (1, "-x"), (2, "bad_tag")]
+
+    def test_without_separator_or_normalization(self):
+        """Test that names can be taken exactly as given."""
+        (tags, errors) = parse_tags_bulk(["a,b", "Python", "ok"], None, False)
+        assert tags == [Tag("ok")]
+        assert errors == [(0, "a,b"), (1, "Python")]
+
+
 class TestTagOption:
     """Test cases for the TagOption class."""
 
@@ -168,6 +226,11 @@ class TestTagOption:
         assert result.exit_code != 0
         assert "Invalid tag (invalid-tag-)" in result.output
 
+    def test_duplicate_tags_merged(self):
+        """Test that repeated tags are returned once."""
+        result = self.tag_option.convert("python,Python,web-dev", None, None)
+        assert [tag.name for tag in result] == ["python", "web-dev"]
+
     def test_empty_tag_skipped(self):
         """Test that empty tags are skipped gracefully."""
         result = self.tag_option.convert("python,,web-dev", None, None)
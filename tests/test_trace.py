@@ -0,0 +1,86 @@
+import json
+import pstats
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+from sesh import trace
+from sesh.cli import main
+from sesh.paths import ENV_TRACE
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(ENV_TRACE, raising=False)
+    return tmp_path
+
+
+class TestProfileOption:
+    """Test cases for --profile and SESH_TRACE."""
+
+    def test_profile_prints_phases_and_sql(self, project):
+        """Test that --profile lists phases and statements on stderr."""
+        runner = CliRunner()
+        assert runner.invoke(main, ["start", "fix", "bug"]).exit_code == 0
+        result = runner.invoke(main, ["--profile", "stop"])
+        assert result.exit_code == 0
+        assert "Sesh stopped successfully" in result.stdout
+        for phase in ("startup", "open store", "migrate", "read current"):
+            assert phase in result.stderr
+        assert "INSERT INTO sesh " in result.stderr
+        assert trace.active is None
+
+    def test_env_enables_trace(self, project, monkeypatch):
+        """Test that SESH_TRACE=1 traces like --profile, and 0 does not."""
+        monkeypatch.setenv(ENV_TRACE, "1")
+        assert "SQL statements" in CliRunner().invoke(main, ["report"]).stderr
+        monkeypatch.setenv(ENV_TRACE, "0")
+        assert CliRunner().invoke(main, ["report"]).stderr == ""
+
+    def test_chrome_trace_file(self, project):
+        """Test that a .json output holds Chrome trace events with row counts."""
+        output = project / "trace.json"
+        result = CliRunner().invoke(main, ["--profile-output", str(output), "report"])
+        assert result.exit_code == 0
+        events = json.loads(output.read_text())["traceEvents"]
+        assert {event["ph"] for event in events} == {"X"}
+        assert min(event["ts"] for event in events) == 0
+        (report,) = (e for e in events if e["name"].startswith("SELECT t.tag_name"))
+        assert report["args"] == {"rows": 0}
+
+    def test_cprofile_dump(self, project):
+        """Test that a .prof output is a cProfile dump readable by pstats."""
+        output = project / "stats.prof"
+        result = CliRunner().invoke(main, ["--profile-output", str(output), "status"])
+        assert result.exit_code == 0
+        assert pstats.Stats(str(output)).total_calls > 0
+
+
+class TestTracedConnection:
+    """Test cases for statement timing on traced connections."""
+
+    def test_rows_counted_when_fetched(self):
+        """Test that rows fetched in any way and rows changed are counted."""
+        tracer = trace.start("-")
+        try:
+            db_conn = sqlite3.connect(":memory:", factory=trace.connection_factory())
+            db_conn.execute("CREATE TABLE t (x)")
+            db_conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(5)])
+            list(db_conn.execute("SELECT x FROM t"))
+            cur = db_conn.execute("SELECT x FROM t WHERE x < 3")
+            cur.fetchone()
+            cur.fetchall()
+            db_conn.close()
+        finally:
+            trace.active = None
+
+        rows = [event["args"]["rows"] for event in tracer.events]
+        assert rows == [0, 5, 5, 3]
+
+    def test_untraced_connection_is_plain(self):
+        """Test that connections are not wrapped while tracing is off."""
+        assert trace.active is None
+        assert trace.connection_factory() is sqlite3.Connection
+        assert trace.span("anything") is trace.NO_SPAN